@@ -0,0 +1,114 @@
+"""
+Versioned response cache for the public quest board.
+
+Serialized board pages are stored under keys that embed a generation number.
+Any write to Campaign or Application bumps the generation (see signals.py),
+which orphans every cached page at once instead of hunting down keys. Works
+with the local-memory cache and with shared backends (Redis/Memcached), since
+it only relies on add/incr/get/set.
+"""
+import hashlib
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+GENERATION_KEY = 'campaigns:board:generation'
+HITS_KEY = 'campaigns:board:hits'
+MISSES_KEY = 'campaigns:board:misses'
+
+
+def _cache():
+    return caches[getattr(settings, 'CAMPAIGN_BOARD_CACHE_ALIAS', 'default')]
+
+
+def _timeout():
+    return getattr(settings, 'CAMPAIGN_BOARD_CACHE_TIMEOUT', 300)
+
+
+def _incr(key):
+    cache = _cache()
+    # add() is a no-op when the key exists, so concurrent first hits don't reset it
+    cache.add(key, 0, timeout=None)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(key, 1, timeout=None)
+        return 1
+
+
+def get_generation():
+    cache = _cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(GENERATION_KEY, 1)
+    return generation
+
+
+def bump_generation():
+    return _incr(GENERATION_KEY)
+
+
+def invalidate():
+    """
+    Invalidate the board now and again once the surrounding transaction
+    commits, so readers can't re-cache pre-commit rows under the new generation.
+    """
+    bump_generation()
+    transaction.on_commit(bump_generation)
+
+
+def page_key(request):
+    params = sorted(request.query_params.lists())
+    digest = hashlib.sha1(repr(params).encode('utf-8')).hexdigest()
+    return f'campaigns:board:v{get_generation()}:{digest}'
+
+
+def facets_key(params):
+    """
+    Key for the facet counts of one filter signature; cursor and page size
+    don't change the counts, so all pages of a filtered board share it.
+    """
+    digest = hashlib.sha1(repr(sorted(params.items())).encode('utf-8')).hexdigest()
+    return f'campaigns:board:v{get_generation()}:facets:{digest}'
+
+
+def read_model_facets_key(filters, watermark):
+    """
+    Key for facet counts computed by the read model, which are exact for
+    its change counter watermark rather than for a cache generation.
+    """
+    digest = hashlib.sha1(repr(sorted(filters.items())).encode('utf-8')).hexdigest()
+    return f'campaigns:board:rm{watermark}:facets:{digest}'
+
+
+def get_facets(key):
+    return _cache().get(key)
+
+
+def set_facets(key, data):
+    _cache().set(key, data, timeout=_timeout())
+
+
+def get_page(key):
+    data = _cache().get(key)
+    _incr(HITS_KEY if data is not None else MISSES_KEY)
+    return data
+
+
+def set_page(key, data):
+    _cache().set(key, data, timeout=_timeout())
+
+
+def stats():
+    cache = _cache()
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'generation': get_generation(),
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else None,
+    }
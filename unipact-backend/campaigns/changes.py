@@ -0,0 +1,125 @@
+"""
+Delta sync for campaigns and applications.
+
+Campaign, Application and ChangeTombstone rows all take their change_seq
+from CampaignChangeCounter, whose row lock makes the values commit-ordered:
+once the counter reads V, every row with change_seq <= V is committed. A
+client keeps the `version` of its last response and asks only for what
+changed after it, so an unchanged board costs one near-empty response.
+
+Campaigns the user can no longer see (e.g. gone from the board) and deleted
+rows come back under `removed`, except on a first sync (since=0), which
+only lists what the user can see.
+"""
+from django.db.models import Q, Case, When, Value, BooleanField, Exists, OuterRef
+from users.models import User
+from .models import Campaign, Application, ChangeTombstone, CampaignChangeCounter
+
+
+class ResyncRequired(Exception):
+    """
+    The tombstones a client would need were pruned; it must start over.
+    """
+
+
+def visible_campaigns(user):
+    visible = Q(status=Campaign.Status.OPEN)
+    if user.role == User.Role.COMPANY:
+        visible |= Q(company__user=user)
+    elif user.role == User.Role.CLUB:
+        visible |= Q(Exists(Application.objects.filter(campaign=OuterRef('pk'), club__user=user)))
+    return visible
+
+
+def visible_applications(user):
+    if user.role == User.Role.COMPANY:
+        return Application.objects.filter(campaign__company__user=user)
+    if user.role == User.Role.CLUB:
+        return Application.objects.filter(club__user=user)
+    return Application.objects.none()
+
+
+def read_counter():
+    counter = CampaignChangeCounter.objects.filter(pk=1).values('value', 'tombstones_pruned_through').first()
+    return counter or {'value': 0, 'tombstones_pruned_through': 0}
+
+
+def changes_since(user, since, limit):
+    """
+    Rows changed in (since, version], oldest first, about `limit` at most.
+    Returns a dict with the new version, has_more, the changed campaign and
+    application instances and the removed ids. limit=0 only reports the
+    current version.
+    """
+    counter = read_counter()
+    if since and since < counter['tombstones_pruned_through']:
+        raise ResyncRequired()
+
+    # Read the version before the rows: anything committed later is left
+    # for the next call
+    version = counter['value']
+    result = {'version': version, 'has_more': False, 'campaigns': [], 'applications': [], 'removed_campaigns': [], 'removed_applications': []}
+    if limit == 0 or version <= since:
+        return result
+
+    window = Q(change_seq__gt=since, change_seq__lte=version)
+    visible = visible_campaigns(user)
+    # A client syncing from scratch holds nothing to remove, so it only gets
+    # visible campaigns and no tombstones. Later syncs also get campaigns
+    # that changed out of view; drafts of other companies were never visible
+    removable = visible | ~Q(status=Campaign.Status.DRAFT) if since else visible
+    sources = {
+        'campaigns': Campaign.objects.filter(window).filter(removable).annotate(
+            is_visible=Case(When(visible, then=Value(True)), default=Value(False), output_field=BooleanField())
+        ).select_related('company'),
+        'applications': visible_applications(user).filter(window).select_related('club', 'campaign').prefetch_related('deliverables'),
+        'tombstones': ChangeTombstone.objects.filter(window) if since else ChangeTombstone.objects.none(),
+    }
+    sources = {name: queryset.order_by('change_seq', 'id') for name, queryset in sources.items()}
+    batches = {name: list(queryset[:limit + 1]) for name, queryset in sources.items()}
+
+    # Stop before the first change_seq some source may not have returned in full
+    cutoff = version
+    seqs = sorted(row.change_seq for batch in batches.values() for row in batch)
+    if len(seqs) > limit:
+        cutoff = seqs[limit - 1]
+    truncated = [name for name, batch in batches.items() if len(batch) > limit]
+    for name in truncated:
+        cutoff = min(cutoff, batches[name][-1].change_seq - 1)
+    if cutoff <= since:
+        # A single change_seq covers more than `limit` rows (one bulk update);
+        # return all of them rather than stall
+        cutoff = seqs[0]
+        for name in truncated:
+            batches[name] = list(sources[name].filter(change_seq__lte=cutoff))
+
+    batches = {name: [row for row in batch if row.change_seq <= cutoff] for name, batch in batches.items()}
+
+    for campaign in batches['campaigns']:
+        if campaign.is_visible:
+            result['campaigns'].append(campaign)
+        else:
+            result['removed_campaigns'].append(campaign.pk)
+    result['applications'] = batches['applications']
+    for tombstone in batches['tombstones']:
+        key = 'removed_campaigns' if tombstone.kind == ChangeTombstone.Kind.CAMPAIGN else 'removed_applications'
+        result[key].append(tombstone.object_id)
+
+    result['version'] = cutoff
+    result['has_more'] = cutoff < version
+    return result
+
+
+def prune_tombstones(before):
+    """
+    Delete tombstones written before `before` and remember the newest
+    pruned change_seq, so clients older than it are told to resync.
+    Returns the number deleted.
+    """
+    old = ChangeTombstone.objects.filter(deleted_at__lt=before)
+    newest = old.order_by('-change_seq').values_list('change_seq', flat=True).first()
+    if newest is None:
+        return 0
+    deleted, _ = old.filter(change_seq__lte=newest).delete()
+    CampaignChangeCounter.objects.filter(pk=1, tombstones_pruned_through__lt=newest).update(tombstones_pruned_through=newest)
+    return deleted
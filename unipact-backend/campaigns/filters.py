@@ -0,0 +1,98 @@
+from django.db.models import Q, Case, When, Value, CharField, Count
+from django_filters import rest_framework as filters
+from users.models import CompanyProfile
+from .models import Campaign, Application
+
+# Budget buckets shown on the quest board as ranks: (rank, min budget, max budget)
+BUDGET_RANKS = [
+    ('S', 5000, None),
+    ('A', 1000, 5000),
+    ('B', None, 1000),
+]
+
+
+def budget_rank_expression():
+    return Case(
+        *[When(budget__gte=low, then=Value(rank)) for rank, low, _ in BUDGET_RANKS if low is not None],
+        default=Value(BUDGET_RANKS[-1][0]),
+        output_field=CharField()
+    )
+
+
+class CampaignFilter(filters.FilterSet):
+    type = filters.ChoiceFilter(choices=Campaign.Type.choices)
+    rank = filters.ChoiceFilter(choices=[(rank, rank) for rank, _, _ in BUDGET_RANKS], method='filter_rank')
+    budget_min = filters.NumberFilter(field_name='budget', lookup_expr='gte')
+    budget_max = filters.NumberFilter(field_name='budget', lookup_expr='lte')
+    deadline_after = filters.DateFilter(field_name='deadline', lookup_expr='gte')
+    deadline_before = filters.DateFilter(field_name='deadline', lookup_expr='lte')
+    verified = filters.BooleanFilter(method='filter_verified')
+
+    class Meta:
+        model = Campaign
+        fields = ['type', 'rank', 'budget_min', 'budget_max', 'deadline_after', 'deadline_before', 'verified']
+
+    def filter_rank(self, queryset, name, value):
+        for rank, low, high in BUDGET_RANKS:
+            if rank == value:
+                if low is not None:
+                    queryset = queryset.filter(budget__gte=low)
+                if high is not None:
+                    queryset = queryset.filter(budget__lt=high)
+        return queryset
+
+    def filter_verified(self, queryset, name, value):
+        verified = Q(company__verification_status=CompanyProfile.VerificationStatus.VERIFIED)
+        return queryset.filter(verified) if value else queryset.exclude(verified)
+
+
+class ApplicationFilter(filters.FilterSet):
+    # ?status=AWARDED&status=SUBMITTED
+    status = filters.MultipleChoiceFilter(choices=Application.Status.choices)
+
+    class Meta:
+        model = Application
+        fields = ['status']
+
+
+# Filters that are also facet dimensions; facet counts ignore their own selection
+FACET_FILTERS = ('type', 'rank')
+
+
+def facet_counts(queryset, type=None, rank=None):
+    """
+    Counts per Campaign.Type and per budget rank from a single
+    GROUP BY (type, rank) query.
+
+    `queryset` should carry every filter except type and rank. Each facet is
+    then narrowed by the other facet's selection only, so picking a type
+    still shows how many campaigns the other types would give.
+    """
+    rows = (
+        queryset.order_by()
+        .annotate(budget_rank=budget_rank_expression())
+        .values('type', 'budget_rank')
+        .annotate(n=Count('id'))
+    )
+
+    types = {value: 0 for value in Campaign.Type.values}
+    ranks = {r: 0 for r, _, _ in BUDGET_RANKS}
+    total = 0
+    for row in rows:
+        type_selected = type is None or row['type'] == type
+        rank_selected = rank is None or row['budget_rank'] == rank
+        if rank_selected:
+            types[row['type']] = types.get(row['type'], 0) + row['n']
+        if type_selected:
+            ranks[row['budget_rank']] += row['n']
+        if type_selected and rank_selected:
+            total += row['n']
+
+    return {
+        'type': types,
+        'rank': [
+            {'rank': r, 'budget_min': low, 'budget_max': high, 'count': ranks[r]}
+            for r, low, high in BUDGET_RANKS
+        ],
+        'total': total,
+    }
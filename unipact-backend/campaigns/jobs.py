@@ -0,0 +1,70 @@
+"""
+Background queue for campaign report generation.
+
+Jobs are tracked on the Report row itself (PENDING -> READY/FAILED), so the
+in-process thread pool is just an executor: anything it loses on restart is
+picked up again by `manage.py process_report_jobs`. Set REPORT_JOBS_EAGER to
+run jobs inline after commit (tests, single-process debugging).
+"""
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from .models import Report
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'REPORT_JOB_WORKERS', 2),
+            thread_name_prefix='report-job'
+        )
+    return _executor
+
+
+def enqueue_report(campaign):
+    """
+    Mark the campaign's report PENDING and schedule rendering once the
+    current transaction commits. Returns the Report (the job handle).
+    """
+    report, _ = Report.objects.get_or_create(campaign=campaign)
+    report.status = Report.Status.PENDING
+    report.error = ''
+    report.save(update_fields=['status', 'error', 'updated_at'])
+
+    transaction.on_commit(lambda: dispatch(report.id))
+    return report
+
+
+def dispatch(report_id):
+    if getattr(settings, 'REPORT_JOBS_EAGER', False):
+        run_report_job(report_id)
+    else:
+        _get_executor().submit(_run_in_worker, report_id)
+
+
+def _run_in_worker(report_id):
+    # Worker threads get their own DB connection; don't leak it between jobs
+    close_old_connections()
+    try:
+        run_report_job(report_id)
+    finally:
+        close_old_connections()
+
+
+def run_report_job(report_id):
+    from .utils import generate_campaign_report
+
+    try:
+        report = Report.objects.select_related('campaign__company').get(pk=report_id)
+    except Report.DoesNotExist:
+        return None
+
+    try:
+        return generate_campaign_report(report.campaign)
+    except Exception as e:
+        print(f"Report generation failed: {e}")
+        Report.objects.filter(pk=report_id).update(status=Report.Status.FAILED, error=str(e))
+        return None
@@ -0,0 +1,20 @@
+import time
+from django.core.management.base import BaseCommand
+from campaigns.utils import close_expired_campaigns
+
+
+class Command(BaseCommand):
+    help = 'Closes OPEN campaigns whose deadline has passed (run from cron, or with --interval as a loop)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Campaigns closed per UPDATE')
+        parser.add_argument('--interval', type=int, default=0, help='Keep running, sweeping every N seconds')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        while True:
+            closed = close_expired_campaigns(batch_size=batch_size)
+            self.stdout.write(self.style.SUCCESS(f"Closed {closed} expired campaigns."))
+            if options['interval'] <= 0:
+                break
+            time.sleep(options['interval'])
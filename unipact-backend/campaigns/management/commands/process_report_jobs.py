@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from campaigns.models import Report
+from campaigns.jobs import run_report_job
+
+
+class Command(BaseCommand):
+    help = 'Renders PENDING campaign reports (e.g. jobs lost when a worker restarted)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retry-failed', action='store_true', help='Also retry FAILED reports')
+
+    def handle(self, *args, **options):
+        statuses = [Report.Status.PENDING]
+        if options['retry_failed']:
+            statuses.append(Report.Status.FAILED)
+
+        ready = failed = 0
+        for report_id in Report.objects.filter(status__in=statuses).values_list('id', flat=True).iterator():
+            report = run_report_job(report_id)
+            if report is not None and report.status == Report.Status.READY:
+                ready += 1
+            else:
+                failed += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Reports rendered: {ready}, failed: {failed}."))
@@ -0,0 +1,16 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from campaigns.changes import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = 'Deletes delta sync tombstones older than the retention window (clients further behind must resync)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=getattr(settings, 'CHANGE_TOMBSTONE_RETENTION_DAYS', 30), help='Keep tombstones this many days')
+
+    def handle(self, *args, **options):
+        pruned = prune_tombstones(timezone.now() - timedelta(days=options['days']))
+        self.stdout.write(self.style.SUCCESS(f"Pruned {pruned} tombstones."))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from campaigns.models import Campaign
+from campaigns.utils import rebuild_campaign_counters
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the denormalized applicant count and awarded club columns on Campaign'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--campaign', type=int, action='append', help='Only rebuild the given campaign id (repeatable)')
+
+    def handle(self, *args, **options):
+        queryset = Campaign.objects.all()
+        if options['campaign']:
+            queryset = queryset.filter(pk__in=options['campaign'])
+
+        updated = rebuild_campaign_counters(queryset)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt counters for {updated} campaigns."))
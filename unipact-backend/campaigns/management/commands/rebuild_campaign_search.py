@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from campaigns.models import Campaign
+from campaigns import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the full-text search index over campaign title, description and requirements'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        if not search.is_supported():
+            self.stdout.write(self.style.WARNING("Full-text search is not supported on this database backend."))
+            return
+
+        count = search.rebuild_index(Campaign.objects.all(), batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} campaigns."))
@@ -0,0 +1,140 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.db.models import Prefetch
+from django.utils.dateparse import parse_date
+
+from campaigns.models import Campaign, Application, Deliverable, Report
+from campaigns.report_render import render_report_pdf
+from campaigns.utils import report_context, report_fingerprint, report_is_current, mark_report_ready, save_report_pdf
+
+
+class Command(BaseCommand):
+    help = 'Re-renders the report PDF of every completed campaign across a process pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Render processes (0 renders in this process)')
+        parser.add_argument('--batch-size', type=int, default=50, help='Campaigns rendered and written per batch')
+        parser.add_argument('--since', help='Only campaigns updated on or after this date (YYYY-MM-DD)')
+        parser.add_argument('--checkpoint', default=str(Path(settings.MEDIA_ROOT) / 'reports' / '.regenerate_checkpoint.json'))
+        parser.add_argument('--resume', action='store_true', help='Continue after the last campaign recorded in the checkpoint')
+        parser.add_argument('--force', action='store_true', help='Re-render even when the stored PDF matches its inputs')
+        parser.add_argument('--prune-orphans', action='store_true', help='Delete files in reports/ no Report points at')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        checkpoint = Path(options['checkpoint'])
+        self.force = options['force']
+        self.skipped = 0
+
+        queryset = Campaign.objects.filter(status=Campaign.Status.COMPLETED).select_related('company').prefetch_related(
+            Prefetch(
+                'applications',
+                queryset=Application.objects.filter(status__in=Application.WINNING_STATUSES).select_related('club').prefetch_related(
+                    Prefetch('deliverables', queryset=Deliverable.objects.order_by('uploaded_at'))
+                ).order_by('id'),
+                to_attr='winning_applications'
+            )
+        ).order_by('id')
+
+        if options['since']:
+            since = parse_date(options['since'])
+            if since is None:
+                raise CommandError("--since must be a date (YYYY-MM-DD).")
+            queryset = queryset.filter(updated_at__date__gte=since)
+
+        if options['resume'] and checkpoint.exists():
+            last_id = json.loads(checkpoint.read_text())['last_campaign_id']
+            queryset = queryset.filter(id__gt=last_id)
+            self.stdout.write(f"Resuming after campaign {last_id}")
+
+        executor = None
+        if options['workers'] > 0:
+            # Workers only render and never use the ORM, so any start method
+            # works; where the platform default forks, don't hand them open
+            # connections. A caller's open transaction is left alone
+            if not any(conn.in_atomic_block for conn in connections.all()):
+                connections.close_all()
+            executor = ProcessPoolExecutor(max_workers=options['workers'])
+
+        started = time.monotonic()
+        done = 0
+        batch = []
+        try:
+            for campaign in queryset.iterator(chunk_size=batch_size):
+                batch.append(campaign)
+                if len(batch) >= batch_size:
+                    done += self.process_batch(batch, executor, checkpoint)
+                    self.report_progress(done, started)
+                    batch = []
+            if batch:
+                done += self.process_batch(batch, executor, checkpoint)
+                self.report_progress(done, started)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        # A finished run leaves nothing to resume
+        checkpoint.unlink(missing_ok=True)
+        self.stdout.write(self.style.SUCCESS(f"Regenerated {done - self.skipped} reports ({self.skipped} unchanged, skipped)."))
+
+        if options['prune_orphans']:
+            self.prune_orphans()
+
+    def process_batch(self, campaigns, executor, checkpoint):
+        reports = {r.campaign_id: r for r in Report.objects.filter(campaign__in=campaigns)}
+
+        # Only render campaigns whose inputs changed since their PDF was made
+        stale = []
+        with transaction.atomic():
+            for campaign in campaigns:
+                context = report_context(campaign)
+                fingerprint = report_fingerprint(context)
+                report = reports.get(campaign.id)
+                if not self.force and report_is_current(report, fingerprint):
+                    mark_report_ready(report)
+                    self.skipped += 1
+                else:
+                    stale.append((campaign, context, fingerprint))
+
+        contexts = [context for _, context, _ in stale]
+        if executor is None:
+            pdfs = [render_report_pdf(context) for context in contexts]
+        else:
+            pdfs = list(executor.map(render_report_pdf, contexts))
+
+        with transaction.atomic():
+            for (campaign, _, fingerprint), pdf_content in zip(stale, pdfs):
+                save_report_pdf(campaign, pdf_content, report=reports.get(campaign.id), fingerprint=fingerprint)
+
+        # Only advance the checkpoint once the whole batch is on disk
+        checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint.write_text(json.dumps({'last_campaign_id': campaigns[-1].id}))
+        return len(campaigns)
+
+    def report_progress(self, done, started):
+        elapsed = time.monotonic() - started
+        rate = done / elapsed if elapsed else 0.0
+        self.stdout.write(f".. {done} reports ({rate:.1f}/s)")
+
+    def prune_orphans(self):
+        storage = Report._meta.get_field('generated_pdf').storage
+        referenced = set(Report.objects.exclude(generated_pdf='').values_list('generated_pdf', flat=True))
+        try:
+            _, files = storage.listdir('reports')
+        except FileNotFoundError:
+            return
+
+        pruned = 0
+        for name in files:
+            path = f"reports/{name}"
+            if name.endswith('.pdf') and path not in referenced:
+                storage.delete(path)
+                pruned += 1
+        self.stdout.write(f"Pruned {pruned} orphaned report files.")
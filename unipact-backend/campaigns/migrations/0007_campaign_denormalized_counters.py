@@ -0,0 +1,50 @@
+# Generated by Django 6.0 on 2026-10-18 15:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Campaign = apps.get_model('campaigns', 'Campaign')
+    Application = apps.get_model('campaigns', 'Application')
+
+    applicant_counts = Application.objects.filter(campaign=OuterRef('pk')).order_by().values('campaign').annotate(c=Count('id')).values('c')
+    winning_apps = Application.objects.filter(
+        campaign=OuterRef('pk'),
+        status__in=['AWARDED', 'SUBMITTED', 'COMPLETED']
+    ).order_by('id')
+
+    Campaign.objects.update(
+        applicants_count=Coalesce(Subquery(applicant_counts), 0),
+        awarded_club=Subquery(winning_apps.values('club')[:1]),
+        awarded_club_name=Subquery(winning_apps.values('club__club_name')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0006_alter_application_status'),
+        ('users', '0005_shadowuser_is_claimed_shadowuser_user'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='applicants_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='campaign',
+            name='awarded_club',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='won_campaigns', to='users.clubprofile'),
+        ),
+        migrations.AddField(
+            model_name='campaign',
+            name='awarded_club_name',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
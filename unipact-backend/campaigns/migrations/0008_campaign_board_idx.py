@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0007_campaign_denormalized_counters'),
+        ('users', '0005_shadowuser_is_claimed_shadowuser_user'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='campaign_board_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-18 15:45
+
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    from campaigns import search
+
+    search.create_index_table(schema_editor)
+
+    Campaign = apps.get_model('campaigns', 'Campaign')
+    for campaign in Campaign.objects.only('id', 'title', 'description', 'requirements').iterator():
+        search.index_campaign(campaign)
+
+
+def drop_search_index(apps, schema_editor):
+    from campaigns import search
+
+    search.drop_index_table(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0008_campaign_board_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 15:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0010_report_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='fingerprint',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
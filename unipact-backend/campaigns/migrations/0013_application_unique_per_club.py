@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-18 15:56
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+WINNING_STATUSES = ['AWARDED', 'SUBMITTED', 'COMPLETED']
+
+
+def remove_duplicate_applications(apps, schema_editor):
+    Campaign = apps.get_model('campaigns', 'Campaign')
+    Application = apps.get_model('campaigns', 'Application')
+
+    duplicates = (
+        Application.objects.values('campaign_id', 'club_id')
+        .annotate(n=Count('id')).filter(n__gt=1)
+    )
+    touched = set()
+    for row in duplicates:
+        apps_for_pair = list(
+            Application.objects.filter(campaign_id=row['campaign_id'], club_id=row['club_id']).order_by('id')
+        )
+        # Keep the winning application if there is one, else the earliest
+        keep = next((a for a in apps_for_pair if a.status in WINNING_STATUSES), apps_for_pair[0])
+        Application.objects.filter(pk__in=[a.pk for a in apps_for_pair if a.pk != keep.pk]).delete()
+        touched.add(row['campaign_id'])
+
+    if touched:
+        applicant_counts = Application.objects.filter(campaign=OuterRef('pk')).order_by().values('campaign').annotate(c=Count('id')).values('c')
+        Campaign.objects.filter(pk__in=touched).update(applicants_count=Coalesce(Subquery(applicant_counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0012_deliverable_chunked_uploads'),
+        ('users', '0005_shadowuser_is_claimed_shadowuser_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_applications, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='application',
+            constraint=models.UniqueConstraint(fields=('campaign', 'club'), name='unique_application_per_club'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-18 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0013_application_unique_per_club'),
+        ('users', '0005_shadowuser_is_claimed_shadowuser_user'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='campaign',
+            name='status',
+            field=models.CharField(choices=[('DRAFT', 'Draft'), ('OPEN', 'Open for Applications'), ('CLOSED', 'Closed for Applications'), ('IN_PROGRESS', 'In Progress'), ('COMPLETED', 'Completed'), ('ARCHIVED', 'Archived')], default='DRAFT', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['status', 'deadline'], name='campaign_deadline_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0014_campaign_closed_status_deadline_idx'),
+        ('users', '0005_shadowuser_is_claimed_shadowuser_user'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['status', 'type', 'created_at', 'id'], name='campaign_board_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['status', 'budget'], name='campaign_board_budget_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-18 16:35
+
+from django.db import migrations, models
+
+
+def create_counter(apps, schema_editor):
+    CampaignChangeCounter = apps.get_model('campaigns', 'CampaignChangeCounter')
+    CampaignChangeCounter.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0015_campaign_board_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignChangeCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='campaign',
+            name='change_seq',
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(create_counter, migrations.RunPython.noop),
+    ]
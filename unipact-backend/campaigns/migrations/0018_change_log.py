@@ -0,0 +1,51 @@
+# Generated by Django 6.0 on 2026-10-18 17:12
+
+from django.db import migrations, models
+from django.db.models import F, Max
+
+
+def number_existing_rows(apps, schema_editor):
+    # Give rows that never got a change_seq distinct values above the counter,
+    # so a sync from version 0 can page through them
+    CampaignChangeCounter = apps.get_model('campaigns', 'CampaignChangeCounter')
+    counter, _ = CampaignChangeCounter.objects.get_or_create(pk=1)
+    value = counter.value
+    for model_name in ('Campaign', 'Application'):
+        model = apps.get_model('campaigns', model_name)
+        unnumbered = model.objects.filter(change_seq=0)
+        top = unnumbered.aggregate(top=Max('id'))['top']
+        if top is not None:
+            unnumbered.update(change_seq=F('id') + value)
+            value += top
+    CampaignChangeCounter.objects.filter(pk=1).update(value=value)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0017_application_club_status_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('campaign', 'Campaign'), ('application', 'Application')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('change_seq', models.BigIntegerField(db_index=True)),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='change_seq',
+            field=models.BigIntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='campaignchangecounter',
+            name='tombstones_pruned_through',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(number_existing_rows, migrations.RunPython.noop),
+    ]
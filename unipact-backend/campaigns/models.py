@@ -1,4 +1,6 @@
-from django.db import models
+import uuid
+from django.db import models, transaction
+from django.db.models import F
 from users.models import CompanyProfile, ClubProfile
 
 class Campaign(models.Model):
@@ -9,10 +11,15 @@ class Campaign(models.Model):
     class Status(models.TextChoices):
         DRAFT = 'DRAFT', 'Draft'
         OPEN = 'OPEN', 'Open for Applications'
+        CLOSED = 'CLOSED', 'Closed for Applications'
         IN_PROGRESS = 'IN_PROGRESS', 'In Progress'
         COMPLETED = 'COMPLETED', 'Completed'
         ARCHIVED = 'ARCHIVED', 'Archived'
 
+    # Statuses in which the company can still pick a winner; CLOSED campaigns
+    # are past their deadline but keep their applicants
+    AWARDABLE_STATUSES = [Status.OPEN, Status.CLOSED]
+
     company = models.ForeignKey(CompanyProfile, on_delete=models.CASCADE, related_name='campaigns')
     title = models.CharField(max_length=255)
     description = models.TextField()
@@ -24,9 +31,88 @@ class Campaign(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Denormalized board columns (kept in sync by the apply/award/complete views,
+    # rebuilt with `manage.py rebuild_campaign_counters`)
+    applicants_count = models.PositiveIntegerField(default=0)
+    awarded_club = models.ForeignKey(ClubProfile, on_delete=models.SET_NULL, null=True, blank=True, related_name='won_campaigns')
+    awarded_club_name = models.CharField(max_length=255, null=True, blank=True)
+
+    # Bumped from CampaignChangeCounter on every write; drives the board read
+    # model (campaigns/read_model.py) and delta sync (campaigns/changes.py)
+    change_seq = models.BigIntegerField(default=0, db_index=True)
+
+    class Meta:
+        indexes = [
+            # Quest board keyset: WHERE status = ? ORDER BY created_at, id
+            models.Index(fields=['status', 'created_at', 'id'], name='campaign_board_idx'),
+            # Deadline sweep: WHERE status = 'OPEN' AND deadline < today
+            # (also serves the board's deadline window filter)
+            models.Index(fields=['status', 'deadline'], name='campaign_deadline_idx'),
+            # Board filters: ?type= keeps the keyset order, ?budget_min/max/rank= ranges
+            models.Index(fields=['status', 'type', 'created_at', 'id'], name='campaign_board_type_idx'),
+            models.Index(fields=['status', 'budget'], name='campaign_board_budget_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        save_with_change_seq(self, super().save, *args, **kwargs)
+
+    def set_awarded_club(self, club):
+        self.awarded_club = club
+        self.awarded_club_name = club.club_name if club else None
+
+class CampaignChangeCounter(models.Model):
+    """
+    Single-row counter handing out change_seq values for Campaign,
+    Application and ChangeTombstone rows.
+
+    Taking the next value locks the row until the writing transaction ends,
+    so sequence numbers become visible to readers in increasing order.
+    """
+    value = models.BigIntegerField(default=0)
+    # Tombstones up to here were pruned; older sync versions must start over
+    tombstones_pruned_through = models.BigIntegerField(default=0)
+
+def next_change_seq():
+    """
+    Take the next change_seq inside the transaction that writes the rows.
+    The counter row stays locked until that transaction ends, so take one
+    value per transaction, as its last write, and stamp every row with it.
+    """
+    if not CampaignChangeCounter.objects.filter(pk=1).update(value=F('value') + 1):
+        # Migration 0016 creates the row; only a flushed database lacks it.
+        # Concurrent first writers both insert-or-ignore, then both bump
+        CampaignChangeCounter.objects.bulk_create([CampaignChangeCounter(pk=1)], ignore_conflicts=True)
+        CampaignChangeCounter.objects.filter(pk=1).update(value=F('value') + 1)
+    return CampaignChangeCounter.objects.values_list('value', flat=True).get(pk=1)
+
+def save_with_change_seq(instance, save, *args, **kwargs):
+    with transaction.atomic(using=kwargs.get('using')):
+        instance.change_seq = next_change_seq()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'change_seq'}
+        save(*args, **kwargs)
+
+class ChangeTombstone(models.Model):
+    """
+    Left behind by a deleted Campaign or Application so delta sync clients
+    learn about the delete. Pruned with `manage.py prune_change_tombstones`.
+    """
+    class Kind(models.TextChoices):
+        CAMPAIGN = 'campaign', 'Campaign'
+        APPLICATION = 'application', 'Application'
+
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    object_id = models.BigIntegerField()
+    change_seq = models.BigIntegerField(db_index=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Deleted {self.kind} {self.object_id}"
+
 class Application(models.Model):
     class Status(models.TextChoices):
         PENDING = 'PENDING', 'Pending'
@@ -36,27 +122,84 @@ class Application(models.Model):
         REJECTED = 'REJECTED', 'Rejected'
         NOT_SELECTED = 'NOT_SELECTED', 'Not Selected'
 
+    # Statuses that mark the application as the campaign's winner
+    WINNING_STATUSES = [Status.AWARDED, Status.SUBMITTED, Status.COMPLETED]
+
     campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name='applications')
     club = models.ForeignKey(ClubProfile, on_delete=models.CASCADE, related_name='applications')
     message = models.TextField()
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
     submitted_at = models.DateTimeField(auto_now_add=True)
 
+    # Bumped from CampaignChangeCounter on every write (see campaigns/changes.py)
+    change_seq = models.BigIntegerField(default=0, db_index=True)
+
+    class Meta:
+        constraints = [
+            # One application per club per campaign, enforced by the database
+            models.UniqueConstraint(fields=['campaign', 'club'], name='unique_application_per_club'),
+        ]
+        indexes = [
+            # A club's history filtered by status (MyApplicationsView ?status=)
+            models.Index(fields=['club', 'status'], name='application_club_status_idx'),
+        ]
+
     def __str__(self):
         return f"{self.club.club_name} - {self.campaign.title}"
 
+    def save(self, *args, **kwargs):
+        save_with_change_seq(self, super().save, *args, **kwargs)
+
 class Deliverable(models.Model):
     application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='deliverables')
     file = models.FileField(upload_to='deliverables/')
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    # Content addressing: identical uploads share one stored file
+    sha256 = models.CharField(max_length=64, blank=True, db_index=True)
+    size = models.BigIntegerField(null=True, blank=True)
+    original_name = models.CharField(max_length=255, blank=True)
+
     def __str__(self):
         return f"Deliverable for {self.application}"
 
+class DeliverableUpload(models.Model):
+    """
+    A resumable, chunked deliverable upload in progress.
+
+    Chunks are appended to a temp file at `received_bytes`; finalize hashes
+    it, stores it content-addressed and creates the Deliverable.
+    """
+    class Status(models.TextChoices):
+        OPEN = 'OPEN', 'Open'
+        COMPLETED = 'COMPLETED', 'Completed'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='uploads')
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    received_bytes = models.BigIntegerField(default=0)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.OPEN)
+    deliverable = models.OneToOneField(Deliverable, on_delete=models.SET_NULL, null=True, blank=True, related_name='upload')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Upload {self.filename} ({self.received_bytes}/{self.size})"
+
 class Report(models.Model):
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        READY = 'READY', 'Ready'
+        FAILED = 'FAILED', 'Failed'
+
     campaign = models.OneToOneField(Campaign, on_delete=models.CASCADE, related_name='report')
-    generated_pdf = models.FileField(upload_to='reports/')
+    generated_pdf = models.FileField(upload_to='reports/', blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    error = models.TextField(blank=True)
+    fingerprint = models.CharField(max_length=64, blank=True) # sha256 of the rendered inputs
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Report for {self.campaign.title}"
@@ -0,0 +1,132 @@
+import json
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, _reverse_ordering
+
+
+class CampaignBoardPagination(CursorPagination):
+    """
+    Keyset pagination for the public quest board.
+
+    Pages are addressed by an opaque cursor over (created_at, id), so page N
+    costs the same as page 1: no OFFSET scan and no COUNT(*).
+    """
+    ordering = ('-created_at', '-id')
+    page_size = getattr(settings, 'CAMPAIGN_BOARD_PAGE_SIZE', 20)
+    page_size_query_param = 'page_size'
+    max_page_size = getattr(settings, 'CAMPAIGN_BOARD_MAX_PAGE_SIZE', 100)
+
+
+class MyApplicationsPagination(CursorPagination):
+    """
+    Cursor pagination for a club's own applications, newest first.
+    """
+    ordering = ('-submitted_at', '-id')
+    page_size = getattr(settings, 'CLUB_APPLICATIONS_PAGE_SIZE', 20)
+    page_size_query_param = 'page_size'
+    max_page_size = getattr(settings, 'CLUB_APPLICATIONS_MAX_PAGE_SIZE', 100)
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination whose position holds every ordering column.
+
+    DRF's cursor only records the first ordering column and steps over ties
+    with an offset (capped at offset_cutoff), which breaks down when that
+    column is low-cardinality. Here the ordering must end on a unique column,
+    so every position is unique and pages are plain keyset filters.
+    """
+
+    def _get_position_from_instance(self, instance, ordering):
+        return json.dumps([str(getattr(instance, field.lstrip('-'))) for field in ordering])
+
+    def _after_position(self, position, reverse):
+        # (a, b, c) > (x, y, z) as a lexicographic OR of prefixes
+        values = json.loads(position)
+        condition = Q()
+        for i, field in enumerate(self.ordering):
+            attr = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') != reverse else 'gt'
+            prefix = {self.ordering[j].lstrip('-'): values[j] for j in range(i)}
+            condition |= Q(**prefix, **{f'{attr}__{lookup}': values[i]})
+        return condition
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            try:
+                queryset = queryset.filter(self._after_position(current_position, reverse))
+            except (ValueError, TypeError, IndexError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        # Unique positions never need an offset; it is honoured for cursors
+        # minted by the stock paginator
+        results = list(queryset[offset:offset + self.page_size + 1])
+        self.page = results[:self.page_size]
+
+        if len(results) > len(self.page):
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = current_position is not None or offset > 0
+            self.has_previous = following_position is not None
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = following_position is not None
+            self.has_previous = current_position is not None or offset > 0
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+
+class ApplicantCursorPagination(KeysetCursorPagination):
+    """
+    Cursor pagination for a campaign's applicants.
+
+    `?sort=` picks one of SORTS; each ordering leads with an annotation or
+    column set up by CampaignApplicationsView.get_queryset and ends on the
+    unique id, so tied statuses and ranks page by keyset.
+    """
+    SORTS = {
+        'submitted_at': ('-submitted_at', '-id'),
+        'status': ('status_order', '-submitted_at', '-id'),
+        'club_rank': ('club_rank_order', '-submitted_at', '-id'),
+        'club_rating': ('-club_rating', '-submitted_at', '-id'),
+    }
+    DEFAULT_SORT = 'submitted_at'
+
+    ordering = SORTS[DEFAULT_SORT]
+    page_size = getattr(settings, 'CAMPAIGN_APPLICANTS_PAGE_SIZE', 20)
+    page_size_query_param = 'page_size'
+    max_page_size = getattr(settings, 'CAMPAIGN_APPLICANTS_MAX_PAGE_SIZE', 100)
+
+    def get_ordering(self, request, queryset, view):
+        return self.SORTS.get(request.query_params.get('sort'), self.SORTS[self.DEFAULT_SORT])
@@ -0,0 +1,389 @@
+"""
+In-process read model of OPEN campaigns for the public quest board.
+
+Each worker keeps the board's columns in parallel typed arrays sorted by
+(created_at, id), roughly 37 bytes per campaign, and answers the board's
+filter / order / cursor-paginate / facet work from them. Only the page's
+rows are then loaded through the ORM.
+
+Freshness is keyed on the database: the index remembers the
+CampaignChangeCounter value (its watermark) it is current up to, and pulls
+just the rows whose change_seq is past it. The counter's row lock makes
+change_seq values commit-ordered, so every row up to the counter's value is
+visible. Reading the counter is the only query a sync costs when nothing
+changed; it is skipped while the board cache generation is unchanged and
+the last check is under CAMPAIGN_READ_MODEL_RECHECK_SECONDS old. The
+generation only moves for writes this process (or a shared cache) saw, so
+writes in other workers show up within that interval. Deletes are read
+from the ChangeTombstone rows in the same change_seq window; if tombstones
+past the watermark were already pruned, the index reloads in full.
+
+Enabled with CAMPAIGN_READ_MODEL_ENABLED. Filters it can't evaluate
+(e.g. ?verified=) fall back to the ORM path.
+"""
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+from . import board_cache
+from .filters import BUDGET_RANKS
+from .models import Campaign, CampaignChangeCounter, ChangeTombstone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+TYPE_CODES = {value: code for code, value in enumerate(Campaign.Type.values)}
+TYPE_VALUES = Campaign.Type.values
+
+# CampaignFilter fields the read model evaluates itself
+SUPPORTED_FILTERS = {'type', 'rank', 'budget_min', 'budget_max', 'deadline_after', 'deadline_before'}
+
+COLUMNS = ('id', 'created_at', 'budget', 'deadline', 'type', 'company_id')
+
+
+def enabled():
+    return getattr(settings, 'CAMPAIGN_READ_MODEL_ENABLED', False)
+
+
+def to_micros(value):
+    return (value - EPOCH) // MICROSECOND
+
+
+def to_cents(value):
+    return int(Decimal(value) * 100)
+
+
+class CampaignBoardIndex:
+    def __init__(self, max_rows=None):
+        self.max_rows = max_rows or getattr(settings, 'CAMPAIGN_READ_MODEL_MAX_ROWS', 200000)
+        self.lock = threading.RLock()
+        self.generation = None
+        self.checked_at = None
+        self.watermark = None
+        self.full_loads = 0
+        self.incremental_loads = 0
+        self.overflowed = False
+        self._clear()
+
+    def _clear(self):
+        self.ids = array('q')
+        self.created = array('q')   # created_at, microseconds since the epoch
+        self.budget = array('q')    # cents
+        self.deadline = array('i')  # date ordinal, 0 = no deadline
+        self.type = array('b')      # index into Campaign.Type.values
+        self.company = array('q')
+
+    def __len__(self):
+        return len(self.ids)
+
+    # Loading
+
+    def sync(self):
+        """
+        Bring the arrays up to date with the change counter. Returns False
+        when the index is unusable (too many rows) and callers should use
+        the ORM.
+        """
+        generation = board_cache.get_generation()
+        now = time.monotonic()
+        recheck = getattr(settings, 'CAMPAIGN_READ_MODEL_RECHECK_SECONDS', 1.0)
+        with self.lock:
+            if self.watermark is None:
+                self._load_all()
+            elif generation != self.generation or now - self.checked_at >= recheck:
+                version, pruned_through = self._read_counter()
+                if pruned_through > self.watermark:
+                    # Deletes after the watermark may have lost their tombstones
+                    self._load_all()
+                elif version != self.watermark:
+                    self._load_changes(version)
+            self.generation = generation
+            self.checked_at = now
+            return not self.overflowed
+
+    @staticmethod
+    def _read_counter():
+        counter = CampaignChangeCounter.objects.filter(pk=1).values_list('value', 'tombstones_pruned_through').first()
+        return counter or (0, 0)
+
+    def _load_all(self):
+        self._clear()
+        self.full_loads += 1
+        # Read the watermark first; anything written after it is picked up next sync
+        self.watermark = self._read_counter()[0]
+        rows = Campaign.objects.filter(status=Campaign.Status.OPEN).order_by('created_at', 'id').values_list(*COLUMNS)
+        count = 0
+        for row in rows.iterator(chunk_size=2000):
+            count += 1
+            if count > self.max_rows:
+                self._clear()
+                self.overflowed = True
+                return
+            self._append(row)
+        self.overflowed = False
+
+    def _load_changes(self, version):
+        self.incremental_loads += 1
+        # Rows past `version` may sit between uncommitted ones; leave them for the next sync
+        changed = Campaign.objects.filter(change_seq__gt=self.watermark, change_seq__lte=version).order_by('change_seq').values_list('status', *COLUMNS)
+        for status, *row in changed:
+            self._remove(row[0], to_micros(row[1]))
+            if status == Campaign.Status.OPEN:
+                self._insert(row)
+        deleted = ChangeTombstone.objects.filter(
+            kind=ChangeTombstone.Kind.CAMPAIGN, change_seq__gt=self.watermark, change_seq__lte=version
+        ).values_list('object_id', flat=True)
+        for campaign_id in deleted:
+            self._remove_id(campaign_id)
+        self.watermark = version
+
+        if self.overflowed or len(self) > self.max_rows:
+            self._load_all()
+
+    def _append(self, row, position=None):
+        campaign_id, created_at, budget, deadline, type_, company_id = row
+        values = (
+            (self.ids, campaign_id),
+            (self.created, to_micros(created_at)),
+            (self.budget, to_cents(budget)),
+            (self.deadline, deadline.toordinal() if deadline else 0),
+            (self.type, TYPE_CODES.get(type_, -1)),
+            (self.company, company_id),
+        )
+        for column, value in values:
+            if position is None:
+                column.append(value)
+            else:
+                column.insert(position, value)
+
+    def _position(self, created, campaign_id):
+        # First position whose (created, id) is >= the given key
+        low, high = 0, len(self.ids)
+        while low < high:
+            mid = (low + high) // 2
+            if (self.created[mid], self.ids[mid]) < (created, campaign_id):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _insert(self, row):
+        self._append(row, self._position(to_micros(row[1]), row[0]))
+
+    def _remove(self, campaign_id, created):
+        i = self._position(created, campaign_id)
+        if i < len(self.ids) and self.ids[i] == campaign_id:
+            self._delete_at(i)
+
+    def _remove_id(self, campaign_id):
+        # Tombstones carry no created_at; a linear search is fine for deletes
+        try:
+            self._delete_at(self.ids.index(campaign_id))
+        except ValueError:
+            pass
+
+    def _delete_at(self, i):
+        for column in (self.ids, self.created, self.budget, self.deadline, self.type, self.company):
+            del column[i]
+
+    # Querying
+
+    def matcher(self, filters):
+        """
+        Build a position -> bool predicate for cleaned CampaignFilter data.
+        """
+        checks = []
+        if filters.get('type'):
+            code = TYPE_CODES[filters['type']]
+            checks.append(lambda i: self.type[i] == code)
+        if filters.get('rank'):
+            for rank, low, high in BUDGET_RANKS:
+                if rank == filters['rank']:
+                    if low is not None:
+                        checks.append(lambda i, low=low * 100: self.budget[i] >= low)
+                    if high is not None:
+                        checks.append(lambda i, high=high * 100: self.budget[i] < high)
+        if filters.get('budget_min') is not None:
+            low = int((Decimal(filters['budget_min']) * 100).to_integral_value(ROUND_CEILING))
+            checks.append(lambda i: self.budget[i] >= low)
+        if filters.get('budget_max') is not None:
+            high = int((Decimal(filters['budget_max']) * 100).to_integral_value(ROUND_FLOOR))
+            checks.append(lambda i: self.budget[i] <= high)
+        if filters.get('deadline_after'):
+            after = filters['deadline_after'].toordinal()
+            checks.append(lambda i: self.deadline[i] >= after)
+        if filters.get('deadline_before'):
+            before = filters['deadline_before'].toordinal()
+            checks.append(lambda i: 0 < self.deadline[i] <= before)
+        return lambda i: all(check(i) for check in checks)
+
+    def scan(self, match, descending=True, before=None, after=None):
+        """
+        Yield matching positions in board order (newest first), or oldest
+        first when descending is False. `before` / `after` bound created_at.
+        """
+        if descending:
+            start = len(self.ids) - 1 if before is None else self._position(before, -1) - 1
+            stop = -1 if after is None else self._position(after + 1, -1) - 1
+            positions = range(start, stop, -1)
+        else:
+            start = 0 if after is None else self._position(after + 1, -1)
+            stop = len(self.ids) if before is None else self._position(before, -1)
+            positions = range(start, stop)
+        for i in positions:
+            if match(i):
+                yield i
+
+    def facets(self, filters):
+        """
+        Same result as filters.facet_counts for the same filters, cached per
+        filter signature and watermark like the ORM path's counts.
+        """
+        with self.lock:
+            key = board_cache.read_model_facets_key(filters, self.watermark)
+            facets = board_cache.get_facets(key)
+            if facets is None:
+                facets = self._count_facets(filters)
+                board_cache.set_facets(key, facets)
+        return facets
+
+    def _count_facets(self, filters):
+        base = {name: value for name, value in filters.items() if name not in ('type', 'rank')}
+        match = self.matcher(base)
+        selected_type = TYPE_CODES.get(filters.get('type')) if filters.get('type') else None
+        selected_rank = filters.get('rank') or None
+
+        types = [0] * len(TYPE_VALUES)
+        ranks = {rank: 0 for rank, _, _ in BUDGET_RANKS}
+        total = 0
+        for i in self.scan(match):
+            rank = self._rank(self.budget[i])
+            type_code = self.type[i]
+            type_selected = selected_type is None or type_code == selected_type
+            rank_selected = selected_rank is None or rank == selected_rank
+            if rank_selected:
+                types[type_code] += 1
+            if type_selected:
+                ranks[rank] += 1
+            if type_selected and rank_selected:
+                total += 1
+
+        return {
+            'type': dict(zip(TYPE_VALUES, types)),
+            'rank': [
+                {'rank': rank, 'budget_min': low, 'budget_max': high, 'count': ranks[rank]}
+                for rank, low, high in BUDGET_RANKS
+            ],
+            'total': total,
+        }
+
+    @staticmethod
+    def _rank(cents):
+        for rank, low, _ in BUDGET_RANKS:
+            if low is None or cents >= low * 100:
+                return rank
+        return BUDGET_RANKS[-1][0]
+
+    def array_bytes(self):
+        """
+        Bytes held by the column arrays' elements. Ignores over-allocation
+        and the Python objects around them, so it is a lower bound on the
+        index's memory.
+        """
+        columns = (self.ids, self.created, self.budget, self.deadline, self.type, self.company)
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def stats(self):
+        with self.lock:
+            rows = len(self)
+            array_bytes = self.array_bytes()
+            return {
+                'enabled': enabled(),
+                'rows': rows,
+                'array_bytes': array_bytes,
+                'array_bytes_per_campaign': round(array_bytes / rows, 1) if rows else None,
+                'full_loads': self.full_loads,
+                'incremental_loads': self.incremental_loads,
+                'overflowed': self.overflowed,
+            }
+
+
+class BoardQuery:
+    """
+    The slice of the QuerySet API CampaignBoardPagination uses (order_by,
+    created_at__lt/__gt filters and slicing), answered from the index. Slicing
+    loads just that page's campaigns from `fetch_queryset`, so cursors and
+    links come out exactly as on the ORM path.
+    """
+    def __init__(self, index, filters, fetch_queryset, descending=True, before=None, after=None):
+        self.index = index
+        self.filters = filters
+        self.fetch_queryset = fetch_queryset
+        self.descending = descending
+        self.before = before
+        self.after = after
+
+    def _clone(self, **changes):
+        options = {
+            'descending': self.descending,
+            'before': self.before,
+            'after': self.after,
+        }
+        options.update(changes)
+        return BoardQuery(self.index, self.filters, self.fetch_queryset, **options)
+
+    def order_by(self, *ordering):
+        if ordering[0] not in ('-created_at', 'created_at'):
+            raise ValueError(f"Read model can't order by {ordering[0]}")
+        return self._clone(descending=ordering[0].startswith('-'))
+
+    def filter(self, **kwargs):
+        changes = {}
+        for lookup, value in kwargs.items():
+            micros = to_micros(parse_datetime(value) if isinstance(value, str) else value)
+            if lookup == 'created_at__lt':
+                changes['before'] = micros
+            elif lookup == 'created_at__gt':
+                changes['after'] = micros
+            else:
+                raise ValueError(f"Read model can't filter on {lookup}")
+        return self._clone(**changes)
+
+    def __getitem__(self, window):
+        start, stop = window.start or 0, window.stop
+        with self.index.lock:
+            match = self.index.matcher(self.filters)
+            ids = []
+            for n, i in enumerate(self.index.scan(match, self.descending, self.before, self.after)):
+                if n >= stop:
+                    break
+                if n >= start:
+                    ids.append(self.index.ids[i])
+        campaigns = self.fetch_queryset.in_bulk(ids)
+        return [campaigns[pk] for pk in ids if pk in campaigns]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = CampaignBoardIndex()
+        return _index
+
+
+def reset():
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def stats():
+    if _index is None:
+        return {'enabled': enabled(), 'rows': 0}
+    return _index.stats()
@@ -0,0 +1,136 @@
+"""
+Per-user push of campaign and application status changes.
+
+Views call publish() inside their transaction; once it commits, the hub fans
+the event out to every open event stream of the recipients (EventStreamView
+serves them as server-sent events). Events are small deltas, e.g.
+
+    {"id": 7, "type": "application.status", "campaign_id": 3, "application_id": 12, "status": "AWARDED"}
+
+so clients patch their state instead of re-fetching whole payloads.
+
+The default InProcessHub only reaches streams held by the same process. With
+several workers, point REALTIME_HUB at a broker-backed hub (Redis pub/sub,
+Postgres LISTEN/NOTIFY, ...) exposing the same subscribe / unsubscribe /
+publish / stats methods.
+"""
+import asyncio
+import itertools
+import json
+import threading
+from collections import defaultdict
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+# Sent instead of the missed events when a stream falls too far behind
+RESYNC = 'resync'
+
+
+class Subscription:
+    """
+    One open stream. Events are handed over from any thread onto the
+    stream's event loop.
+    """
+    def __init__(self, user_id, loop, max_queue):
+        self.user_id = user_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=max_queue)
+
+    def deliver(self, event):
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A client this slow has lost track anyway; tell it to re-fetch
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({'type': RESYNC})
+
+    async def get(self, timeout):
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class InProcessHub:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscriptions = defaultdict(set)
+        self.ids = itertools.count(1)
+        self.published = 0
+
+    def subscribe(self, user_id):
+        """
+        Must be called from the event loop that will read the stream.
+        """
+        subscription = Subscription(user_id, asyncio.get_running_loop(), getattr(settings, 'REALTIME_STREAM_MAX_QUEUE', 100))
+        with self.lock:
+            self.subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            streams = self.subscriptions.get(subscription.user_id)
+            if streams is not None:
+                streams.discard(subscription)
+                if not streams:
+                    del self.subscriptions[subscription.user_id]
+
+    def publish(self, user_ids, event):
+        with self.lock:
+            event = {'id': next(self.ids), **event}
+            targets = [s for user_id in set(user_ids) for s in self.subscriptions.get(user_id, ())]
+            self.published += 1
+        for subscription in targets:
+            subscription.deliver(event)
+
+    def stats(self):
+        with self.lock:
+            return {
+                'users': len(self.subscriptions),
+                'streams': sum(len(streams) for streams in self.subscriptions.values()),
+                'published': self.published,
+            }
+
+
+_hub = None
+_hub_lock = threading.Lock()
+
+
+def get_hub():
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = import_string(getattr(settings, 'REALTIME_HUB', 'campaigns.realtime.InProcessHub'))()
+        return _hub
+
+
+def reset():
+    global _hub
+    with _hub_lock:
+        _hub = None
+
+
+def publish(user_ids, event_type, **data):
+    """
+    Push an event to the given users once the current transaction commits
+    (immediately outside one), so rolled-back changes are never announced.
+    """
+    user_ids = [user_id for user_id in user_ids if user_id is not None]
+    if not user_ids:
+        return
+    event = {'type': event_type, **data}
+    transaction.on_commit(lambda: get_hub().publish(user_ids, event))
+
+
+def format_event(event):
+    """
+    Serialize an event as a server-sent event frame.
+    """
+    lines = []
+    if 'id' in event:
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(event, default=str)}")
+    return '\n'.join(lines) + '\n\n'
@@ -0,0 +1,47 @@
+"""
+Pure PDF rendering for campaign reports.
+
+Takes the plain dict built by campaigns.utils.report_context and returns PDF
+bytes. Deliberately free of ORM imports so it can run in worker processes
+(see the regenerate_reports command).
+"""
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import letter
+import io
+
+# Bump whenever the layout below changes so cached PDFs get re-rendered
+REPORT_LAYOUT_VERSION = 1
+
+
+def render_report_pdf(context):
+    buffer = io.BytesIO()
+    p = canvas.Canvas(buffer, pagesize=letter)
+    
+    # Title
+    p.setFont("Helvetica-Bold", 16)
+    p.drawString(100, 750, f"Campaign Report: {context['title']}")
+    
+    # Details
+    p.setFont("Helvetica", 12)
+    p.drawString(100, 730, f"Company: {context['company_name']}")
+    p.drawString(100, 710, f"Budget: {context['budget']}")
+    
+    # Awarded application
+    awarded_club = context['awarded_club']
+    if awarded_club:
+        p.drawString(100, 690, f"Awarded Club: {awarded_club['club_name']}")
+        p.drawString(100, 670, f"University: {awarded_club['university']}")
+        
+        # Deliverables
+        p.drawString(100, 640, "Deliverables:")
+        y = 620
+        for name in context['deliverables']:
+            p.drawString(120, y, f"- {name}")
+            y -= 20
+    
+    p.showPage()
+    p.save()
+    
+    pdf_content = buffer.getvalue()
+    buffer.close()
+    return pdf_content
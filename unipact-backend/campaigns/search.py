@@ -0,0 +1,170 @@
+"""
+Full-text search over Campaign title, description and requirements.
+
+SQLite uses an FTS5 virtual table, PostgreSQL a tsvector side table with a
+GIN index. Both are keyed by campaign id and kept in sync by the signals in
+campaigns/signals.py. Other backends fall back to icontains filtering.
+"""
+import re
+from django.db import connection, transaction
+
+SQLITE_TABLE = 'campaigns_campaign_fts'
+POSTGRES_TABLE = 'campaigns_campaign_search'
+
+SNIPPET_START = '<mark>'
+SNIPPET_END = '</mark>'
+
+# Fields that feed the index; saves that touch none of them skip reindexing
+INDEXED_FIELDS = {'title', 'description', 'requirements'}
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def is_supported(conn=None):
+    conn = conn or connection
+    return conn.vendor in ('sqlite', 'postgresql')
+
+
+def create_index_table(schema_editor):
+    conn = schema_editor.connection
+    if conn.vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} "
+            f"USING fts5(title, description, requirements, tokenize='porter unicode61')"
+        )
+    elif conn.vendor == 'postgresql':
+        schema_editor.execute(
+            f"CREATE TABLE IF NOT EXISTS {POSTGRES_TABLE} ("
+            f"campaign_id bigint PRIMARY KEY REFERENCES campaigns_campaign(id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, "
+            f"document tsvector NOT NULL)"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {POSTGRES_TABLE}_document_gin ON {POSTGRES_TABLE} USING GIN (document)"
+        )
+
+
+def drop_index_table(schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SQLITE_TABLE}")
+    elif schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f"DROP TABLE IF EXISTS {POSTGRES_TABLE}")
+
+
+def requirements_text(requirements):
+    if isinstance(requirements, (list, tuple)):
+        return ' '.join(str(r) for r in requirements)
+    return str(requirements or '')
+
+
+def _document(campaign):
+    return campaign.title or '', campaign.description or '', requirements_text(campaign.requirements)
+
+
+def index_campaign(campaign):
+    if not is_supported():
+        return
+    title, description, requirements = _document(campaign)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f"DELETE FROM {SQLITE_TABLE} WHERE rowid = %s", [campaign.pk])
+            cursor.execute(
+                f"INSERT INTO {SQLITE_TABLE} (rowid, title, description, requirements) VALUES (%s, %s, %s, %s)",
+                [campaign.pk, title, description, requirements]
+            )
+        else:
+            cursor.execute(
+                f"INSERT INTO {POSTGRES_TABLE} (campaign_id, document) VALUES (%s, "
+                f"setweight(to_tsvector('english', %s), 'A') || "
+                f"setweight(to_tsvector('english', %s), 'B') || "
+                f"setweight(to_tsvector('english', %s), 'C')) "
+                f"ON CONFLICT (campaign_id) DO UPDATE SET document = EXCLUDED.document",
+                [campaign.pk, title, requirements, description]
+            )
+
+
+def remove_campaign(campaign_id):
+    if not is_supported():
+        return
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f"DELETE FROM {SQLITE_TABLE} WHERE rowid = %s", [campaign_id])
+        else:
+            cursor.execute(f"DELETE FROM {POSTGRES_TABLE} WHERE campaign_id = %s", [campaign_id])
+
+
+def rebuild_index(queryset, batch_size=500):
+    """
+    Drop every index row and re-index the given campaigns. Returns the count.
+
+    Runs in one transaction, so searches keep seeing the old index until the
+    rebuild commits, and a failed rebuild leaves it untouched.
+    """
+    if not is_supported():
+        return 0
+    from . import board_cache
+
+    count = 0
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            table = SQLITE_TABLE if connection.vendor == 'sqlite' else POSTGRES_TABLE
+            cursor.execute(f"DELETE FROM {table}")
+
+        for campaign in queryset.only('id', 'title', 'description', 'requirements').iterator(chunk_size=batch_size):
+            index_campaign(campaign)
+            count += 1
+
+        # Cached ?q= pages were computed against the old index
+        transaction.on_commit(board_cache.invalidate)
+    return count
+
+
+def _fts5_query(q):
+    # Quote every token so user input can never be parsed as FTS5 syntax;
+    # tokens are ANDed and the last one is prefix-matched (search-as-you-type)
+    tokens = TOKEN_RE.findall(q)
+    if not tokens:
+        return None
+    terms = [f'"{t}"' for t in tokens]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def search(queryset, q, limit=50):
+    """
+    Rank campaigns in `queryset` matching `q`.
+
+    Returns a list of {'id', 'rank', 'snippet'} dicts, best match first.
+    """
+    ids_sql, ids_params = queryset.order_by().values('pk').query.sql_with_params()
+
+    if connection.vendor == 'sqlite':
+        match = _fts5_query(q)
+        if match is None:
+            return []
+        sql = (
+            f"SELECT rowid, -bm25({SQLITE_TABLE}, 10.0, 1.0, 4.0) AS rank, "
+            f"snippet({SQLITE_TABLE}, -1, %s, %s, '…', 16) "
+            f"FROM {SQLITE_TABLE} WHERE {SQLITE_TABLE} MATCH %s AND rowid IN ({ids_sql}) "
+            f"ORDER BY rank DESC LIMIT %s"
+        )
+        params = [SNIPPET_START, SNIPPET_END, match, *ids_params, limit]
+    elif connection.vendor == 'postgresql':
+        sql = (
+            f"SELECT s.campaign_id, ts_rank(s.document, query) AS rank, "
+            f"ts_headline('english', c.title || ' ' || c.description, query, %s) "
+            f"FROM {POSTGRES_TABLE} s "
+            f"JOIN campaigns_campaign c ON c.id = s.campaign_id, "
+            f"websearch_to_tsquery('english', %s) query "
+            f"WHERE s.document @@ query AND s.campaign_id IN ({ids_sql}) "
+            f"ORDER BY rank DESC LIMIT %s"
+        )
+        headline_opts = f"StartSel={SNIPPET_START}, StopSel={SNIPPET_END}, MaxWords=24, MinWords=8"
+        params = [headline_opts, q, *ids_params, limit]
+    else:
+        from django.db.models import Q
+        matches = queryset.filter(Q(title__icontains=q) | Q(description__icontains=q)).values_list('pk', flat=True)[:limit]
+        return [{'id': pk, 'rank': None, 'snippet': None} for pk in matches]
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [{'id': row[0], 'rank': row[1], 'snippet': row[2]} for row in cursor.fetchall()]
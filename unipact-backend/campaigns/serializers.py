@@ -1,54 +1,110 @@
 from rest_framework import serializers
-from .models import Campaign, Application, Deliverable
+from django.conf import settings
+from .models import Campaign, Application, Deliverable, DeliverableUpload, Report
 
 class CampaignSerializer(serializers.ModelSerializer):
     company_name = serializers.CharField(source='company.company_name', read_only=True)
-    guild = serializers.SerializerMethodField()
-    applicants = serializers.IntegerField(source='applications.count', read_only=True)
+    # Served from the denormalized columns on Campaign (no per-row queries)
+    guild = serializers.CharField(source='awarded_club_name', read_only=True)
+    applicants = serializers.IntegerField(source='applicants_count', read_only=True)
 
     class Meta:
         model = Campaign
-        fields = ['id', 'company', 'company_name', 'title', 'description', 'type', 'budget', 'requirements', 'deadline', 'status', 'created_at', 'guild', 'applicants']
-        read_only_fields = ['company', 'status', 'created_at']
+        fields = ['id', 'company', 'company_name', 'title', 'description', 'type', 'budget', 'requirements', 'deadline', 'status', 'created_at', 'guild', 'awarded_club', 'applicants']
+        read_only_fields = ['company', 'status', 'created_at', 'awarded_club']
 
-    def get_guild(self, obj):
-        # Find the application that is AWARDED, SUBMITTED, or COMPLETED
-        winning_app = obj.applications.filter(status__in=['AWARDED', 'SUBMITTED', 'COMPLETED']).first()
-        return winning_app.club.club_name if winning_app else None
+class DashboardCampaignSerializer(CampaignSerializer):
+    # Annotated by ClubDashboardView with an Exists() subquery
+    has_applied = serializers.BooleanField(read_only=True)
+
+    class Meta(CampaignSerializer.Meta):
+        fields = CampaignSerializer.Meta.fields + ['has_applied']
+
+class CompanyDashboardCampaignSerializer(CampaignSerializer):
+    """
+    A company's campaign with its funnel, read from the per-status counts,
+    deliverables_submitted and spend annotated by CompanyDashboardView.
+    """
+    funnel = serializers.SerializerMethodField()
+
+    class Meta(CampaignSerializer.Meta):
+        fields = CampaignSerializer.Meta.fields + ['funnel']
+
+    def get_funnel(self, obj):
+        by_status = {
+            value: getattr(obj, applicant_status_annotation(value), 0)
+            for value in Application.Status.values
+        }
+        return {
+            'applicants': sum(by_status.values()),
+            'by_status': by_status,
+            'deliverables_submitted': obj.deliverables_submitted,
+            'spend': f"{obj.spend:.2f}",
+        }
 
 class CampaignDetailSerializer(CampaignSerializer):
-    applications = serializers.SerializerMethodField()
+    """
+    The owner gets an applicant summary (counts per status, annotated by
+    CampaignDetailView); the applicants themselves are paged through
+    CampaignApplicationsView. Clubs get their own application, prefetched
+    into `my_applications`.
+    """
+    applicant_summary = serializers.SerializerMethodField()
     my_application = serializers.SerializerMethodField()
 
     class Meta(CampaignSerializer.Meta):
-        fields = CampaignSerializer.Meta.fields + ['applications', 'my_application']
+        fields = CampaignSerializer.Meta.fields + ['applicant_summary', 'my_application']
     
-    def get_applications(self, obj):
+    def get_applicant_summary(self, obj):
         # Only show applications to the owner (Company)
         request = self.context.get('request')
-        if request and request.user.role == 'COMPANY' and obj.company == request.user.company_profile:
-             return ApplicationSerializer(obj.applications.all(), many=True).data
+        if request and request.user.role == 'COMPANY' and obj.company_id == request.user.company_profile.id:
+             by_status = {
+                 value: getattr(obj, applicant_status_annotation(value), 0)
+                 for value in Application.Status.values
+             }
+             return {'total': sum(by_status.values()), 'by_status': by_status}
         return None
 
     def get_my_application(self, obj):
         request = self.context.get('request')
         if request and request.user.is_authenticated and request.user.role == 'CLUB':
-             try:
-                 app = obj.applications.get(club__user=request.user)
+             apps = getattr(obj, 'my_applications', None)
+             if apps is None:
+                 apps = obj.applications.filter(club__user=request.user)
+             for app in apps:
                  return {'id': app.id, 'status': app.status}
-             except Application.DoesNotExist:
-                 return None
         return None
 
+
+def applicant_status_annotation(status):
+    return f'applicants_{status.lower()}'
+
 class DeliverableSerializer(serializers.ModelSerializer):
     class Meta:
         model = Deliverable
-        fields = ['id', 'application', 'file', 'uploaded_at']
-        read_only_fields = ['application', 'uploaded_at']
+        fields = ['id', 'application', 'file', 'original_name', 'size', 'sha256', 'uploaded_at']
+        read_only_fields = ['application', 'original_name', 'size', 'sha256', 'uploaded_at']
+
+class DeliverableUploadSerializer(serializers.ModelSerializer):
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = DeliverableUpload
+        fields = ['id', 'application', 'filename', 'size', 'received_bytes', 'status', 'deliverable', 'chunk_size', 'created_at']
+        read_only_fields = ['application', 'received_bytes', 'status', 'deliverable', 'created_at']
+
+    def get_chunk_size(self, obj):
+        return settings.DELIVERABLE_UPLOAD_CHUNK_SIZE
+
+    def validate_size(self, value):
+        if value <= 0 or value > settings.DELIVERABLE_UPLOAD_MAX_BYTES:
+            raise serializers.ValidationError(f"File size must be between 1 and {settings.DELIVERABLE_UPLOAD_MAX_BYTES} bytes.")
+        return value
 
 class ApplicationSerializer(serializers.ModelSerializer):
     club_name = serializers.CharField(source='club.club_name', read_only=True)
-    club_user_id = serializers.IntegerField(source='club.user.id', read_only=True)
+    club_user_id = serializers.IntegerField(source='club.user_id', read_only=True)
     campaign_title = serializers.CharField(source='campaign.title', read_only=True)
     campaign_status = serializers.CharField(source='campaign.status', read_only=True)
     campaign_budget = serializers.DecimalField(source='campaign.budget', max_digits=10, decimal_places=2, read_only=True)
@@ -58,3 +114,44 @@ class ApplicationSerializer(serializers.ModelSerializer):
         model = Application
         fields = ['id', 'campaign', 'campaign_title', 'campaign_status', 'campaign_budget', 'club', 'club_name', 'club_user_id', 'message', 'status', 'submitted_at', 'deliverables']
         read_only_fields = ['campaign', 'club', 'status', 'submitted_at', 'deliverables']
+
+
+class OptionalDeliverablesMixin:
+    """
+    Drops `deliverables` unless the view prefetched them
+    (context['include_deliverables']).
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not self.context.get('include_deliverables'):
+            self.fields.pop('deliverables')
+
+
+class ApplicantSerializer(OptionalDeliverablesMixin, ApplicationSerializer):
+    """
+    Row in a campaign's applicant list.
+    """
+    club_rank = serializers.CharField(source='club.rank', read_only=True)
+    club_rating = serializers.FloatField(read_only=True)
+
+    class Meta(ApplicationSerializer.Meta):
+        fields = ApplicationSerializer.Meta.fields + ['club_rank', 'club_rating']
+
+
+class MyApplicationSerializer(OptionalDeliverablesMixin, ApplicationSerializer):
+    """
+    Row in a club's own application history.
+    """
+
+
+class ReportSerializer(serializers.ModelSerializer):
+    report_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Report
+        fields = ['id', 'campaign', 'status', 'report_url', 'error', 'created_at', 'updated_at']
+
+    def get_report_url(self, obj):
+        if obj.status == Report.Status.READY and obj.generated_pdf:
+            return obj.generated_pdf.url
+        return None
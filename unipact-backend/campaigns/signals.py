@@ -0,0 +1,53 @@
+from django.db.models.signals import post_save, post_delete
+from django.db import transaction
+from django.dispatch import receiver
+from users.models import ClubProfile
+from .models import Campaign, Application, ChangeTombstone, next_change_seq
+from . import search, board_cache
+
+
+@receiver(post_save, sender=Campaign)
+def sync_campaign_search_index(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    # Status-only saves (award, complete) don't change the indexed text
+    if update_fields is not None and not search.INDEXED_FIELDS.intersection(update_fields):
+        return
+    search.index_campaign(instance)
+
+
+@receiver(post_delete, sender=Campaign)
+def remove_campaign_from_search_index(sender, instance, **kwargs):
+    search.remove_campaign(instance.pk)
+
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_board_cache(sender, raw=False, **kwargs):
+    if raw:
+        return
+    board_cache.invalidate()
+
+
+@receiver(post_delete, sender=Campaign)
+@receiver(post_delete, sender=Application)
+def record_change_tombstone(sender, instance, **kwargs):
+    kind = ChangeTombstone.Kind.CAMPAIGN if sender is Campaign else ChangeTombstone.Kind.APPLICATION
+    # Same transaction as the delete, so the tombstone commits with it
+    with transaction.atomic():
+        ChangeTombstone.objects.create(kind=kind, object_id=instance.pk, change_seq=next_change_seq())
+
+
+@receiver(post_save, sender=ClubProfile)
+def refresh_awarded_club_name(sender, instance, update_fields=None, raw=False, **kwargs):
+    # Campaign.awarded_club_name is a copy taken at award time
+    if raw or (update_fields is not None and 'club_name' not in update_fields):
+        return
+    stale = Campaign.objects.filter(awarded_club=instance).exclude(awarded_club_name=instance.club_name)
+    with transaction.atomic():
+        if stale.exists():
+            stale.update(awarded_club_name=instance.club_name, change_seq=next_change_seq())
+            # update() bypasses model signals, so invalidate cached board pages here
+            board_cache.invalidate()
@@ -1,13 +1,40 @@
+import asyncio
+import functools
+import os
+import shutil
+import tempfile
+from unittest import skipIf
+from django.db import connection
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APITestCase, APITransactionTestCase
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.test import AsyncClient, override_settings
 from users.models import CompanyProfile, ClubProfile
-from payments.models import Transaction
-from .models import Campaign, Application, Report
+from payments.models import Transaction, Subscription
+from .models import Campaign, Application, Deliverable, Report, next_change_seq
 
 User = get_user_model()
 
+
+@functools.cache
+def password_hash():
+    # PBKDF2 takes ~0.4s per call; every fixture user shares the password 'pw'
+    return make_password('pw')
+
+
+def make_company(email, company_name, **fields):
+    user = User.objects.create(username=email, email=email, password=password_hash(), role=User.Role.COMPANY)
+    return CompanyProfile.objects.create(user=user, company_name=company_name, **fields)
+
+
+def make_club(email, club_name, **fields):
+    user = User.objects.create(username=email, email=email, password=password_hash(), role=User.Role.CLUB)
+    return ClubProfile.objects.create(user=user, club_name=club_name, **fields)
+
+
 class CampaignTests(APITestCase):
     def setUp(self):
         # Create Company
@@ -179,3 +206,1573 @@ class CampaignTests(APITestCase):
         campaign.refresh_from_db()
         self.assertEqual(campaign.status, Campaign.Status.COMPLETED)
         self.assertTrue(Report.objects.filter(campaign=campaign).exists())
+
+class CampaignCounterTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.company_profile = make_company(
+            'comp@corp.com', "Comp A",
+            verification_status=CompanyProfile.VerificationStatus.VERIFIED,
+            tier=CompanyProfile.Tier.PRO
+        )
+        self.company_user = self.company_profile.user
+        self.club_profile = make_club('club@uni.edu', "Club A", university="Uni A")
+        self.club_user = self.club_profile.user
+        self.campaign = Campaign.objects.create(
+            company=self.company_profile,
+            title="Counter Camp",
+            type=Campaign.Type.TALENT_BOUNTY,
+            budget=500,
+            status=Campaign.Status.OPEN
+        )
+
+    def test_counters_follow_apply_and_award(self):
+        self.client.force_authenticate(user=self.club_user)
+        response = self.client.post(reverse('application_create', kwargs={'campaign_id': self.campaign.id}), {'message': 'Pick us!'})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.applicants_count, 1)
+        self.assertIsNone(self.campaign.awarded_club_name)
+
+        self.client.force_authenticate(user=self.company_user)
+        response = self.client.post(reverse('award_application', kwargs={'application_id': response.data['id']}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.awarded_club, self.club_profile)
+        self.assertEqual(self.campaign.awarded_club_name, "Club A")
+
+    def test_awarded_club_name_follows_a_rename(self):
+        Application.objects.create(campaign=self.campaign, club=self.club_profile, message="Msg", status=Application.Status.AWARDED)
+        self.campaign.set_awarded_club(self.club_profile)
+        self.campaign.save()
+
+        self.club_profile.club_name = "Club Renamed"
+        self.club_profile.save()
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.awarded_club_name, "Club Renamed")
+
+        self.client.force_authenticate(user=self.company_user)
+        response = self.client.get(reverse('campaign_detail', kwargs={'pk': self.campaign.pk}))
+        self.assertEqual(response.data['guild'], "Club Renamed")
+
+    def test_board_list_is_single_query(self):
+        for i in range(5):
+            Campaign.objects.create(company=self.company_profile, title=f"Camp {i}", budget=100, status=Campaign.Status.OPEN)
+        Application.objects.create(campaign=self.campaign, club=self.club_profile, message="Msg")
+
+        self.client.force_authenticate(user=self.club_user)
+        # One query for the rows, plus one grouped query for the facet counts
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('campaign_list_create'), {'page_size': 4})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 4)
+
+        # Later pages reuse the cached facets
+        with self.assertNumQueries(1):
+            response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_rebuild_command(self):
+        Application.objects.create(campaign=self.campaign, club=self.club_profile, message="Msg", status=Application.Status.SUBMITTED)
+        Campaign.objects.filter(pk=self.campaign.pk).update(applicants_count=0, awarded_club=None, awarded_club_name=None)
+
+        from django.core.management import call_command
+        from io import StringIO
+        call_command('rebuild_campaign_counters', stdout=StringIO())
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.applicants_count, 1)
+        self.assertEqual(self.campaign.awarded_club_id, self.club_profile.id)
+        self.assertEqual(self.campaign.awarded_club_name, "Club A")
+
+
+class CampaignBoardPaginationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.company_profile = make_company('comp@corp.com', "Comp A")
+        self.club_user = make_club('club@uni.edu', "Club A", university="Uni A").user
+        for i in range(7):
+            Campaign.objects.create(company=self.company_profile, title=f"Camp {i}", budget=100, status=Campaign.Status.OPEN)
+        Campaign.objects.create(company=self.company_profile, title="Closed", budget=100, status=Campaign.Status.COMPLETED)
+
+    def test_walk_pages_with_cursor(self):
+        self.client.force_authenticate(user=self.club_user)
+        url = reverse('campaign_list_create') + '?page_size=3'
+        seen = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            seen.extend(c['id'] for c in response.data['results'])
+            url = response.data['next']
+
+        expected = list(Campaign.objects.filter(status=Campaign.Status.OPEN).order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_prev_cursor_returns_previous_page(self):
+        self.client.force_authenticate(user=self.club_user)
+        first = self.client.get(reverse('campaign_list_create') + '?page_size=3')
+        second = self.client.get(first.data['next'])
+        self.assertIsNotNone(second.data['previous'])
+
+        back = self.client.get(second.data['previous'])
+        self.assertEqual([c['id'] for c in back.data['results']], [c['id'] for c in first.data['results']])
+
+    def test_page_size_is_capped(self):
+        from unittest import mock
+        from campaigns.pagination import CampaignBoardPagination
+        self.client.force_authenticate(user=self.club_user)
+        with mock.patch.object(CampaignBoardPagination, 'max_page_size', 2):
+            response = self.client.get(reverse('campaign_list_create') + '?page_size=500')
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_my_campaigns_mode_is_unpaginated(self):
+        self.client.force_authenticate(user=self.company_profile.user)
+        response = self.client.get(reverse('campaign_list_create') + '?mode=my_campaigns')
+        self.assertEqual(len(response.data), 8)
+
+
+class CampaignSearchTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.company_profile = make_company('comp@corp.com', "Comp A")
+        self.club_user = make_club('club@uni.edu', "Club A", university="Uni A").user
+
+        self.hackathon = Campaign.objects.create(
+            company=self.company_profile, title="Campus Hackathon", description="Build a robotics prototype over the weekend.",
+            budget=100, status=Campaign.Status.OPEN
+        )
+        self.survey = Campaign.objects.create(
+            company=self.company_profile, title="Student Survey", description="Answer questions about hackathon culture.",
+            budget=100, status=Campaign.Status.OPEN, requirements=["Share on Instagram"]
+        )
+        self.closed = Campaign.objects.create(
+            company=self.company_profile, title="Old Hackathon", description="Done.",
+            budget=100, status=Campaign.Status.COMPLETED
+        )
+
+    def search(self, q):
+        self.client.force_authenticate(user=self.club_user)
+        response = self.client.get(reverse('campaign_list_create'), {'q': q})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['results']
+
+    def test_ranked_results_with_snippets(self):
+        results = self.search('hackathon')
+        # Title matches outrank description matches; closed campaigns stay off the board
+        self.assertEqual([r['id'] for r in results], [self.hackathon.id, self.survey.id])
+        self.assertIn('<mark>', results[0]['search_snippet'])
+
+    def test_requirements_and_prefix_match(self):
+        self.assertEqual([r['id'] for r in self.search('instag')], [self.survey.id])
+
+    def test_index_follows_save_and_delete(self):
+        self.hackathon.title = "Design Sprint"
+        self.hackathon.description = "Figma mockups."
+        self.hackathon.save()
+        self.assertEqual([r['id'] for r in self.search('figma')], [self.hackathon.id])
+        self.assertEqual([r['id'] for r in self.search('robotics')], [])
+
+        self.hackathon.delete()
+        self.assertEqual(self.search('figma'), [])
+
+    def test_query_syntax_is_escaped(self):
+        self.assertEqual(self.search('"hack* OR ('), [])
+        self.assertEqual(self.search('***'), [])
+
+    def test_rebuild_command(self):
+        from django.db import connection
+        from django.core.management import call_command
+        from io import StringIO
+        from campaigns import search
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search.SQLITE_TABLE}")
+        self.assertEqual(self.search('hackathon'), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('rebuild_campaign_search', stdout=StringIO())
+        self.assertEqual(len(self.search('hackathon')), 2)
+
+    def test_failed_rebuild_keeps_the_old_index(self):
+        from unittest import mock
+        from campaigns import search
+
+        with mock.patch.object(search, 'index_campaign', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                search.rebuild_index(Campaign.objects.all())
+        self.assertEqual(len(self.search('hackathon')), 2)
+
+
+class CampaignBoardCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.company_profile = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.company_user = self.company_profile.user
+        self.club_profile = make_club('club@uni.edu', "Club A", university="Uni A")
+        self.club_user = self.club_profile.user
+        self.campaign = Campaign.objects.create(company=self.company_profile, title="Cached Camp", budget=100, status=Campaign.Status.OPEN)
+        self.url = reverse('campaign_list_create')
+
+    def test_hit_skips_database(self):
+        from campaigns import board_cache
+        self.client.force_authenticate(user=self.club_user)
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(first.data, second.data)
+
+        stats = board_cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_award_invalidates_board(self):
+        app = Application.objects.create(campaign=self.campaign, club=self.club_profile, message="Msg")
+        self.client.force_authenticate(user=self.club_user)
+        ids = [c['id'] for c in self.client.get(self.url).data['results']]
+        self.assertIn(self.campaign.id, ids)
+
+        self.client.force_authenticate(user=self.company_user)
+        self.client.post(reverse('award_application', kwargs={'application_id': app.id}))
+
+        self.client.force_authenticate(user=self.club_user)
+        ids = [c['id'] for c in self.client.get(self.url).data['results']]
+        self.assertNotIn(self.campaign.id, ids)
+
+    def test_apply_refreshes_applicant_count(self):
+        self.client.force_authenticate(user=self.club_user)
+        self.assertEqual(self.client.get(self.url).data['results'][0]['applicants'], 0)
+
+        self.client.post(reverse('application_create', kwargs={'campaign_id': self.campaign.id}), {'message': 'Hi'})
+        self.assertEqual(self.client.get(self.url).data['results'][0]['applicants'], 1)
+
+    def test_query_params_are_cached_separately(self):
+        Campaign.objects.create(company=self.company_profile, title="Second", budget=100, status=Campaign.Status.OPEN)
+        self.client.force_authenticate(user=self.club_user)
+        self.assertEqual(len(self.client.get(self.url, {'page_size': 1}).data['results']), 1)
+        self.assertEqual(len(self.client.get(self.url).data['results']), 2)
+
+
+class CampaignDetailQueryTests(APITestCase):
+    def setUp(self):
+        self.company_profile = make_company('comp@corp.com', "Comp A")
+        self.company_user = self.company_profile.user
+        self.campaign = Campaign.objects.create(company=self.company_profile, title="Busy Camp", budget=100, status=Campaign.Status.OPEN)
+        self.url = reverse('campaign_detail', kwargs={'pk': self.campaign.id})
+
+    def add_applicants(self, n):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from .models import Deliverable
+        users = []
+        start = Application.objects.count()
+        for i in range(start, start + n):
+            club = make_club(f'club{i}@uni.edu', f"Club {i}", university="Uni")
+            app = Application.objects.create(campaign=self.campaign, club=club, message="Msg")
+            Deliverable.objects.create(application=app, file=SimpleUploadedFile(f"d{i}.txt", b"x"))
+            users.append(club.user)
+        return users
+
+    def test_owner_gets_summary_in_constant_queries(self):
+        # company_profile + campaign/company with per-status counts
+        self.add_applicants(2)
+        self.client.force_authenticate(user=User.objects.get(pk=self.company_user.pk))
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['applicant_summary']['total'], 2)
+
+        self.add_applicants(8)
+        Application.objects.filter(pk=Application.objects.first().pk).update(status=Application.Status.AWARDED)
+        self.client.force_authenticate(user=User.objects.get(pk=self.company_user.pk))
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        summary = response.data['applicant_summary']
+        self.assertEqual(summary['total'], 10)
+        self.assertEqual(summary['by_status']['PENDING'], 9)
+        self.assertEqual(summary['by_status']['AWARDED'], 1)
+        self.assertNotIn('applications', response.data)
+
+    def test_club_sees_own_application_from_prefetch(self):
+        club_users = self.add_applicants(5)
+        self.client.force_authenticate(user=club_users[3])
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertIsNone(response.data['applicant_summary'])
+        self.assertEqual(response.data['my_application']['id'], club_users[3].club_profile.applications.get().id)
+
+
+class CampaignApplicationsTests(APITestCase):
+    def setUp(self):
+        self.company_profile = make_company('comp@corp.com', "Comp A")
+        self.company_user = self.company_profile.user
+        self.campaign = Campaign.objects.create(company=self.company_profile, title="Viral Camp", budget=100, status=Campaign.Status.OPEN)
+        self.url = reverse('campaign_applications', kwargs={'campaign_id': self.campaign.id})
+
+        from reviews.models import Review
+        from .models import Deliverable
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        # (rank, rating, status) per club
+        specs = [('C', None, 'PENDING'), ('S', 3, 'PENDING'), ('A', 5, 'AWARDED'), ('B', 4, 'NOT_SELECTED')]
+        self.apps = []
+        for i, (rank, rating, app_status) in enumerate(specs):
+            club = make_club(f'club{i}@uni.edu', f"Club {i}", university="Uni", rank=rank)
+            app = Application.objects.create(campaign=self.campaign, club=club, message="Msg", status=app_status)
+            Deliverable.objects.create(application=app, file=SimpleUploadedFile(f"d{i}.txt", b"x"))
+            if rating:
+                past = Campaign.objects.create(company=self.company_profile, title=f"Past {i}", budget=100, status=Campaign.Status.COMPLETED)
+                Review.objects.create(reviewer=self.company_profile, reviewee=club, campaign=past, rating=rating, comment="ok")
+            self.apps.append(app)
+
+    def get_ids(self, **params):
+        self.client.force_authenticate(user=self.company_user)
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [a['id'] for a in response.data['results']]
+
+    def test_sorts(self):
+        a = [app.id for app in self.apps]
+        self.assertEqual(self.get_ids(), [a[3], a[2], a[1], a[0]])
+        self.assertEqual(self.get_ids(sort='status'), [a[2], a[1], a[0], a[3]])
+        self.assertEqual(self.get_ids(sort='club_rank'), [a[1], a[2], a[3], a[0]])
+        self.assertEqual(self.get_ids(sort='club_rating'), [a[2], a[3], a[1], a[0]])
+
+    def test_cursor_walk_under_sort(self):
+        self.client.force_authenticate(user=self.company_user)
+        url = self.url + '?sort=status&page_size=1'
+        seen = []
+        while url:
+            response = self.client.get(url)
+            seen.extend(a['id'] for a in response.data['results'])
+            url = response.data['next']
+        self.assertEqual(seen, self.get_ids(sort='status'))
+
+    def test_cursor_walk_through_tied_values(self):
+        from unittest import mock
+        from .pagination import ApplicantCursorPagination
+        # Eight PENDING rank-C applicants submitted at the same instant; a
+        # one-row offset_cutoff stands in for a tie longer than DRF's cap
+        for i in range(8):
+            club = make_club(f'tied{i}@uni.edu', f"Tied {i}", university="Uni", rank='C')
+            Application.objects.create(campaign=self.campaign, club=club, message="Msg")
+        Application.objects.filter(campaign=self.campaign).update(submitted_at=self.apps[0].submitted_at)
+
+        self.client.force_authenticate(user=self.company_user)
+        for sort in ('status', 'club_rank'):
+            expected = self.get_ids(sort=sort, page_size=100)
+            seen, prev = [], None
+            url = self.url + f'?sort={sort}&page_size=3'
+            with mock.patch.object(ApplicantCursorPagination, 'offset_cutoff', 1):
+                while url and len(seen) <= len(expected):
+                    response = self.client.get(url)
+                    seen.extend(a['id'] for a in response.data['results'])
+                    url, prev = response.data['next'], response.data['previous']
+                self.assertEqual(seen, expected)
+
+                # And back again from the last page
+                back = []
+                while prev and len(back) <= len(expected):
+                    response = self.client.get(prev)
+                    back[:0] = [a['id'] for a in response.data['results']]
+                    prev = response.data['previous']
+                # 12 applicants: everything before the 3-row last page
+                self.assertEqual(back, expected[:-3])
+
+    def test_deliverables_are_opt_in(self):
+        # company_profile + ownership check + page (+ deliverables)
+        self.client.force_authenticate(user=User.objects.get(pk=self.company_user.pk))
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertNotIn('deliverables', response.data['results'][0])
+
+        self.client.force_authenticate(user=User.objects.get(pk=self.company_user.pk))
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, {'include': 'deliverables'})
+        self.assertEqual(len(response.data['results'][0]['deliverables']), 1)
+
+    def test_other_company_forbidden(self):
+        other = make_company('other@corp.com', "Other").user
+        self.client.force_authenticate(user=other)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(REPORT_JOBS_EAGER=True)
+class ReportJobTests(APITestCase):
+    def setUp(self):
+        self.company_profile = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.company_user = self.company_profile.user
+        self.club_profile = make_club('club@uni.edu', "Club A", university="Uni A")
+        self.campaign = Campaign.objects.create(company=self.company_profile, title="Report Camp", budget=500, status=Campaign.Status.IN_PROGRESS)
+        Application.objects.create(campaign=self.campaign, club=self.club_profile, status=Application.Status.SUBMITTED, message="Msg")
+        self.client.force_authenticate(user=self.company_user)
+
+    def complete(self):
+        url = reverse('campaign_complete', kwargs={'campaign_id': self.campaign.id})
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self.client.post(url, {'rating': 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, callbacks
+
+    def test_completion_returns_pending_job_then_ready(self):
+        response, callbacks = self.complete()
+        # Rendering hasn't happened yet when the response goes out
+        self.assertEqual(response.data['report_status'], Report.Status.PENDING)
+        self.assertIsNone(response.data['report_url'])
+
+        status_url = reverse('report_status', kwargs={'pk': response.data['report_job_id']})
+        self.assertEqual(self.client.get(status_url).data['status'], Report.Status.PENDING)
+
+        for callback in callbacks:
+            callback()
+
+        poll = self.client.get(status_url)
+        self.assertEqual(poll.data['status'], Report.Status.READY)
+        self.assertTrue(poll.data['report_url'].endswith('.pdf'))
+
+    def test_failed_render_is_recorded(self):
+        from unittest import mock
+        response, callbacks = self.complete()
+        with mock.patch('campaigns.report_render.canvas.Canvas', side_effect=RuntimeError("font missing")):
+            for callback in callbacks:
+                callback()
+
+        report = Report.objects.get(pk=response.data['report_job_id'])
+        self.assertEqual(report.status, Report.Status.FAILED)
+        self.assertIn("font missing", report.error)
+
+    def test_process_command_renders_pending(self):
+        from django.core.management import call_command
+        from io import StringIO
+        response, _ = self.complete()  # callbacks dropped, as if the worker died
+
+        call_command('process_report_jobs', stdout=StringIO())
+        self.assertEqual(Report.objects.get(pk=response.data['report_job_id']).status, Report.Status.READY)
+
+    def test_other_company_cannot_poll(self):
+        response, _ = self.complete()
+        other = make_company('other@corp.com', "Other").user
+        self.client.force_authenticate(user=other)
+        poll = self.client.get(reverse('report_status', kwargs={'pk': response.data['report_job_id']}))
+        self.assertEqual(poll.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class RegenerateReportsCommandTests(APITestCase):
+    def setUp(self):
+        company = make_company('comp@corp.com', "Comp A")
+        club = make_club('club@uni.edu', "Club A", university="Uni A")
+        self.campaigns = []
+        for i in range(3):
+            campaign = Campaign.objects.create(company=company, title=f"Done {i}", budget=100, status=Campaign.Status.COMPLETED)
+            Application.objects.create(campaign=campaign, club=club, message="Msg", status=Application.Status.COMPLETED)
+            self.campaigns.append(campaign)
+        Campaign.objects.create(company=company, title="Open", budget=100, status=Campaign.Status.OPEN)
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.checkpoint = f"{self.tmp.name}/checkpoint.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_command(self, *args):
+        from django.core.management import call_command
+        from io import StringIO
+        out = StringIO()
+        call_command('regenerate_reports', '--checkpoint', self.checkpoint, *args, stdout=out)
+        return out.getvalue()
+
+    def test_renders_completed_campaigns_in_process_pool(self):
+        out = self.run_command('--workers', '2', '--batch-size', '2')
+        self.assertIn("Regenerated 3 reports (0 unchanged, skipped).", out)
+        self.assertIn("/s)", out)
+        self.assertEqual(Report.objects.filter(status=Report.Status.READY).count(), 3)
+
+        # Finished, so a later --resume starts from the beginning
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+        # Nothing changed: the second pass is fingerprint checks only
+        out = self.run_command('--workers', '0')
+        self.assertIn("Regenerated 0 reports (3 unchanged, skipped).", out)
+
+    def test_resume_and_since(self):
+        import json
+        with open(self.checkpoint, 'w') as f:
+            json.dump({'last_campaign_id': self.campaigns[0].id}, f)
+
+        out = self.run_command('--workers', '0', '--resume')
+        self.assertIn("Regenerated 2 reports", out)
+        self.assertFalse(Report.objects.filter(campaign=self.campaigns[0]).exists())
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+        out = self.run_command('--workers', '0', '--resume')
+        self.assertIn("Regenerated 1 reports (2 unchanged, skipped).", out)
+
+        out = self.run_command('--workers', '0', '--since', '2999-01-01')
+        self.assertIn("Regenerated 0 reports", out)
+
+
+class ReportFingerprintTests(APITestCase):
+    def setUp(self):
+        company = make_company('comp@corp.com', "Comp A")
+        club = make_club('club@uni.edu', "Club A", university="Uni A")
+        self.campaign = Campaign.objects.create(company=company, title="Finger", budget=100, status=Campaign.Status.COMPLETED)
+        Application.objects.create(campaign=self.campaign, club=club, message="Msg", status=Application.Status.COMPLETED)
+
+    def test_unchanged_inputs_skip_render(self):
+        from unittest import mock
+        from .utils import generate_campaign_report
+        first = generate_campaign_report(self.campaign)
+
+        with mock.patch('campaigns.utils.render_report_pdf') as render:
+            second = generate_campaign_report(self.campaign)
+        render.assert_not_called()
+        self.assertEqual(first.generated_pdf.name, second.generated_pdf.name)
+
+    def test_changed_inputs_replace_and_delete_old_file(self):
+        from .utils import generate_campaign_report
+        first = generate_campaign_report(self.campaign)
+        old_name = first.generated_pdf.name
+        storage = first.generated_pdf.storage
+
+        self.campaign.title = "Finger v2"
+        self.campaign.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            second = generate_campaign_report(self.campaign)
+
+        self.assertNotEqual(second.generated_pdf.name, old_name)
+        self.assertTrue(storage.exists(second.generated_pdf.name))
+        self.assertFalse(storage.exists(old_name))
+        storage.delete(second.generated_pdf.name)
+
+class DeliverableUploadTests(APITestCase):
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=media, DELIVERABLE_UPLOAD_TEMP_DIR=f"{media}/tmp")
+        override.enable()
+        self.addCleanup(override.disable)
+
+        company = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        club = make_club('club@uni.edu', "Club A", university="Uni A")
+        self.club_user = club.user
+        self.campaign = Campaign.objects.create(company=company, title="Upload Camp", budget=500, status=Campaign.Status.IN_PROGRESS)
+        self.application = Application.objects.create(campaign=self.campaign, club=club, status=Application.Status.AWARDED, message="Msg")
+        self.client.force_authenticate(user=self.club_user)
+
+    def start(self, content, application=None):
+        url = reverse('deliverable_upload_create', kwargs={'application_id': (application or self.application).id})
+        response = self.client.post(url, {'filename': 'Final Report.PDF', 'size': len(content)}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['id']
+
+    def put_chunk(self, upload_id, offset, chunk):
+        url = reverse('deliverable_upload', kwargs={'upload_id': upload_id})
+        return self.client.put(url, chunk, content_type='application/octet-stream', HTTP_UPLOAD_OFFSET=str(offset))
+
+    def finalize(self, upload_id, **data):
+        return self.client.post(reverse('deliverable_upload_finalize', kwargs={'upload_id': upload_id}), data, format='json')
+
+    def test_chunked_upload_resumes_and_finalizes(self):
+        import hashlib
+        content = b'x' * 1000 + b'y' * 500
+        upload_id = self.start(content)
+
+        self.assertEqual(self.put_chunk(upload_id, 0, content[:1000]).data['received_bytes'], 1000)
+        # A replayed chunk is rejected with the offset to resume from
+        replay = self.put_chunk(upload_id, 0, content[:1000])
+        self.assertEqual(replay.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(replay.data['received_bytes'], 1000)
+
+        status_response = self.client.get(reverse('deliverable_upload', kwargs={'upload_id': upload_id}))
+        self.assertEqual(status_response.data['received_bytes'], 1000)
+
+        # Application isn't submitted until the whole file is in
+        self.assertEqual(self.finalize(upload_id).status_code, status.HTTP_400_BAD_REQUEST)
+        self.application.refresh_from_db()
+        self.assertEqual(self.application.status, Application.Status.AWARDED)
+
+        self.assertEqual(self.put_chunk(upload_id, 1000, content[1000:]).data['received_bytes'], 1500)
+        digest = hashlib.sha256(content).hexdigest()
+        response = self.finalize(upload_id, sha256=digest)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['sha256'], digest)
+        self.assertEqual(response.data['original_name'], 'Final Report.PDF')
+
+        self.application.refresh_from_db()
+        self.assertEqual(self.application.status, Application.Status.SUBMITTED)
+        deliverable = self.application.deliverables.get()
+        self.assertEqual(deliverable.file.name, f"deliverables/sha256/{digest[:2]}/{digest}.pdf")
+        with deliverable.file.open('rb') as f:
+            self.assertEqual(f.read(), content)
+
+        # Retried finalize returns the same deliverable
+        retry = self.finalize(upload_id)
+        self.assertEqual(retry.status_code, status.HTTP_200_OK)
+        self.assertEqual(retry.data['id'], deliverable.id)
+
+    def test_finalize_uses_the_running_digest(self):
+        import hashlib
+        from unittest import mock
+        from . import uploads
+        content = b'a' * 700 + b'b' * 300
+        digest = hashlib.sha256(content).hexdigest()
+
+        upload_id = self.start(content)
+        self.put_chunk(upload_id, 0, content[:700])
+        self.put_chunk(upload_id, 700, content[700:])
+        with mock.patch.object(uploads, 'sha256_file', side_effect=AssertionError("re-read the file")):
+            self.assertEqual(self.finalize(upload_id, sha256=digest).data['sha256'], digest)
+
+        # Chunks that went through another process: one hashing pass at finalize
+        other = Application.objects.create(
+            campaign=Campaign.objects.create(company=self.campaign.company, title="Other", budget=100),
+            club=self.application.club, status=Application.Status.AWARDED, message="Msg"
+        )
+        upload_id = self.start(content, application=other)
+        self.put_chunk(upload_id, 0, content[:700])
+        uploads._running.clear()
+        self.put_chunk(upload_id, 700, content[700:])
+        self.assertEqual(self.finalize(upload_id, sha256=digest).data['sha256'], digest)
+
+    def test_chunk_past_declared_size_is_rejected(self):
+        upload_id = self.start(b'abc')
+        self.assertEqual(self.put_chunk(upload_id, 0, b'abcdef').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.put_chunk(upload_id, 0, b'abc').data['received_bytes'], 3)
+
+    def test_identical_uploads_share_one_file(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        content = b'same bytes'
+        upload_id = self.start(content)
+        self.put_chunk(upload_id, 0, content)
+        self.assertEqual(self.finalize(upload_id).status_code, status.HTTP_201_CREATED)
+
+        other = Application.objects.create(
+            campaign=Campaign.objects.create(company=self.campaign.company, title="Other", budget=100),
+            club=self.application.club, status=Application.Status.AWARDED, message="Msg"
+        )
+        url = reverse('deliverable_create', kwargs={'application_id': other.id})
+        response = self.client.post(url, {'file': SimpleUploadedFile('copy.pdf', content)}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        names = set(Deliverable.objects.values_list('file', flat=True))
+        self.assertEqual(len(names), 1)
+
+    def test_cannot_upload_to_unawarded_application(self):
+        self.application.status = Application.Status.PENDING
+        self.application.save()
+        url = reverse('deliverable_upload_create', kwargs={'application_id': self.application.id})
+        response = self.client.post(url, {'filename': 'a.pdf', 'size': 3}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+class AwardConcurrencyTests(APITransactionTestCase):
+    def setUp(self):
+        company = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.company_user = company.user
+        self.campaign = Campaign.objects.create(company=company, title="Contested", budget=500, status=Campaign.Status.OPEN)
+        self.applications = []
+        for i in range(8):
+            club = make_club(f'club{i}@uni.edu', f"Club {i}", university="Uni")
+            self.applications.append(Application.objects.create(campaign=self.campaign, club=club, message="Msg"))
+
+    def test_award_after_award_conflicts(self):
+        self.client.force_authenticate(user=self.company_user)
+        first = self.client.post(reverse('award_application', kwargs={'application_id': self.applications[0].id}))
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        second = self.client.post(reverse('award_application', kwargs={'application_id': self.applications[1].id}))
+        self.assertEqual(second.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(second.data['code'], 'already_awarded')
+
+    def test_award_from_a_stale_read_conflicts(self):
+        from unittest import mock
+        # Another request awarded the campaign after this one loaded it
+        stale = Application.objects.select_related('campaign').get(pk=self.applications[0].pk)
+        Campaign.objects.filter(pk=self.campaign.pk).update(status=Campaign.Status.IN_PROGRESS, awarded_club=self.applications[1].club)
+        Application.objects.filter(pk=self.applications[1].pk).update(status=Application.Status.AWARDED)
+
+        self.client.force_authenticate(user=self.company_user)
+        with mock.patch('campaigns.views.get_object_or_404', return_value=stale):
+            response = self.client.post(reverse('award_application', kwargs={'application_id': stale.id}))
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['code'], 'already_awarded')
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.awarded_club, self.applications[1].club)
+        statuses = dict(Application.objects.filter(campaign=self.campaign).values_list('id', 'status'))
+        self.assertEqual(statuses[self.applications[0].id], Application.Status.PENDING)
+        self.assertEqual(statuses[self.applications[1].id], Application.Status.AWARDED)
+
+    # Threads writing to SQLite's shared in-memory test database fail with
+    # "table is locked" instead of waiting; the conditional UPDATE itself is
+    # covered by the stale-read test above
+    @skipIf(connection.vendor == 'sqlite', "needs a database that serializes concurrent writers")
+    def test_parallel_awards_have_exactly_one_winner(self):
+        import threading
+        from rest_framework.test import APIClient
+
+        barrier = threading.Barrier(len(self.applications))
+        results = {}
+
+        def award(application):
+            client = APIClient()
+            client.force_authenticate(user=User.objects.get(pk=self.company_user.pk))
+            try:
+                barrier.wait()
+                response = client.post(reverse('award_application', kwargs={'application_id': application.id}))
+                results[application.id] = response.status_code
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=award, args=(app,)) for app in self.applications]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        codes = list(results.values())
+        self.assertEqual(codes.count(status.HTTP_200_OK), 1)
+        self.assertEqual(codes.count(status.HTTP_409_CONFLICT), len(self.applications) - 1)
+
+        winner_id = next(app_id for app_id, code in results.items() if code == status.HTTP_200_OK)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, Campaign.Status.IN_PROGRESS)
+        self.assertEqual(self.campaign.awarded_club.applications.get(campaign=self.campaign).id, winner_id)
+        statuses = dict(Application.objects.filter(campaign=self.campaign).values_list('id', 'status'))
+        self.assertEqual(list(statuses.values()).count(Application.Status.AWARDED), 1)
+        self.assertEqual(statuses[winner_id], Application.Status.AWARDED)
+
+class ApplicationUniquenessTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.company = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.club_profile = make_club('club@uni.edu', "Club A", university="Uni A")
+        self.club_user = self.club_profile.user
+        self.campaign = Campaign.objects.create(company=self.company, title="Unique Camp", budget=500, status=Campaign.Status.OPEN)
+        self.client.force_authenticate(user=self.club_user)
+
+    def test_duplicate_apply_is_rejected_by_constraint(self):
+        url = reverse('application_create', kwargs={'campaign_id': self.campaign.id})
+        self.assertEqual(self.client.post(url, {'message': 'Pick us!'}).status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post(url, {'message': 'Again'})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Application.objects.filter(campaign=self.campaign).count(), 1)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.applicants_count, 1)
+
+    def test_apply_to_closed_campaign_is_rejected(self):
+        self.campaign.status = Campaign.Status.IN_PROGRESS
+        self.campaign.save()
+        response = self.client.post(reverse('application_create', kwargs={'campaign_id': self.campaign.id}), {'message': 'Late'})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Application.objects.exists())
+
+    def test_bulk_apply_skips_duplicates_and_closed(self):
+        others = [Campaign.objects.create(company=self.company, title=f"Shortlist {i}", budget=100, status=Campaign.Status.OPEN) for i in range(3)]
+        closed = Campaign.objects.create(company=self.company, title="Closed", budget=100, status=Campaign.Status.IN_PROGRESS)
+        self.client.post(reverse('application_create', kwargs={'campaign_id': self.campaign.id}), {'message': 'Earlier'})
+        ids = [self.campaign.id, closed.id] + [c.id for c in others]
+
+        response = self.client.post(reverse('application_bulk_create'), {'campaign_ids': ids, 'message': 'Shortlisted'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['applied'], sorted(c.id for c in others))
+        self.assertEqual(response.data['already_applied'], [self.campaign.id])
+        self.assertEqual(response.data['not_open'], [closed.id])
+
+        self.assertEqual(Application.objects.filter(club=self.club_profile).count(), 4)
+        counts = dict(Campaign.objects.filter(pk__in=ids).values_list('id', 'applicants_count'))
+        self.assertEqual(counts, {pk: 0 if pk == closed.id else 1 for pk in ids})
+
+        # Re-sending the shortlist is harmless
+        again = self.client.post(reverse('application_bulk_create'), {'campaign_ids': ids, 'message': 'Shortlisted'}, format='json')
+        self.assertEqual(again.data['applied'], [])
+        self.assertEqual(Application.objects.filter(club=self.club_profile).count(), 4)
+
+    def test_bulk_apply_reports_rows_a_concurrent_apply_won(self):
+        from unittest import mock
+        other = Campaign.objects.create(company=self.company, title="Other", budget=100, status=Campaign.Status.OPEN)
+        bulk_create = Application.objects.bulk_create
+
+        def racing_bulk_create(*args, **kwargs):
+            # A single apply for the same campaign lands just before the insert
+            self.client.post(reverse('application_create', kwargs={'campaign_id': self.campaign.id}), {'message': 'Racing'})
+            return bulk_create(*args, **kwargs)
+
+        with mock.patch.object(Application.objects, 'bulk_create', side_effect=racing_bulk_create):
+            response = self.client.post(reverse('application_bulk_create'), {'campaign_ids': [self.campaign.id, other.id], 'message': 'Shortlisted'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['applied'], [other.id])
+        self.assertEqual(response.data['already_applied'], [self.campaign.id])
+        self.assertEqual(Application.objects.get(campaign=self.campaign).message, 'Racing')
+        counts = dict(Campaign.objects.values_list('id', 'applicants_count'))
+        self.assertEqual(counts, {self.campaign.id: 1, other.id: 1})
+
+    def test_bulk_apply_validates_input(self):
+        url = reverse('application_bulk_create')
+        self.assertEqual(self.client.post(url, {'campaign_ids': [], 'message': 'x'}, format='json').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post(url, {'campaign_ids': [self.campaign.id]}, format='json').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post(url, {'campaign_ids': ['abc'], 'message': 'x'}, format='json').status_code, status.HTTP_400_BAD_REQUEST)
+
+class DeadlineSweepTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.company = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.company_user = self.company.user
+        self.club = make_club('club@uni.edu', "Club A", university="Uni A")
+
+        from datetime import timedelta
+        from django.utils import timezone
+        today = timezone.localdate()
+        self.expired = [
+            Campaign.objects.create(company=self.company, title=f"Expired {i}", budget=100, status=Campaign.Status.OPEN, deadline=today - timedelta(days=i + 1))
+            for i in range(5)
+        ]
+        self.due_today = Campaign.objects.create(company=self.company, title="Due Today", budget=100, status=Campaign.Status.OPEN, deadline=today)
+        self.no_deadline = Campaign.objects.create(company=self.company, title="Open Ended", budget=100, status=Campaign.Status.OPEN)
+        self.in_progress = Campaign.objects.create(company=self.company, title="Running", budget=100, status=Campaign.Status.IN_PROGRESS, deadline=today - timedelta(days=3))
+
+    def test_sweep_closes_expired_in_batches(self):
+        from django.core.management import call_command
+        from io import StringIO
+        from users.models import SystemLog
+
+        out = StringIO()
+        call_command('close_expired_campaigns', '--batch-size', '2', stdout=out)
+        self.assertIn("Closed 5 expired campaigns.", out.getvalue())
+
+        self.assertEqual(Campaign.objects.filter(status=Campaign.Status.CLOSED).count(), 5)
+        for campaign in (self.due_today, self.no_deadline):
+            campaign.refresh_from_db()
+            self.assertEqual(campaign.status, Campaign.Status.OPEN)
+        self.in_progress.refresh_from_db()
+        self.assertEqual(self.in_progress.status, Campaign.Status.IN_PROGRESS)
+
+        # One summary entry per batch (2 + 2 + 1), not one per campaign
+        self.assertEqual(SystemLog.objects.filter(message__startswith="Deadline Sweep").count(), 3)
+
+        self.client.force_authenticate(user=User.objects.get(pk=self.club.user_id))
+        titles = {c['title'] for c in self.client.get(reverse('campaign_list_create')).data['results']}
+        self.assertEqual(titles, {"Due Today", "Open Ended"})
+
+    def test_closed_campaign_can_still_be_awarded(self):
+        from campaigns.utils import close_expired_campaigns
+        application = Application.objects.create(campaign=self.expired[0], club=self.club, message="Msg")
+        close_expired_campaigns()
+
+        self.client.force_authenticate(user=self.club.user)
+        response = self.client.post(reverse('application_create', kwargs={'campaign_id': self.expired[1].id}), {'message': 'Late'})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.company_user)
+        response = self.client.post(reverse('award_application', kwargs={'application_id': application.id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.expired[0].refresh_from_db()
+        self.assertEqual(self.expired[0].status, Campaign.Status.IN_PROGRESS)
+
+class CampaignBoardFilterTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        from datetime import date
+        verified = make_company('ver@corp.com', "Verified Co", verification_status=CompanyProfile.VerificationStatus.VERIFIED)
+        pending = make_company('pend@corp.com', "Pending Co")
+
+        bounty, ambassador = Campaign.Type.TALENT_BOUNTY, Campaign.Type.BRAND_AMBASSADOR
+        for title, company, type_, budget, deadline in [
+            ("Small Bounty", verified, bounty, 500, date(2030, 1, 10)),
+            ("Mid Bounty", verified, bounty, 1000, date(2030, 2, 10)),
+            ("Big Bounty", pending, bounty, 8000, None),
+            ("Mid Ambassador", pending, ambassador, 4999, date(2030, 3, 10)),
+        ]:
+            Campaign.objects.create(company=company, title=title, type=type_, budget=budget, deadline=deadline, status=Campaign.Status.OPEN)
+        Campaign.objects.create(company=verified, title="Draft", type=bounty, budget=100)
+
+        club_user = make_club('club@uni.edu', "Club A", university="Uni A").user
+        self.client.force_authenticate(user=club_user)
+
+    def titles(self, **params):
+        response = self.client.get(reverse('campaign_list_create'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {c['title'] for c in response.data['results']}, response.data['facets']
+
+    def test_filters(self):
+        self.assertEqual(self.titles(type='BRAND_AMBASSADOR')[0], {"Mid Ambassador"})
+        self.assertEqual(self.titles(rank='A')[0], {"Mid Bounty", "Mid Ambassador"})
+        self.assertEqual(self.titles(budget_min=900, budget_max=5000)[0], {"Mid Bounty", "Mid Ambassador"})
+        self.assertEqual(self.titles(deadline_after='2030-02-01', deadline_before='2030-02-28')[0], {"Mid Bounty"})
+        self.assertEqual(self.titles(verified='true')[0], {"Small Bounty", "Mid Bounty"})
+        self.assertEqual(self.titles(verified='true', rank='B')[0], {"Small Bounty"})
+
+    def test_invalid_filter_value(self):
+        response = self.client.get(reverse('campaign_list_create'), {'type': 'NOPE'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_facet_counts_follow_filters(self):
+        _, facets = self.titles()
+        self.assertEqual(facets['total'], 4)
+        self.assertEqual(facets['type'], {'TALENT_BOUNTY': 3, 'BRAND_AMBASSADOR': 1})
+        self.assertEqual({f['rank']: f['count'] for f in facets['rank']}, {'S': 1, 'A': 2, 'B': 1})
+
+        _, facets = self.titles(verified='true')
+        self.assertEqual(facets['type'], {'TALENT_BOUNTY': 2, 'BRAND_AMBASSADOR': 0})
+        self.assertEqual({f['rank']: f['count'] for f in facets['rank']}, {'S': 0, 'A': 1, 'B': 1})
+
+        # A facet's own selection doesn't shrink its counts; the other one's does
+        titles, facets = self.titles(type='TALENT_BOUNTY', rank='A')
+        self.assertEqual(titles, {"Mid Bounty"})
+        self.assertEqual(facets['total'], 1)
+        self.assertEqual(facets['type'], {'TALENT_BOUNTY': 1, 'BRAND_AMBASSADOR': 1})
+        self.assertEqual({f['rank']: f['count'] for f in facets['rank']}, {'S': 1, 'A': 1, 'B': 1})
+
+    def test_facets_refresh_after_write(self):
+        self.titles()
+        company = CompanyProfile.objects.get(company_name="Pending Co")
+        Campaign.objects.create(company=company, title="New Big", type=Campaign.Type.TALENT_BOUNTY, budget=9000, status=Campaign.Status.OPEN)
+        _, facets = self.titles()
+        self.assertEqual(facets['total'], 5)
+
+@override_settings(CAMPAIGN_READ_MODEL_ENABLED=True)
+class CampaignReadModelTests(APITestCase):
+    def setUp(self):
+        import random
+        from datetime import date, timedelta
+        from . import read_model
+        cache.clear()
+        read_model.reset()
+        self.read_model = read_model
+
+        rng = random.Random(15)
+        self.companies = []
+        for i in range(3):
+            self.companies.append(make_company(f'comp{i}@corp.com', f"Comp {i}", tier=CompanyProfile.Tier.PRO))
+        budgets = ['250.00', '999.99', '1000.00', '1000.01', '4999.99', '5000.00', '12000.50']
+        statuses = [Campaign.Status.OPEN] * 6 + [Campaign.Status.CLOSED, Campaign.Status.DRAFT, Campaign.Status.IN_PROGRESS]
+        for i in range(120):
+            Campaign.objects.create(
+                company=rng.choice(self.companies), title=f"Camp {i}", type=rng.choice(Campaign.Type.values),
+                budget=rng.choice(budgets), status=rng.choice(statuses),
+                deadline=rng.choice([None, date(2030, 1, 1) + timedelta(days=rng.randrange(90))])
+            )
+        # Runs of identical created_at exercise the cursor's offset tie-breaking
+        ids = list(Campaign.objects.order_by('id').values_list('id', flat=True))
+        for start in range(0, len(ids), 9):
+            stamp = Campaign.objects.get(pk=ids[start]).created_at
+            Campaign.objects.filter(pk__in=ids[start:start + 4]).update(created_at=stamp)
+
+        self.club = make_club('club@uni.edu', "Club A", university="Uni A")
+        club_user = self.club.user
+        self.client.force_authenticate(user=club_user)
+
+    FILTERS = [
+        {},
+        {'page_size': 7},
+        {'type': 'BRAND_AMBASSADOR', 'page_size': 5},
+        {'rank': 'A'},
+        {'rank': 'S', 'type': 'TALENT_BOUNTY'},
+        {'budget_min': '999.995', 'budget_max': '5000', 'page_size': 6},
+        {'deadline_after': '2030-01-15', 'deadline_before': '2030-02-20', 'page_size': 4},
+        {'deadline_before': '2030-03-01', 'rank': 'B'},
+    ]
+
+    def walk(self, params, use_read_model):
+        """
+        Every page of the board, forwards then back again via previous links.
+        """
+        from . import board_cache
+        board_cache.bump_generation()  # never serve the other path's cached pages
+        pages = []
+        with self.settings(CAMPAIGN_READ_MODEL_ENABLED=use_read_model):
+            response = self.client.get(reverse('campaign_list_create'), params)
+            while True:
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                pages.append(dict(response.data))
+                if not response.data['next']:
+                    break
+                response = self.client.get(response.data['next'])
+            while response.data['previous']:
+                response = self.client.get(response.data['previous'])
+                pages.append(dict(response.data))
+        return pages
+
+    def assert_matches_orm(self):
+        for params in self.FILTERS:
+            with self.subTest(params=params):
+                self.assertEqual(self.walk(params, True), self.walk(params, False))
+
+    def test_matches_orm_path(self):
+        self.assert_matches_orm()
+        stats = self.read_model.stats()
+        self.assertEqual(stats['rows'], Campaign.objects.filter(status=Campaign.Status.OPEN).count())
+        self.assertEqual(stats['full_loads'], 1)
+
+    def test_incremental_refresh(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from .utils import close_expired_campaigns
+        self.assert_matches_orm()
+        index = self.read_model.get_index()
+
+        # New, edited, awarded and expired campaigns arrive as change_seq deltas
+        for i in range(5):
+            Campaign.objects.create(company=self.companies[0], title=f"New {i}", type=Campaign.Type.TALENT_BOUNTY, budget='1500.00', status=Campaign.Status.OPEN)
+        edited = Campaign.objects.filter(status=Campaign.Status.OPEN).order_by('id').first()
+        edited.budget = '7777.00'
+        edited.save()
+
+        to_award = Campaign.objects.filter(status=Campaign.Status.OPEN).order_by('-id')[3]
+        application = Application.objects.create(campaign=to_award, club=self.club, message="Msg")
+        self.client.force_authenticate(user=to_award.company.user)
+        self.assertEqual(self.client.post(reverse('award_application', kwargs={'application_id': application.id})).status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(user=self.club.user)
+
+        close_expired_campaigns(today=timezone.localdate().replace(year=2030, month=1, day=20))
+
+        self.assert_matches_orm()
+        self.assertEqual(index.full_loads, 1)
+        self.assertGreater(index.incremental_loads, 0)
+
+        # Deletes arrive as tombstones, without a reload
+        Campaign.objects.filter(status=Campaign.Status.OPEN).order_by('id').first().delete()
+        self.assert_matches_orm()
+        self.assertEqual(index.full_loads, 1)
+
+        # ...unless the tombstones past the watermark were pruned
+        from .changes import prune_tombstones
+        Campaign.objects.filter(status=Campaign.Status.OPEN).order_by('id').first().delete()
+        prune_tombstones(timezone.now() + timedelta(days=1))
+        self.assert_matches_orm()
+        self.assertEqual(index.full_loads, 2)
+
+    def test_sees_writes_that_skip_this_process_cache(self):
+        with self.settings(CAMPAIGN_READ_MODEL_ENABLED=True, CAMPAIGN_READ_MODEL_RECHECK_SECONDS=0):
+            self.client.get(reverse('campaign_list_create'))
+            index = self.read_model.get_index()
+            closing = Campaign.objects.filter(status=Campaign.Status.OPEN).order_by('id').first()
+            self.assertIn(closing.pk, index.ids)
+
+            # Another worker's write bumps the change counter but not our generation
+            Campaign.objects.filter(pk=closing.pk).update(status=Campaign.Status.CLOSED, change_seq=next_change_seq())
+            self.assertTrue(index.sync())
+        self.assertNotIn(closing.pk, index.ids)
+        self.assertEqual(index.full_loads, 1)
+        self.assertEqual(len(index), Campaign.objects.filter(status=Campaign.Status.OPEN).count())
+
+    def test_facets_are_cached_per_watermark(self):
+        from unittest import mock
+        with self.settings(CAMPAIGN_READ_MODEL_ENABLED=True):
+            first = self.client.get(reverse('campaign_list_create'), {'rank': 'A'}).data['facets']
+            index = self.read_model.get_index()
+            with mock.patch.object(index, '_count_facets', side_effect=AssertionError("recounted")):
+                self.assertEqual(index.facets({'rank': 'A'}), first)
+
+            Campaign.objects.create(company=self.companies[0], title="New", type=Campaign.Type.TALENT_BOUNTY, budget='1500.00', status=Campaign.Status.OPEN)
+            self.assertTrue(index.sync())
+            self.assertEqual(index.facets({'rank': 'A'})['total'], first['total'] + 1)
+
+    def test_warm_page_is_one_query(self):
+        from . import board_cache
+        self.client.get(reverse('campaign_list_create'))
+        board_cache.bump_generation()
+        self.client.get(reverse('campaign_list_create'), {'rank': 'B'})  # incremental sync, nothing changed
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('campaign_list_create'), {'rank': 'A', 'page_size': 3})
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_memory_per_campaign_is_bounded(self):
+        self.client.get(reverse('campaign_list_create'))
+        stats = self.read_model.stats()
+        self.assertGreater(stats['rows'], 0)
+        self.assertLessEqual(stats['array_bytes_per_campaign'], 40)
+
+    def test_falls_back_to_orm(self):
+        # Over the row limit, or a filter the index doesn't hold
+        with self.settings(CAMPAIGN_READ_MODEL_MAX_ROWS=10):
+            self.read_model.reset()
+            self.assertEqual(self.walk({'page_size': 9}, True), self.walk({'page_size': 9}, False))
+            self.assertTrue(self.read_model.stats()['overflowed'])
+
+        self.read_model.reset()
+        self.assertEqual(self.walk({'verified': 'false'}, True), self.walk({'verified': 'false'}, False))
+        self.assertEqual(self.read_model.stats()['rows'], 0)
+
+
+class ChangeSeqTests(APITestCase):
+    def setUp(self):
+        self.company = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.campaign = Campaign.objects.create(company=self.company, title="Camp", budget=100, status=Campaign.Status.OPEN)
+        self.clubs = [make_club(f'club{i}@uni.edu', f"Club {i}", university="Uni") for i in range(2)]
+
+    def counter(self):
+        from .models import CampaignChangeCounter
+        return CampaignChangeCounter.objects.get(pk=1).value
+
+    def test_apply_takes_one_change_seq(self):
+        before = self.counter()
+        self.client.force_authenticate(user=self.clubs[0].user)
+        response = self.client.post(reverse('application_create', kwargs={'campaign_id': self.campaign.id}), {'message': "Msg"})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.assertEqual(self.counter(), before + 1)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.change_seq, before + 1)
+        self.assertEqual(Application.objects.get(campaign=self.campaign).change_seq, before + 1)
+
+    def test_award_takes_one_change_seq(self):
+        applications = [Application.objects.create(campaign=self.campaign, club=club, message="Msg") for club in self.clubs]
+        before = self.counter()
+        self.client.force_authenticate(user=self.company.user)
+        response = self.client.post(reverse('award_application', kwargs={'application_id': applications[0].id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.counter(), before + 1)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.change_seq, before + 1)
+        self.assertEqual(set(Application.objects.filter(campaign=self.campaign).values_list('change_seq', flat=True)), {before + 1})
+
+    def test_missing_counter_row_is_recreated(self):
+        from .models import CampaignChangeCounter
+        CampaignChangeCounter.objects.all().delete()
+        self.assertEqual(next_change_seq(), 1)
+        self.assertEqual(next_change_seq(), 2)
+
+
+class MyApplicationsTests(APITestCase):
+    def setUp(self):
+        self.company = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.club = make_club('club@uni.edu', "Club A", university="Uni A")
+        self.club_user = self.club.user
+        other = make_club('other@uni.edu', "Club B", university="Uni B")
+        Application.objects.create(campaign=Campaign.objects.create(company=self.company, title="Not mine", budget=100), club=other, message="Msg")
+
+    def add_applications(self, n, status=Application.Status.PENDING):
+        from django.core.files.base import ContentFile
+        for i in range(n):
+            campaign = Campaign.objects.create(company=self.company, title=f"Camp {status} {i}", budget=100, status=Campaign.Status.OPEN)
+            application = Application.objects.create(campaign=campaign, club=self.club, message="Msg", status=status)
+            if status == Application.Status.SUBMITTED:
+                Deliverable.objects.create(application=application, file=ContentFile(b'x', name='proof.txt'))
+
+    def get(self, params=None):
+        return self.client.get(reverse('my_applications'), params or {})
+
+    def fresh_login(self):
+        # Fresh user object so club_profile isn't already cached on it
+        self.client.force_authenticate(user=User.objects.get(pk=self.club_user.pk))
+
+    def test_query_count_is_constant(self):
+        self.add_applications(2)
+        self.fresh_login()
+        with self.assertNumQueries(3):
+            self.get()
+        self.add_applications(12)
+        self.add_applications(3, Application.Status.SUBMITTED)
+        self.fresh_login()
+        with self.assertNumQueries(3):
+            response = self.get()
+        self.assertEqual(len(response.data['results']), 17)
+        self.assertEqual(response.data['results'][0]['campaign_title'], "Camp SUBMITTED 2")
+        self.assertEqual(len(response.data['results'][0]['deliverables']), 1)
+        self.assertEqual(response.data['results'][-1]['deliverables'], [])
+
+        self.fresh_login()
+        with self.assertNumQueries(2):
+            response = self.get({'exclude': 'deliverables'})
+        self.assertNotIn('deliverables', response.data['results'][0])
+
+    def test_status_filter_and_pagination(self):
+        self.fresh_login()
+        self.add_applications(4)
+        self.add_applications(2, Application.Status.AWARDED)
+        self.add_applications(1, Application.Status.SUBMITTED)
+
+        response = self.get({'status': ['AWARDED', 'SUBMITTED']})
+        self.assertEqual({a['status'] for a in response.data['results']}, {'AWARDED', 'SUBMITTED'})
+        self.assertEqual(len(response.data['results']), 3)
+
+        response = self.get({'status': 'PENDING', 'page_size': 3})
+        self.assertEqual(len(response.data['results']), 3)
+        response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIsNone(response.data['next'])
+
+        self.assertEqual(self.get({'status': 'BOGUS'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+class ClubDashboardTests(APITestCase):
+    def setUp(self):
+        self.company = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.club = make_club('club@uni.edu', "Club A", university="Uni A")
+        self.club_user = self.club.user
+
+    def apply(self, title, app_status, budget=100, campaign_status=Campaign.Status.OPEN):
+        campaign = Campaign.objects.create(company=self.company, title=title, budget=budget, status=campaign_status)
+        Application.objects.create(campaign=campaign, club=self.club, message="Msg", status=app_status)
+        return campaign
+
+    def get(self, params=None):
+        self.client.force_authenticate(user=User.objects.get(pk=self.club_user.pk))
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('club_dashboard'), params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_summary_and_lists(self):
+        applied = self.apply("Bid", Application.Status.PENDING)
+        self.apply("Lost", Application.Status.NOT_SELECTED, campaign_status=Campaign.Status.IN_PROGRESS)
+        self.apply("Running", Application.Status.AWARDED, budget=1000, campaign_status=Campaign.Status.IN_PROGRESS)
+        self.apply("Done", Application.Status.COMPLETED, budget=250.5, campaign_status=Campaign.Status.COMPLETED)
+        fresh = [Campaign.objects.create(company=self.company, title=f"Fresh {i}", budget=100, status=Campaign.Status.OPEN) for i in range(3)]
+
+        data = self.get()
+        summary = data['summary']
+        self.assertEqual(summary['total'], 4)
+        self.assertEqual(summary['wins'], 2)
+        self.assertEqual(summary['active'], 1)
+        self.assertEqual(summary['earnings'], "1250.50")
+        self.assertEqual(summary['by_status']['PENDING'], 1)
+        self.assertEqual(summary['by_status']['REJECTED'], 0)
+
+        self.assertEqual([a['campaign_title'] for a in data['active_applications']], ["Done", "Running"])
+        self.assertEqual([a['campaign_title'] for a in data['recent_applications']], ["Lost", "Bid"])
+
+        flags = {c['id']: c['has_applied'] for c in data['open_campaigns']}
+        self.assertEqual(flags, {**{c.id: False for c in fresh}, applied.id: True})
+
+        data = self.get({'campaigns': 2, 'exclude_applied': 'true'})
+        self.assertEqual([c['id'] for c in data['open_campaigns']], [fresh[2].id, fresh[1].id])
+
+    def test_query_count_ignores_history(self):
+        for i in range(15):
+            self.apply(f"Camp {i}", Application.Status.PENDING)
+        data = self.get({'campaigns': 20})
+        self.assertEqual(len(data['recent_applications']), 10)
+        self.assertEqual(len(data['open_campaigns']), 15)
+
+class CompanyDashboardTests(APITestCase):
+    def setUp(self):
+        self.company = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.company_user = self.company.user
+        self.clubs = []
+        for i in range(3):
+            self.clubs.append(make_club(f'club{i}@uni.edu', f"Club {i}", university="Uni A"))
+        Subscription.objects.create(company=self.company, plan_name='PRO', start_date="2024-01-01T00:00:00Z", end_date="2025-01-01T00:00:00Z")
+
+    def get(self, queries=4):
+        self.client.force_authenticate(user=User.objects.get(pk=self.company_user.pk))
+        with self.assertNumQueries(queries):
+            response = self.client.get(reverse('company_dashboard'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_funnel_per_campaign(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        running = Campaign.objects.create(company=self.company, title="Running", budget=1000, status=Campaign.Status.IN_PROGRESS)
+        statuses = [Application.Status.AWARDED, Application.Status.NOT_SELECTED, Application.Status.NOT_SELECTED]
+        apps = [Application.objects.create(campaign=running, club=club, message="Msg", status=s) for club, s in zip(self.clubs, statuses)]
+        for i in range(2):
+            Deliverable.objects.create(application=apps[0], file=SimpleUploadedFile(f"d{i}.txt", b"x"))
+        for amount, tx_status in [(100, Transaction.Status.SUCCESS), (50.25, Transaction.Status.SUCCESS), (999, Transaction.Status.FAILED)]:
+            Transaction.objects.create(company=self.company, amount=amount, transaction_type=Transaction.Type.FINDERS_FEE, status=tx_status, related_campaign=running)
+        empty = Campaign.objects.create(company=self.company, title="Empty", budget=100, status=Campaign.Status.OPEN)
+        other_company = make_company('other@corp.com', "Comp B")
+        Campaign.objects.create(company=other_company, title="Not mine", budget=100)
+
+        data = self.get()
+        self.assertEqual([c['id'] for c in data['campaigns']], [empty.id, running.id])
+
+        funnel = data['campaigns'][1]['funnel']
+        self.assertEqual(funnel['applicants'], 3)
+        self.assertEqual(funnel['by_status']['AWARDED'], 1)
+        self.assertEqual(funnel['by_status']['NOT_SELECTED'], 2)
+        self.assertEqual(funnel['by_status']['PENDING'], 0)
+        self.assertEqual(funnel['deliverables_submitted'], 2)
+        self.assertEqual(funnel['spend'], "150.25")
+        self.assertEqual(data['campaigns'][0]['funnel']['spend'], "0.00")
+
+        summary = data['summary']
+        self.assertEqual(summary['campaigns'], 2)
+        self.assertEqual(summary['by_status']['OPEN'], 1)
+        self.assertEqual(summary['by_status']['IN_PROGRESS'], 1)
+        self.assertEqual(summary['applicants'], 3)
+        self.assertEqual(summary['spend'], "150.25")
+
+        treasury = data['treasury']
+        self.assertEqual(treasury['tier'], CompanyProfile.Tier.PRO)
+        self.assertEqual(len(treasury['transactions']), 3)
+        self.assertEqual(treasury['subscription']['status'], 'ACTIVE')
+
+    def test_query_count_ignores_campaign_count(self):
+        for i in range(10):
+            campaign = Campaign.objects.create(company=self.company, title=f"Camp {i}", budget=100)
+            for club in self.clubs:
+                Application.objects.create(campaign=campaign, club=club, message="Msg")
+        data = self.get()
+        self.assertEqual(len(data['campaigns']), 10)
+        self.assertEqual(data['summary']['applicants'], 30)
+
+    def test_clubs_are_refused(self):
+        self.client.force_authenticate(user=self.clubs[0].user)
+        response = self.client.get(reverse('company_dashboard'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+class RecordingHub:
+    """
+    Stands in for the realtime hub and keeps everything published.
+    """
+    def __init__(self):
+        self.events = []
+
+    def publish(self, user_ids, event):
+        self.events.append((sorted(user_ids), event))
+
+    def sent_to(self, user):
+        return [event for user_ids, event in self.events if user.pk in user_ids]
+
+
+@override_settings(REALTIME_HUB='campaigns.tests.RecordingHub', REPORT_JOBS_EAGER=True)
+class RealtimePublishTests(APITestCase):
+    def setUp(self):
+        from . import realtime
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=media)
+        override.enable()
+        self.addCleanup(override.disable)
+        realtime.reset()
+        self.addCleanup(realtime.reset)
+        self.hub = realtime.get_hub()
+
+        company = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.company_user = company.user
+        self.campaign = Campaign.objects.create(company=company, title="Live", budget=500, status=Campaign.Status.OPEN)
+        self.club_users, self.applications = [], []
+        for i in range(2):
+            club = make_club(f'club{i}@uni.edu', f"Club {i}", university="Uni A")
+            self.club_users.append(club.user)
+            self.applications.append(Application.objects.create(campaign=self.campaign, club=club, message="Msg"))
+
+    def award(self):
+        self.client.force_authenticate(user=self.company_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(reverse('award_application', kwargs={'application_id': self.applications[0].id}))
+
+    def test_award_pushes_status_deltas(self):
+        self.assertEqual(self.award().status_code, status.HTTP_200_OK)
+        winner, loser = self.club_users
+
+        self.assertEqual(self.hub.sent_to(self.company_user), [{
+            'type': 'campaign.status', 'campaign_id': self.campaign.id, 'status': 'IN_PROGRESS',
+            'awarded_application_id': self.applications[0].id, 'guild': 'Club 0',
+        }])
+        self.assertEqual(
+            [(e['type'], e['status']) for e in self.hub.sent_to(winner)],
+            [('campaign.status', 'IN_PROGRESS'), ('application.status', 'AWARDED')]
+        )
+        self.assertEqual(self.hub.sent_to(loser), [{
+            'type': 'application.status', 'campaign_id': self.campaign.id,
+            'application_id': self.applications[1].id, 'status': 'NOT_SELECTED',
+        }])
+
+        # A losing second award announces nothing
+        self.hub.events.clear()
+        self.assertEqual(self.award().status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(self.hub.events, [])
+
+    def test_deliverable_and_completion_push_deltas(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        self.award()
+        self.hub.events.clear()
+        winner = self.club_users[0]
+
+        self.client.force_authenticate(user=winner)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse('deliverable_create', kwargs={'application_id': self.applications[0].id}),
+                {'file': SimpleUploadedFile("proof.txt", b"done")}, format='multipart'
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        [event] = self.hub.sent_to(self.company_user)
+        self.assertEqual(event['status'], 'SUBMITTED')
+        self.assertEqual(event['deliverable']['id'], response.data['id'])
+        self.assertEqual(self.hub.sent_to(winner), [event])
+
+        self.hub.events.clear()
+        self.client.force_authenticate(user=self.company_user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('campaign_complete', kwargs={'campaign_id': self.campaign.id}), {'rating': 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        expected = [('campaign.status', 'COMPLETED'), ('application.status', 'COMPLETED')]
+        self.assertEqual([(e['type'], e['status']) for e in self.hub.sent_to(self.company_user)], expected)
+        self.assertEqual([(e['type'], e['status']) for e in self.hub.sent_to(winner)], expected)
+        self.assertEqual(self.hub.sent_to(self.club_users[1]), [])
+
+
+class EventStreamTests(APITestCase):
+    def setUp(self):
+        from rest_framework_simplejwt.tokens import AccessToken
+        from . import realtime
+        realtime.reset()
+        self.addCleanup(realtime.reset)
+        self.user = User.objects.create_user(username='club@uni.edu', email='club@uni.edu', password='pw', role=User.Role.CLUB)
+        self.token = str(AccessToken.for_user(self.user))
+
+    async def test_stream_delivers_published_events(self):
+        from . import realtime
+        response = await AsyncClient().get(reverse('event_stream'), headers={'authorization': f'Bearer {self.token}'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        stream = aiter(response.streaming_content)
+        self.assertIn(b': connected', await anext(stream))
+        hub = realtime.get_hub()
+        self.assertEqual(hub.stats()['streams'], 1)
+
+        hub.publish([self.user.pk + 1], {'type': 'campaign.status', 'campaign_id': 1, 'status': 'OPEN'})
+        hub.publish([self.user.pk], {'type': 'application.status', 'application_id': 9, 'status': 'AWARDED'})
+        frame = (await anext(stream)).decode()
+        self.assertIn('event: application.status\n', frame)
+        self.assertIn('"application_id": 9', frame)
+
+        # The ASGI handler cancels the response on client disconnect
+        waiting = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        self.assertEqual(hub.stats()['streams'], 0)
+
+    async def test_slow_stream_is_told_to_resync(self):
+        from . import realtime
+        subscription = realtime.Subscription(self.user.pk, asyncio.get_running_loop(), max_queue=2)
+        for n in range(3):
+            subscription.deliver({'type': 'application.status', 'n': n})
+        await asyncio.sleep(0)
+        self.assertEqual(await subscription.get(1), {'type': realtime.RESYNC})
+
+    async def test_requires_authentication(self):
+        response = await AsyncClient().get(reverse('event_stream'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refused_without_asgi(self):
+        response = self.client.get(reverse('event_stream'))
+        self.assertEqual(response.status_code, status.HTTP_501_NOT_IMPLEMENTED)
+
+
+class CampaignChangesTests(APITestCase):
+    def setUp(self):
+        self.company = make_company('comp@corp.com', "Comp A", tier=CompanyProfile.Tier.PRO)
+        self.company_user = self.company.user
+        self.club = make_club('club@uni.edu', "Club A", university="Uni A")
+        self.club_user = self.club.user
+
+    def changes(self, since, user=None, **params):
+        self.client.force_authenticate(user=user or self.club_user)
+        return self.client.get(reverse('campaign_changes'), {'since': since, **params})
+
+    def sync(self, since, user=None, limit=500):
+        """
+        Follow has_more to the end; returns (version, campaign ids, application ids, removed campaign ids).
+        """
+        campaigns, applications, removed = [], [], []
+        while True:
+            response = self.changes(since, user=user, limit=limit)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertGreaterEqual(response.data['version'], since)
+            since = response.data['version']
+            campaigns += [c['id'] for c in response.data['campaigns']]
+            applications += [a['id'] for a in response.data['applications']]
+            removed += response.data['removed']['campaigns']
+            if not response.data['has_more']:
+                return since, campaigns, applications, removed
+
+    def test_only_changes_since_the_version_come_back(self):
+        gone = Campaign.objects.create(company=self.company, title="Gone", budget=100, status=Campaign.Status.OPEN)
+        awarded = Campaign.objects.create(company=self.company, title="Awarded", budget=100, status=Campaign.Status.OPEN)
+        Campaign.objects.create(company=self.company, title="Draft", budget=100, status=Campaign.Status.DRAFT)
+
+        version = self.changes(0, limit=0).data['version']
+        self.assertEqual(self.sync(version), (version, [], [], []))
+
+        fresh = Campaign.objects.create(company=self.company, title="Fresh", budget=100, status=Campaign.Status.OPEN)
+        awarded.status = Campaign.Status.IN_PROGRESS
+        awarded.save()
+        gone_id = gone.id
+        gone.delete()
+
+        version, campaigns, applications, removed = self.sync(version)
+        self.assertEqual(campaigns, [fresh.id])
+        self.assertEqual(sorted(removed), sorted([awarded.id, gone_id]))
+        self.assertEqual(self.sync(version), (version, [], [], []))
+
+        # The owner still sees its awarded campaign
+        _, campaigns, _, _ = self.sync(0, user=self.company_user)
+        self.assertEqual(sorted(campaigns), sorted(Campaign.objects.values_list('id', flat=True)))
+
+    def test_initial_sync_reports_nothing_removed(self):
+        other = make_company('other@corp.com', "Comp B")
+        open_ = Campaign.objects.create(company=other, title="Open", budget=100, status=Campaign.Status.OPEN)
+        for status_ in (Campaign.Status.DRAFT, Campaign.Status.CLOSED, Campaign.Status.IN_PROGRESS, Campaign.Status.COMPLETED):
+            Campaign.objects.create(company=other, title=status_, budget=100, status=status_)
+        applied = Campaign.objects.create(company=other, title="Applied", budget=100, status=Campaign.Status.OPEN)
+        application = Application.objects.create(campaign=applied, club=self.club, message="Msg")
+        applied.status = Campaign.Status.CLOSED
+        applied.save()
+
+        response = self.changes(0)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(c['id'] for c in response.data['campaigns']), sorted([open_.id, applied.id]))
+        self.assertEqual([a['id'] for a in response.data['applications']], [application.id])
+        self.assertEqual(response.data['removed'], {'campaigns': [], 'applications': []})
+
+    def test_applications_are_scoped_and_status_updates_show_up(self):
+        campaign = Campaign.objects.create(company=self.company, title="Camp", budget=100, status=Campaign.Status.OPEN)
+        mine = Application.objects.create(campaign=campaign, club=self.club, message="Msg")
+        other_club = make_club('other@uni.edu', "Club B", university="Uni B")
+        theirs = Application.objects.create(campaign=campaign, club=other_club, message="Msg")
+
+        version, _, applications, _ = self.sync(0)
+        self.assertEqual(applications, [mine.id])
+        _, _, applications, _ = self.sync(0, user=self.company_user)
+        self.assertEqual(sorted(applications), sorted([mine.id, theirs.id]))
+
+        self.client.force_authenticate(user=self.company_user)
+        self.client.post(reverse('award_application', kwargs={'application_id': theirs.id}))
+        response = self.changes(version)
+        self.assertEqual([(a['id'], a['status']) for a in response.data['applications']], [(mine.id, 'NOT_SELECTED')])
+        # Applied-to campaigns stay visible after leaving the board
+        self.assertEqual([c['id'] for c in response.data['campaigns']], [campaign.id])
+
+    def test_paging_never_splits_a_shared_change_seq(self):
+        campaigns = [Campaign.objects.create(company=self.company, title=f"Camp {i}", budget=100, status=Campaign.Status.OPEN) for i in range(3)]
+        applications = []
+        for campaign in campaigns:
+            applications.append(Application.objects.create(campaign=campaign, club=self.club, message="Msg"))
+        version = self.changes(0, limit=0).data['version']
+
+        # One bulk update gives every application the same change_seq
+        Application.objects.update(status=Application.Status.REJECTED, change_seq=next_change_seq())
+        Campaign.objects.filter(pk=campaigns[0].pk).update(title="Renamed", change_seq=next_change_seq())
+
+        _, changed_campaigns, changed_applications, _ = self.sync(version, limit=2)
+        self.assertEqual(sorted(changed_applications), sorted(a.id for a in applications))
+        self.assertEqual(changed_campaigns, [campaigns[0].id])
+
+        _, all_campaigns, all_applications, _ = self.sync(0, limit=1)
+        self.assertEqual(sorted(all_campaigns), sorted(c.id for c in campaigns))
+        self.assertEqual(sorted(all_applications), sorted(a.id for a in applications))
+
+    def test_versions_older_than_pruned_tombstones_must_resync(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from .changes import prune_tombstones
+        campaign = Campaign.objects.create(company=self.company, title="Camp", budget=100, status=Campaign.Status.OPEN)
+        version = self.changes(0, limit=0).data['version']
+        campaign.delete()
+        self.assertEqual(prune_tombstones(timezone.now() + timedelta(seconds=1)), 1)
+
+        response = self.changes(version)
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        self.assertEqual(response.data['code'], 'resync_required')
+        self.assertEqual(self.changes(0).status_code, status.HTTP_200_OK)
+
+    def test_rejects_bad_versions(self):
+        self.assertEqual(self.changes('abc').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.changes(-1).status_code, status.HTTP_400_BAD_REQUEST)
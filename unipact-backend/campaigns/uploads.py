@@ -0,0 +1,137 @@
+"""
+Disk helpers for chunked, content-addressed deliverable uploads.
+
+Chunks are streamed from the request into a per-upload temp file in fixed
+size blocks, so no chunk is ever held in memory whole. Finished files are
+stored under their SHA-256 (deliverables/sha256/ab/abcdef....ext), which
+makes identical uploads share one stored file.
+
+The SHA-256 is computed as chunks arrive, so finalize doesn't read the
+whole file a second time. hashlib state can't be saved, so the running
+digests live in this process, keyed by upload and byte offset. An upload
+whose chunks went through another worker (or a restart) has no digest
+matching its offset here, and finalize hashes the file in one pass instead.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+
+BLOCK_SIZE = 64 * 1024
+# Running digests kept at once; the oldest (likely abandoned) go first
+MAX_RUNNING_DIGESTS = 1000
+
+_running = OrderedDict()  # upload id -> (bytes hashed, sha256 object)
+_running_lock = threading.Lock()
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+def temp_dir():
+    path = Path(getattr(settings, 'DELIVERABLE_UPLOAD_TEMP_DIR', Path(settings.BASE_DIR) / 'upload_tmp'))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def temp_path(upload):
+    return temp_dir() / f"{upload.id}.part"
+
+
+def _take_running_digest(upload):
+    with _running_lock:
+        offset, digest = _running.pop(upload.id, (None, None))
+    if offset == upload.received_bytes:
+        return digest
+    # Bytes went through another process, or an append wasn't recorded
+    return hashlib.sha256() if upload.received_bytes == 0 else None
+
+
+def _keep_running_digest(upload, offset, digest):
+    with _running_lock:
+        _running[upload.id] = (offset, digest)
+        while len(_running) > MAX_RUNNING_DIGESTS:
+            _running.popitem(last=False)
+
+
+def finished_digest(upload):
+    """
+    Hex SHA-256 of the complete upload from its running digest, or None if
+    this process didn't see every chunk.
+    """
+    with _running_lock:
+        offset, digest = _running.pop(upload.id, (None, None))
+    if digest is None or offset != upload.size:
+        return None
+    return digest.hexdigest()
+
+
+def append_chunk(upload, stream, limit):
+    """
+    Stream `stream` onto the end of the upload's temp file, writing at most
+    `limit` bytes. Returns the number of bytes written.
+    """
+    path = temp_path(upload)
+    digest = _take_running_digest(upload)
+    written = 0
+    with open(path, 'ab') as f:
+        # Drop anything past received_bytes left by an interrupted earlier append
+        f.truncate(upload.received_bytes)
+        while True:
+            block = stream.read(BLOCK_SIZE)
+            if not block:
+                break
+            written += len(block)
+            if written > limit:
+                f.truncate(upload.received_bytes)
+                raise UploadTooLarge()
+            f.write(block)
+            if digest is not None:
+                digest.update(block)
+    if digest is not None:
+        _keep_running_digest(upload, upload.received_bytes + written, digest)
+    return written
+
+
+def sha256_file(fileobj):
+    digest = hashlib.sha256()
+    for block in iter(lambda: fileobj.read(BLOCK_SIZE), b''):
+        digest.update(block)
+    return digest.hexdigest()
+
+
+def content_address(digest, filename):
+    ext = os.path.splitext(filename)[1].lower()[:16]
+    return f"deliverables/sha256/{digest[:2]}/{digest}{ext}"
+
+
+def store_content_addressed(fileobj, filename, digest=None):
+    """
+    Store `fileobj` under its SHA-256 unless an identical file is already
+    stored. Returns (storage name, digest).
+    """
+    if digest is None:
+        fileobj.seek(0)
+        digest = sha256_file(fileobj)
+    name = content_address(digest, filename)
+    if not default_storage.exists(name):
+        fileobj.seek(0)
+        saved = default_storage.save(name, File(fileobj))
+        # A concurrent upload of the same content won the race; keep theirs
+        if saved != name:
+            default_storage.delete(saved)
+    return name, digest
+
+
+def discard(upload):
+    with _running_lock:
+        _running.pop(upload.id, None)
+    try:
+        os.remove(temp_path(upload))
+    except FileNotFoundError:
+        pass
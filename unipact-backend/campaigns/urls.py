@@ -1,12 +1,22 @@
 from django.urls import path
-from .views import CampaignListCreateView, CampaignDetailView, ApplicationCreateView, AwardApplicationView, DeliverableCreateView, MarkCampaignCompletedView, MyApplicationsView
+from .views import CampaignListCreateView, CampaignDetailView, CampaignApplicationsView, ApplicationCreateView, BulkApplicationCreateView, AwardApplicationView, DeliverableCreateView, DeliverableUploadCreateView, DeliverableUploadView, DeliverableUploadFinalizeView, MarkCampaignCompletedView, MyApplicationsView, ClubDashboardView, CompanyDashboardView, CampaignChangesView, EventStreamView, ReportStatusView
 
 urlpatterns = [
     path('', CampaignListCreateView.as_view(), name='campaign_list_create'),
     path('<int:pk>/', CampaignDetailView.as_view(), name='campaign_detail'),
+    path('<int:campaign_id>/applications/', CampaignApplicationsView.as_view(), name='campaign_applications'),
     path('<int:campaign_id>/apply/', ApplicationCreateView.as_view(), name='application_create'),
+    path('apply/bulk/', BulkApplicationCreateView.as_view(), name='application_bulk_create'),
+    path('dashboard/club/', ClubDashboardView.as_view(), name='club_dashboard'),
+    path('dashboard/company/', CompanyDashboardView.as_view(), name='company_dashboard'),
+    path('changes/', CampaignChangesView.as_view(), name='campaign_changes'),
+    path('events/', EventStreamView.as_view(), name='event_stream'),
     path('applications/me/', MyApplicationsView.as_view(), name='my_applications'),
     path('application/<int:application_id>/award/', AwardApplicationView.as_view(), name='award_application'),
     path('application/<int:application_id>/deliverable/', DeliverableCreateView.as_view(), name='deliverable_create'),
+    path('application/<int:application_id>/deliverable/uploads/', DeliverableUploadCreateView.as_view(), name='deliverable_upload_create'),
+    path('deliverable/uploads/<uuid:upload_id>/', DeliverableUploadView.as_view(), name='deliverable_upload'),
+    path('deliverable/uploads/<uuid:upload_id>/finalize/', DeliverableUploadFinalizeView.as_view(), name='deliverable_upload_finalize'),
     path('<int:campaign_id>/complete/', MarkCampaignCompletedView.as_view(), name='campaign_complete'),
+    path('reports/<int:pk>/', ReportStatusView.as_view(), name='report_status'),
 ]
@@ -1,42 +1,147 @@
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-import io
-from .models import Report
+from .models import Report, Campaign, Application, next_change_seq
+from . import board_cache
+from .report_render import render_report_pdf, REPORT_LAYOUT_VERSION
+import hashlib
+import json
 from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
-def generate_campaign_report(campaign):
-    buffer = io.BytesIO()
-    p = canvas.Canvas(buffer, pagesize=letter)
-    
-    # Title
-    p.setFont("Helvetica-Bold", 16)
-    p.drawString(100, 750, f"Campaign Report: {campaign.title}")
-    
-    # Details
-    p.setFont("Helvetica", 12)
-    p.drawString(100, 730, f"Company: {campaign.company.company_name}")
-    p.drawString(100, 710, f"Budget: {campaign.budget}")
-    
-    # Awarded application
-    awarded_app = campaign.applications.filter(status='AWARDED').first()
+def winning_application(campaign):
+    # Use a `winning_applications` prefetch when the caller set one up
+    if hasattr(campaign, 'winning_applications'):
+        return campaign.winning_applications[0] if campaign.winning_applications else None
+    return campaign.applications.filter(
+        status__in=Application.WINNING_STATUSES
+    ).select_related('club').prefetch_related('deliverables').order_by('id').first()
+
+def report_context(campaign):
+    """
+    Everything the report PDF shows, as plain picklable data.
+    """
+    awarded_app = winning_application(campaign)
+    awarded_club = None
+    deliverables = []
     if awarded_app:
-        p.drawString(100, 690, f"Awarded Club: {awarded_app.club.club_name}")
-        p.drawString(100, 670, f"University: {awarded_app.club.university}")
-        
-        # Deliverables
-        p.drawString(100, 640, "Deliverables:")
-        y = 620
-        for deliverable in awarded_app.deliverables.all():
-            p.drawString(120, y, f"- {deliverable.file.name}")
-            y -= 20
-    
-    p.showPage()
-    p.save()
-    
-    pdf_content = buffer.getvalue()
-    buffer.close()
-    
-    # Save Report
-    report, created = Report.objects.get_or_create(campaign=campaign)
-    report.generated_pdf.save(f"report_{campaign.id}.pdf", ContentFile(pdf_content))
+        awarded_club = {'club_name': awarded_app.club.club_name, 'university': awarded_app.club.university}
+        deliverables = [deliverable.original_name or deliverable.file.name for deliverable in awarded_app.deliverables.all()]
+
+    return {
+        'campaign_id': campaign.id,
+        'title': campaign.title,
+        'company_name': campaign.company.company_name,
+        'budget': str(campaign.budget),
+        'awarded_club': awarded_club,
+        'deliverables': deliverables,
+    }
+
+def report_fingerprint(context):
+    payload = json.dumps({'layout': REPORT_LAYOUT_VERSION, **context}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def report_is_current(report, fingerprint):
+    """
+    True when the stored PDF was rendered from exactly these inputs.
+    """
+    return (
+        report is not None
+        and report.fingerprint == fingerprint
+        and bool(report.generated_pdf)
+        and report.generated_pdf.storage.exists(report.generated_pdf.name)
+    )
+
+def mark_report_ready(report):
+    if report.status != Report.Status.READY or report.error:
+        report.status = Report.Status.READY
+        report.error = ''
+        report.save(update_fields=['status', 'error', 'updated_at'])
     return report
+
+def save_report_pdf(campaign, pdf_content, report=None, fingerprint=''):
+    if report is None:
+        report, created = Report.objects.get_or_create(campaign=campaign)
+    old_name = report.generated_pdf.name
+
+    # Content-addressed name: a re-render of changed inputs never collides with
+    # (and gets a random suffix next to) the file it supersedes
+    report.generated_pdf.save(f"report_{campaign.id}_{fingerprint[:16]}.pdf", ContentFile(pdf_content), save=False)
+    report.fingerprint = fingerprint
+    report.status = Report.Status.READY
+    report.error = ''
+    report.save()
+
+    if old_name and old_name != report.generated_pdf.name:
+        storage = report.generated_pdf.storage
+        transaction.on_commit(lambda: storage.delete(old_name))
+    return report
+
+def generate_campaign_report(campaign, force=False):
+    context = report_context(campaign)
+    fingerprint = report_fingerprint(context)
+
+    report = Report.objects.filter(campaign=campaign).first()
+    if not force and report_is_current(report, fingerprint):
+        return mark_report_ready(report)
+
+    pdf_content = render_report_pdf(context)
+    return save_report_pdf(campaign, pdf_content, report=report, fingerprint=fingerprint)
+
+
+def rebuild_campaign_counters(queryset=None, change_seq=None):
+    """
+    Recompute the denormalized applicant count and awarded club columns
+    on Campaign from the Application table. Returns the number of rows updated.
+    Pass `change_seq` when the calling transaction already took one.
+    """
+    if queryset is None:
+        queryset = Campaign.objects.all()
+
+    applicant_counts = Application.objects.filter(campaign=OuterRef('pk')).order_by().values('campaign').annotate(c=Count('id')).values('c')
+    winning_apps = Application.objects.filter(
+        campaign=OuterRef('pk'),
+        status__in=Application.WINNING_STATUSES
+    ).order_by('id')
+
+    with transaction.atomic():
+        updated = queryset.update(
+            applicants_count=Coalesce(Subquery(applicant_counts), 0),
+            awarded_club=Subquery(winning_apps.values('club')[:1]),
+            awarded_club_name=Subquery(winning_apps.values('club__club_name')[:1]),
+            change_seq=change_seq or next_change_seq(),
+        )
+        # update() bypasses model signals, so invalidate cached board pages here
+        board_cache.invalidate()
+    return updated
+
+def close_expired_campaigns(batch_size=500, today=None):
+    """
+    Move OPEN campaigns whose deadline has passed to CLOSED, in set-based
+    batches over campaign_deadline_idx. Writes one SystemLog entry per batch.
+    Returns the number of campaigns closed.
+    """
+    from users.models import SystemLog
+    from users.utils import log_event
+
+    today = today or timezone.localdate()
+    expired = Campaign.objects.filter(status=Campaign.Status.OPEN, deadline__lt=today)
+
+    total = 0
+    while True:
+        with transaction.atomic():
+            batch = list(expired.order_by('deadline', 'id').values_list('pk', flat=True)[:batch_size])
+            if not batch:
+                break
+            # Re-check status in the UPDATE so a campaign awarded meanwhile is left alone
+            closed = Campaign.objects.filter(pk__in=batch, status=Campaign.Status.OPEN).update(
+                status=Campaign.Status.CLOSED, updated_at=timezone.now(), change_seq=next_change_seq()
+            )
+            # update() bypasses model signals, so invalidate cached board pages here
+            board_cache.invalidate()
+        total += closed
+        log_event(SystemLog.Category.MARKETPLACE, SystemLog.Level.INFO, f"Deadline Sweep: closed {closed} expired campaigns",
+                  event=SystemLog.Event.DEADLINE_SWEEP, closed=closed)
+        if len(batch) < batch_size:
+            break
+    return total
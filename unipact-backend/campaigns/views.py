@@ -1,12 +1,32 @@
+import asyncio
+from decimal import Decimal
 from rest_framework import generics, permissions, status, exceptions
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
-from .models import Campaign, Application
-from .serializers import CampaignSerializer, CampaignDetailSerializer, ApplicationSerializer, DeliverableSerializer
-from users.models import User, CompanyProfile
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from asgiref.sync import sync_to_async
+from django.db import transaction, IntegrityError
+from django.utils import timezone
+from django.db.models import F, Q, Prefetch, Count, Sum, Avg, Case, When, Value, IntegerField, FloatField, DecimalField, OuterRef, Subquery, Exists
+from django.db.models.functions import Coalesce
+from .models import Campaign, Application, Deliverable, DeliverableUpload, Report, next_change_seq
+from .filters import CampaignFilter, ApplicationFilter, FACET_FILTERS, facet_counts
+from .pagination import CampaignBoardPagination, ApplicantCursorPagination, MyApplicationsPagination
+from .serializers import CampaignSerializer, CampaignDetailSerializer, DashboardCampaignSerializer, CompanyDashboardCampaignSerializer, ApplicationSerializer, ApplicantSerializer, MyApplicationSerializer, DeliverableSerializer, DeliverableUploadSerializer, ReportSerializer, applicant_status_annotation
+from users.models import User, CompanyProfile, ClubProfile
+from reviews.models import Review
 from payments.models import Transaction, Subscription
-from .utils import generate_campaign_report
+from payments.services import treasury_summary
+from .jobs import enqueue_report
+from .utils import rebuild_campaign_counters
+from . import search, board_cache, changes, read_model, realtime, uploads
 
 class IsCompany(permissions.BasePermission):
     def has_permission(self, request, view):
@@ -19,16 +39,102 @@ class IsClub(permissions.BasePermission):
 class CampaignListCreateView(generics.ListCreateAPIView):
     serializer_class = CampaignSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CampaignBoardPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = CampaignFilter
+
+    def is_my_campaigns_mode(self):
+        return self.request.query_params.get('mode') == 'my_campaigns' and self.request.user.role == User.Role.COMPANY
+
+    @property
+    def paginator(self):
+        # Company management view stays a plain list; the public board is cursor-paginated
+        if self.is_my_campaigns_mode():
+            return None
+        return super().paginator
 
     def get_queryset(self):
-        mode = self.request.query_params.get('mode')
         # Mode: my_campaigns (For Companies to manage their own)
-        if mode == 'my_campaigns' and self.request.user.role == User.Role.COMPANY:
+        if self.is_my_campaigns_mode():
             return Campaign.objects.filter(company=self.request.user.company_profile).select_related('company')
         
         # Default: Only show OPEN campaigns (Public Board)
         return Campaign.objects.filter(status=Campaign.Status.OPEN).select_related('company')
 
+    def list(self, request, *args, **kwargs):
+        if self.is_my_campaigns_mode():
+            return self.build_list_response(request, *args, **kwargs)
+
+        # Public board: serve serialized pages from the versioned cache
+        key = board_cache.page_key(request)
+        data = board_cache.get_page(key)
+        if data is None:
+            data = self.build_list_response(request, *args, **kwargs).data
+            board_cache.set_page(key, data)
+        return Response(data)
+
+    def build_list_response(self, request, *args, **kwargs):
+        q = request.query_params.get('q', '').strip()
+        if not q:
+            if not self.is_my_campaigns_mode() and read_model.enabled():
+                response = self.read_model_list(request)
+                if response is not None:
+                    return response
+            response = super().list(request, *args, **kwargs)
+            if not self.is_my_campaigns_mode():
+                response.data['facets'] = self.get_facets(request)
+            return response
+
+        # ?q= : ranked full-text search within the current mode's queryset
+        queryset = self.filter_queryset(self.get_queryset())
+        limit = CampaignBoardPagination().get_page_size(request)
+        hits = search.search(queryset, q, limit=limit)
+        campaigns = queryset.in_bulk([hit['id'] for hit in hits])
+
+        results = []
+        for hit in hits:
+            campaign = campaigns.get(hit['id'])
+            if campaign is None:
+                continue
+            data = self.get_serializer(campaign).data
+            data['search_rank'] = hit['rank']
+            data['search_snippet'] = hit['snippet']
+            results.append(data)
+
+        return Response({"query": q, "results": results})
+
+    def read_model_list(self, request):
+        # Board page answered from the in-process index; None means use the ORM
+        # (invalid or unsupported filters, or an index over its row limit)
+        filterset = self.filterset_class(request.query_params, queryset=self.get_queryset(), request=request)
+        if not filterset.is_valid():
+            return None
+        filters = {name: value for name, value in filterset.form.cleaned_data.items() if value not in (None, '')}
+        if not set(filters) <= read_model.SUPPORTED_FILTERS:
+            return None
+
+        index = read_model.get_index()
+        if not index.sync():
+            return None
+
+        page = self.paginate_queryset(read_model.BoardQuery(index, filters, self.get_queryset()))
+        response = self.get_paginated_response(self.get_serializer(page, many=True).data)
+        response.data['facets'] = index.facets(filters)
+        return response
+
+    def get_facets(self, request):
+        # Counts depend only on the filters, so they're cached per filter
+        # signature and shared by every page of that filtered board
+        params = {name: request.query_params.get(name) for name in CampaignFilter.base_filters if name in request.query_params}
+        key = board_cache.facets_key(params)
+        facets = board_cache.get_facets(key)
+        if facets is None:
+            base = {name: value for name, value in params.items() if name not in FACET_FILTERS}
+            queryset = CampaignFilter(base, queryset=self.get_queryset(), request=request).qs
+            facets = facet_counts(queryset, type=params.get('type') or None, rank=params.get('rank') or None)
+            board_cache.set_facets(key, facets)
+        return facets
+
     def perform_create(self, serializer):
         # Ensure only companies can create
         if self.request.user.role != User.Role.COMPANY:
@@ -44,7 +150,8 @@ class CampaignListCreateView(generics.ListCreateAPIView):
         # Log Event
         from users.models import SystemLog
         from users.utils import log_event
-        log_event(SystemLog.Category.MARKETPLACE, SystemLog.Level.INFO, f"New Quest: '{instance.title}' posted by {self.request.user.company_profile.company_name}")
+        log_event(SystemLog.Category.MARKETPLACE, SystemLog.Level.INFO, f"New Quest: '{instance.title}' posted by {self.request.user.company_profile.company_name}",
+                  event=SystemLog.Event.QUEST_POSTED, actor=self.request.user, subject=instance, amount=instance.budget, title=instance.title)
 
 class CampaignDetailView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Campaign.objects.all()
@@ -52,11 +159,217 @@ class CampaignDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        # Companies can only edit their own
+        # Everything CampaignDetailSerializer reads is loaded here in a fixed
+        # number of queries, however many applicants the campaign has
+
         # Companies can only edit their own
         if self.request.user.role == User.Role.COMPANY:
-            return Campaign.objects.filter(company=self.request.user.company_profile).prefetch_related('applications__club__user')
-        return Campaign.objects.all().select_related('company').prefetch_related('applications__club__user') # Clubs can view all (read-only logic needed in serializer or permission)
+            status_counts = {
+                applicant_status_annotation(value): Count('applications', filter=Q(applications__status=value))
+                for value in Application.Status.values
+            }
+            return Campaign.objects.filter(company=self.request.user.company_profile).select_related('company').annotate(**status_counts)
+
+        my_applications = Prefetch(
+            'applications',
+            queryset=Application.objects.filter(club__user=self.request.user),
+            to_attr='my_applications'
+        )
+        return Campaign.objects.all().select_related('company').prefetch_related(my_applications) # Clubs can view all (read-only logic needed in serializer or permission)
+
+class CampaignApplicationsView(generics.ListAPIView):
+    """
+    Paginated applicants for the owning company.
+
+    ?sort=submitted_at|status|club_rank|club_rating, ?include=deliverables
+    """
+    serializer_class = ApplicantSerializer
+    permission_classes = [permissions.IsAuthenticated, IsCompany]
+    pagination_class = ApplicantCursorPagination
+
+    # Workflow order: winner first, then open applications, then closed ones
+    STATUS_ORDER = [
+        Application.Status.AWARDED,
+        Application.Status.SUBMITTED,
+        Application.Status.COMPLETED,
+        Application.Status.PENDING,
+        Application.Status.NOT_SELECTED,
+        Application.Status.REJECTED,
+    ]
+    RANK_ORDER = [ClubProfile.Rank.S, ClubProfile.Rank.A, ClubProfile.Rank.B, ClubProfile.Rank.C]
+
+    def include_deliverables(self):
+        return 'deliverables' in self.request.query_params.get('include', '').split(',')
+
+    def get_queryset(self):
+        campaign = get_object_or_404(Campaign.objects.only('id', 'company_id'), pk=self.kwargs['campaign_id'])
+        if campaign.company_id != self.request.user.company_profile.id:
+            raise exceptions.PermissionDenied("You do not own this campaign.")
+
+        queryset = Application.objects.filter(campaign_id=campaign.id).select_related('club', 'campaign').annotate(
+            status_order=Case(
+                *[When(status=value, then=Value(i)) for i, value in enumerate(self.STATUS_ORDER)],
+                default=Value(len(self.STATUS_ORDER)), output_field=IntegerField()
+            ),
+            club_rank_order=Case(
+                *[When(club__rank=value, then=Value(i)) for i, value in enumerate(self.RANK_ORDER)],
+                default=Value(len(self.RANK_ORDER)), output_field=IntegerField()
+            ),
+            club_rating=Coalesce(
+                Subquery(
+                    Review.objects.filter(reviewee=OuterRef('club')).order_by().values('reviewee').annotate(avg=Avg('rating')).values('avg'),
+                    output_field=FloatField()
+                ),
+                Value(0.0)
+            ),
+        )
+        if self.include_deliverables():
+            queryset = queryset.prefetch_related(
+                Prefetch('deliverables', queryset=Deliverable.objects.order_by('uploaded_at'))
+            )
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['include_deliverables'] = self.include_deliverables()
+        return context
+
+class ClubDashboardView(APIView):
+    """
+    Everything the student dashboard shows, in a fixed handful of queries:
+    application counts and earnings, the club's active missions and recent
+    bids, and the newest open campaigns flagged with has_applied.
+
+    ?campaigns=N (open campaigns to return), ?exclude_applied=true
+    """
+    permission_classes = [permissions.IsAuthenticated, IsClub]
+    RECENT_LIMIT = 10
+    DEFAULT_CAMPAIGNS = 5
+
+    def get(self, request):
+        club = request.user.club_profile
+        applications = Application.objects.filter(club=club)
+
+        winning = Q(status__in=Application.WINNING_STATUSES)
+        summary = applications.aggregate(
+            total=Count('id'),
+            wins=Count('id', filter=winning),
+            active=Count('id', filter=Q(status__in=[Application.Status.AWARDED, Application.Status.SUBMITTED]) & ~Q(campaign__status=Campaign.Status.COMPLETED)),
+            earnings=Sum('campaign__budget', filter=winning),
+            **{value: Count('id', filter=Q(status=value)) for value in Application.Status.values}
+        )
+        by_status = {value: summary.pop(value) for value in Application.Status.values}
+
+        rows = applications.select_related('club', 'campaign').order_by('-submitted_at', '-id')
+        active = rows.filter(winning)[:self.RECENT_LIMIT]
+        recent = rows.exclude(winning)[:self.RECENT_LIMIT]
+
+        try:
+            limit = min(int(request.query_params.get('campaigns', self.DEFAULT_CAMPAIGNS)), CampaignBoardPagination.max_page_size)
+        except ValueError:
+            return Response({"error": "campaigns must be a number."}, status=status.HTTP_400_BAD_REQUEST)
+        open_campaigns = Campaign.objects.filter(status=Campaign.Status.OPEN).select_related('company').annotate(
+            has_applied=Exists(Application.objects.filter(campaign=OuterRef('pk'), club=club))
+        ).order_by('-created_at', '-id')
+        if request.query_params.get('exclude_applied') in ('true', '1'):
+            open_campaigns = open_campaigns.filter(has_applied=False)
+
+        return Response({
+            "summary": {
+                "total": summary['total'],
+                "by_status": by_status,
+                "wins": summary['wins'],
+                "active": summary['active'],
+                "earnings": f"{summary['earnings'] or 0:.2f}",
+            },
+            "active_applications": MyApplicationSerializer(active, many=True).data,
+            "recent_applications": MyApplicationSerializer(recent, many=True).data,
+            "open_campaigns": DashboardCampaignSerializer(open_campaigns[:max(limit, 0)], many=True).data,
+        })
+
+class CompanyDashboardView(APIView):
+    """
+    Everything the company dashboard shows: every campaign of the company
+    with its applicant funnel, deliverables and spend, plus the treasury
+    summary.
+
+    The funnel comes from one grouped query; applications are counted
+    distinct because the deliverables join repeats them, and spend is a
+    correlated subquery so transactions don't multiply the joined rows.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsCompany]
+
+    def get(self, request):
+        company = request.user.company_profile
+
+        spend = (
+            Transaction.objects.filter(related_campaign=OuterRef('pk'), status=Transaction.Status.SUCCESS)
+            .order_by().values('related_campaign').annotate(total=Sum('amount')).values('total')
+        )
+        campaigns = list(
+            Campaign.objects.filter(company=company).select_related('company').annotate(
+                deliverables_submitted=Count('applications__deliverables', distinct=True),
+                spend=Coalesce(Subquery(spend), Value(Decimal('0')), output_field=DecimalField(max_digits=12, decimal_places=2)),
+                **{
+                    applicant_status_annotation(value): Count('applications', filter=Q(applications__status=value), distinct=True)
+                    for value in Application.Status.values
+                }
+            ).order_by('-created_at', '-id')
+        )
+
+        summary = {
+            "campaigns": len(campaigns),
+            "by_status": {value: 0 for value in Campaign.Status.values},
+            "applicants": 0,
+            "deliverables_submitted": 0,
+            "spend": Decimal('0'),
+        }
+        for campaign in campaigns:
+            summary["by_status"][campaign.status] += 1
+            summary["applicants"] += sum(getattr(campaign, applicant_status_annotation(value)) for value in Application.Status.values)
+            summary["deliverables_submitted"] += campaign.deliverables_submitted
+            summary["spend"] += campaign.spend
+        summary["spend"] = f"{summary['spend']:.2f}"
+
+        return Response({
+            "summary": summary,
+            "campaigns": CompanyDashboardCampaignSerializer(campaigns, many=True).data,
+            "treasury": treasury_summary(company),
+        })
+
+class CampaignChangesView(APIView):
+    """
+    Delta sync: campaigns and applications changed since ?since=<version>
+    (see changes.py). Keep the returned `version` for the next call and
+    repeat while has_more is true. ?limit= caps the rows per call; limit=0
+    only returns the current version.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        try:
+            since = int(request.query_params.get('since', 0))
+            limit = min(int(request.query_params.get('limit', getattr(settings, 'CHANGES_PAGE_SIZE', 500))), getattr(settings, 'CHANGES_MAX_PAGE_SIZE', 1000))
+        except ValueError:
+            return Response({"error": "since and limit must be numbers."}, status=status.HTTP_400_BAD_REQUEST)
+        if since < 0 or limit < 0:
+            return Response({"error": "since and limit can't be negative."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            result = changes.changes_since(request.user, since, limit)
+        except changes.ResyncRequired:
+            return Response({"error": "This version is too old, fetch everything again.", "code": "resync_required"}, status=status.HTTP_410_GONE)
+
+        return Response({
+            "version": result['version'],
+            "has_more": result['has_more'],
+            "campaigns": CampaignSerializer(result['campaigns'], many=True).data,
+            "applications": ApplicationSerializer(result['applications'], many=True, context={'request': request}).data,
+            "removed": {
+                "campaigns": result['removed_campaigns'],
+                "applications": result['removed_applications'],
+            },
+        })
 
 class ApplicationCreateView(generics.CreateAPIView):
     serializer_class = ApplicationSerializer
@@ -69,18 +382,92 @@ class ApplicationCreateView(generics.CreateAPIView):
         if campaign.status != Campaign.Status.OPEN:
              raise exceptions.PermissionDenied("This campaign is not open for applications.")
 
-        # Check for existing application
-        if Application.objects.filter(campaign=campaign, club=self.request.user.club_profile).exists():
+        # The unique (campaign, club) constraint rejects duplicates, even from
+        # two submits racing each other
+        try:
+            with transaction.atomic():
+                application = serializer.save(club=self.request.user.club_profile, campaign=campaign)
+                # Share the change_seq the application's save just took
+                opened = Campaign.objects.filter(pk=campaign.pk, status=Campaign.Status.OPEN).update(applicants_count=F('applicants_count') + 1, change_seq=application.change_seq)
+                if not opened:
+                    raise exceptions.PermissionDenied("This campaign is not open for applications.")
+        except IntegrityError:
             raise exceptions.PermissionDenied("You have already applied to this campaign.")
 
-        serializer.save(club=self.request.user.club_profile, campaign=campaign)
+class BulkApplicationCreateView(APIView):
+    """
+    Apply to several campaigns at once (e.g. a club's shortlist). Campaigns
+    already applied to, or no longer open, are skipped rather than failing
+    the whole request.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsClub]
+    MAX_CAMPAIGNS = 50
+
+    def post(self, request):
+        campaign_ids = request.data.get('campaign_ids')
+        message = request.data.get('message')
+
+        if not isinstance(campaign_ids, list) or not campaign_ids:
+            return Response({"error": "campaign_ids must be a non-empty list."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(campaign_ids) > self.MAX_CAMPAIGNS:
+            return Response({"error": f"You can apply to at most {self.MAX_CAMPAIGNS} campaigns at once."}, status=status.HTTP_400_BAD_REQUEST)
+        if not message:
+            return Response({"error": "A message is required."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            campaign_ids = {int(pk) for pk in campaign_ids}
+        except (TypeError, ValueError):
+            return Response({"error": "campaign_ids must be integers."}, status=status.HTTP_400_BAD_REQUEST)
+
+        club = request.user.club_profile
+        open_ids = set(Campaign.objects.filter(pk__in=campaign_ids, status=Campaign.Status.OPEN).values_list('pk', flat=True))
+
+        with transaction.atomic():
+            change_seq = next_change_seq()
+            Application.objects.bulk_create(
+                [Application(campaign_id=pk, club=club, message=message, change_seq=change_seq) for pk in sorted(open_ids)],
+                ignore_conflicts=True
+            )
+            # The unique constraint skipped existing applications, including
+            # ones a concurrent request just inserted; only the rows carrying
+            # this transaction's change_seq are ours
+            applied = set(Application.objects.filter(club=club, campaign_id__in=open_ids, change_seq=change_seq).values_list('campaign_id', flat=True))
+            if applied:
+                # bulk_create skips save() and signals; recount from the table so
+                # concurrent single applies can't skew the counters
+                rebuild_campaign_counters(Campaign.objects.filter(pk__in=applied), change_seq=change_seq)
+
+        return Response({
+            "applied": sorted(applied),
+            "already_applied": sorted(open_ids - applied),
+            "not_open": sorted(campaign_ids - open_ids),
+        }, status=status.HTTP_201_CREATED)
 
 class MyApplicationsView(generics.ListAPIView):
-    serializer_class = ApplicationSerializer
+    """
+    The club's own applications, newest first, in a fixed number of queries.
+
+    ?status=PENDING (repeatable). Deliverables are included unless the
+    caller asks for the light payload with ?exclude=deliverables.
+    """
+    serializer_class = MyApplicationSerializer
     permission_classes = [permissions.IsAuthenticated, IsClub]
+    pagination_class = MyApplicationsPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = ApplicationFilter
+
+    def include_deliverables(self):
+        return 'deliverables' not in self.request.query_params.get('exclude', '').split(',')
 
     def get_queryset(self):
-        return Application.objects.filter(club=self.request.user.club_profile)
+        queryset = Application.objects.filter(club=self.request.user.club_profile).select_related('club', 'campaign')
+        if self.include_deliverables():
+            queryset = queryset.prefetch_related(Prefetch('deliverables', queryset=Deliverable.objects.order_by('uploaded_at')))
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['include_deliverables'] = self.include_deliverables()
+        return context
 
 class AwardApplicationView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsCompany]
@@ -110,49 +497,205 @@ class AwardApplicationView(APIView):
                     "code": "payment_required"
                 }, status=status.HTTP_402_PAYMENT_REQUIRED)
         
-        # Update Application Statuses
-        application.status = Application.Status.AWARDED
-        application.save()
-
-        # Reject others
-        Application.objects.filter(campaign=campaign).exclude(id=application_id).update(status=Application.Status.NOT_SELECTED)
-        
-        # Update Campaign Status
-        campaign.status = Campaign.Status.IN_PROGRESS
-        campaign.save()
+        if campaign.status not in Campaign.AWARDABLE_STATUSES:
+            return Response({"error": "This campaign has already been awarded.", "code": "already_awarded"}, status=status.HTTP_409_CONFLICT)
+
+        with transaction.atomic():
+            # Compare-and-swap on the campaign row: of any number of concurrent
+            # awards exactly one still sees it awardable, the rest update nothing
+            claimed = Campaign.objects.filter(pk=campaign.pk, status__in=Campaign.AWARDABLE_STATUSES).update(
+                status=Campaign.Status.IN_PROGRESS,
+                awarded_club=application.club,
+                awarded_club_name=application.club.club_name,
+                updated_at=timezone.now()
+            )
+            if not claimed:
+                return Response({"error": "This campaign has already been awarded.", "code": "already_awarded"}, status=status.HTTP_409_CONFLICT)
+
+            # Update Application Statuses
+            Application.objects.filter(pk=application.pk).update(status=Application.Status.AWARDED)
+
+            # Reject others
+            others = Application.objects.filter(campaign=campaign).exclude(id=application_id)
+            not_selected = list(others.values_list('pk', 'club__user_id'))
+            others.update(status=Application.Status.NOT_SELECTED)
+
+            # One change_seq for the whole award, taken last so the counter
+            # row is only locked for the rest of this transaction
+            change_seq = next_change_seq()
+            Campaign.objects.filter(pk=campaign.pk).update(change_seq=change_seq)
+            Application.objects.filter(campaign=campaign).update(change_seq=change_seq)
+
+            # Bulk updates skip the post_save signals
+            board_cache.invalidate()
+
+            realtime.publish(
+                [company_profile.user_id, application.club.user_id], 'campaign.status',
+                campaign_id=campaign.pk, status=Campaign.Status.IN_PROGRESS,
+                awarded_application_id=application.pk, guild=application.club.club_name
+            )
+            realtime.publish(
+                [application.club.user_id], 'application.status',
+                campaign_id=campaign.pk, application_id=application.pk, status=Application.Status.AWARDED
+            )
+            for pk, user_id in not_selected:
+                realtime.publish(
+                    [user_id], 'application.status',
+                    campaign_id=campaign.pk, application_id=pk, status=Application.Status.NOT_SELECTED
+                )
 
         from users.models import SystemLog
         from users.utils import log_event
-        log_event(SystemLog.Category.MARKETPLACE, SystemLog.Level.SUCCESS, f"Contract Awarded: {application.club.club_name} -> {company_profile.company_name}")
+        log_event(SystemLog.Category.MARKETPLACE, SystemLog.Level.SUCCESS, f"Contract Awarded: {application.club.club_name} -> {company_profile.company_name}",
+                  event=SystemLog.Event.CONTRACT_AWARDED, actor=request.user, subject=application, amount=campaign.budget,
+                  campaign_id=campaign.pk, club_id=application.club_id)
 
         return Response({"message": "Application awarded successfully."}, status=status.HTTP_200_OK)
 
+def get_awarded_application(request, application_id):
+    application = get_object_or_404(Application.objects.select_related('club', 'campaign__company'), pk=application_id)
+
+    # Verify club ownership
+    if application.club != request.user.club_profile:
+        raise exceptions.PermissionDenied("You do not own this application.")
+
+    # Verify status
+    if application.status != Application.Status.AWARDED:
+        raise exceptions.PermissionDenied("You can only upload deliverables for awarded applications.")
+    return application
+
+def submit_deliverable(application, deliverable, request):
+    # Update Status to SUBMITTED
+    application.status = Application.Status.SUBMITTED
+    application.save(update_fields=['status'])
+
+    realtime.publish(
+        [application.club.user_id, application.campaign.company.user_id], 'application.status',
+        campaign_id=application.campaign_id, application_id=application.pk, status=Application.Status.SUBMITTED,
+        deliverable=DeliverableSerializer(deliverable, context={'request': request}).data
+    )
+
+    # Log Logic
+    from users.models import SystemLog
+    from users.utils import log_event
+    log_event(SystemLog.Category.MARKETPLACE, SystemLog.Level.INFO, f"Deliverable Submitted: {application.club.club_name} -> {application.campaign.title}",
+              event=SystemLog.Event.DELIVERABLE_SUBMITTED, actor=request.user, subject=deliverable,
+              campaign_id=application.campaign_id, application_id=application.pk)
+
 class DeliverableCreateView(generics.CreateAPIView):
     serializer_class = DeliverableSerializer
     permission_classes = [permissions.IsAuthenticated, IsClub]
 
     def perform_create(self, serializer):
-        application_id = self.kwargs['application_id']
-        application = get_object_or_404(Application, pk=application_id)
+        application = get_awarded_application(self.request, self.kwargs['application_id'])
 
-        # Verify club ownership
-        if application.club != self.request.user.club_profile:
-            raise exceptions.PermissionDenied("You do not own this application.")
+        # Identical files are stored once, under their SHA-256
+        uploaded = serializer.validated_data['file']
+        name, digest = uploads.store_content_addressed(uploaded, uploaded.name)
+        deliverable = serializer.save(application=application, file=name, sha256=digest, size=uploaded.size, original_name=uploaded.name)
 
-        # Verify status
-        if application.status != Application.Status.AWARDED:
-            raise exceptions.PermissionDenied("You can only upload deliverables for awarded applications.")
+        submit_deliverable(application, deliverable, self.request)
 
+class DeliverableUploadCreateView(generics.CreateAPIView):
+    """
+    Starts a resumable upload. The client then PUTs the file in chunks to
+    deliverable/uploads/<id>/ and POSTs to .../finalize/ once all bytes are in.
+    """
+    serializer_class = DeliverableUploadSerializer
+    permission_classes = [permissions.IsAuthenticated, IsClub]
+
+    def perform_create(self, serializer):
+        application = get_awarded_application(self.request, self.kwargs['application_id'])
         serializer.save(application=application)
-        
-        # Update Status to SUBMITTED
-        application.status = Application.Status.SUBMITTED
-        application.save()
-        
-        # Log Logic
-        from users.models import SystemLog
-        from users.utils import log_event
-        log_event(SystemLog.Category.MARKETPLACE, SystemLog.Level.INFO, f"Deliverable Submitted: {application.club.club_name} -> {application.campaign.title}")
+
+class DeliverableUploadView(APIView):
+    permission_classes = [permissions.IsAuthenticated, IsClub]
+
+    def get_queryset(self):
+        return DeliverableUpload.objects.filter(application__club__user=self.request.user)
+
+    def get(self, request, upload_id):
+        # Lets an interrupted client find out where to resume from
+        upload = get_object_or_404(self.get_queryset(), pk=upload_id)
+        return Response(DeliverableUploadSerializer(upload).data)
+
+    def put(self, request, upload_id):
+        try:
+            offset = int(request.headers.get('Upload-Offset', ''))
+        except ValueError:
+            return Response({"error": "Upload-Offset header is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            # One writer per upload; a retried chunk waits for the first attempt to finish
+            upload = get_object_or_404(self.get_queryset().select_for_update(), pk=upload_id)
+
+            if upload.status != DeliverableUpload.Status.OPEN:
+                return Response({"error": "Upload is already finalized."}, status=status.HTTP_409_CONFLICT)
+            if offset != upload.received_bytes:
+                return Response(
+                    {"error": "Offset does not match received bytes.", "received_bytes": upload.received_bytes},
+                    status=status.HTTP_409_CONFLICT
+                )
+
+            stream = request.stream
+            written = 0
+            if stream is not None:
+                try:
+                    written = uploads.append_chunk(upload, stream, upload.size - upload.received_bytes)
+                except uploads.UploadTooLarge:
+                    return Response({"error": "Chunk runs past the declared file size."}, status=status.HTTP_400_BAD_REQUEST)
+
+            upload.received_bytes += written
+            upload.save(update_fields=['received_bytes', 'updated_at'])
+
+        return Response(DeliverableUploadSerializer(upload).data)
+
+    patch = put
+
+class DeliverableUploadFinalizeView(APIView):
+    permission_classes = [permissions.IsAuthenticated, IsClub]
+
+    def post(self, request, upload_id):
+        with transaction.atomic():
+            upload = get_object_or_404(
+                DeliverableUpload.objects.select_for_update().filter(application__club__user=request.user),
+                pk=upload_id
+            )
+
+            # Finalizing twice (e.g. a retried request) returns the same deliverable
+            if upload.status == DeliverableUpload.Status.COMPLETED:
+                return Response(DeliverableSerializer(upload.deliverable).data, status=status.HTTP_200_OK)
+
+            application = get_awarded_application(request, upload.application_id)
+
+            if upload.received_bytes != upload.size:
+                return Response(
+                    {"error": "Upload is incomplete.", "received_bytes": upload.received_bytes, "size": upload.size},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            with open(uploads.temp_path(upload), 'rb') as f:
+                # Hashed as the chunks arrived; re-read only if they came through another worker
+                digest = uploads.finished_digest(upload) or uploads.sha256_file(f)
+                expected = request.data.get('sha256')
+                if expected and expected.lower() != digest:
+                    uploads.discard(upload)
+                    upload.received_bytes = 0
+                    upload.save(update_fields=['received_bytes', 'updated_at'])
+                    return Response({"error": "Checksum mismatch, upload restarted.", "sha256": digest}, status=status.HTTP_400_BAD_REQUEST)
+                name, digest = uploads.store_content_addressed(f, upload.filename, digest=digest)
+
+            deliverable = Deliverable.objects.create(
+                application=application, file=name, sha256=digest, size=upload.size, original_name=upload.filename
+            )
+            upload.status = DeliverableUpload.Status.COMPLETED
+            upload.deliverable = deliverable
+            upload.save(update_fields=['status', 'deliverable', 'updated_at'])
+
+            submit_deliverable(application, deliverable, request)
+
+        uploads.discard(upload)
+        return Response(DeliverableSerializer(deliverable).data, status=status.HTTP_201_CREATED)
 
 class MarkCampaignCompletedView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsCompany]
@@ -172,50 +715,125 @@ class MarkCampaignCompletedView(APIView):
         rating = request.data.get('rating')
         feedback = request.data.get('feedback')
 
-        try:
-            # Find the accepted application (could be AWARDED or SUBMITTED)
-            accepted_app = campaign.applications.filter(
-                status__in=[Application.Status.AWARDED, Application.Status.SUBMITTED]
-            ).first()
-
-            if accepted_app:
-                if rating:
-                    club = accepted_app.club
-                    from reviews.models import Review
-                    Review.objects.create(
-                        reviewer=request.user.company_profile,
-                        reviewee=club,
-                        campaign=campaign,
-                        rating=rating,
-                        comment=feedback or "No feedback provided."
-                    )
-                    # Recalculate Rank
-                    club.calculate_rank()
-                
-                # Mark Application as COMPLETED
-                accepted_app.status = Application.Status.COMPLETED
-                accepted_app.save()
-
-            else:
-                 print("No awarded/submitted application found for this campaign.")
-
-        except Exception as e:
-            print(f"Error processing review/completion: {e}")
-            # We don't fail the completion if review fails, but we log it.
-
-        # 2. MARK AS COMPLETED
-        campaign.status = Campaign.Status.COMPLETED
-        campaign.save()
-
-        # Generate Report
-        try:
-            report = generate_campaign_report(campaign)
-            report_url = report.generated_pdf.url
-        except Exception as e:
-            print(f"Report generation failed: {e}")
-            report_url = None
-        
+        completed_app = None
+        with transaction.atomic():
+            try:
+                # Savepoint so a failed review doesn't poison the completion below
+                with transaction.atomic():
+                    # Find the accepted application (could be AWARDED or SUBMITTED)
+                    accepted_app = campaign.applications.filter(
+                        status__in=[Application.Status.AWARDED, Application.Status.SUBMITTED]
+                    ).select_related('club').first()
+
+                    if accepted_app:
+                        if rating:
+                            club = accepted_app.club
+                            from reviews.models import Review
+                            Review.objects.create(
+                                reviewer=request.user.company_profile,
+                                reviewee=club,
+                                campaign=campaign,
+                                rating=rating,
+                                comment=feedback or "No feedback provided."
+                            )
+                            # Recalculate Rank
+                            club.calculate_rank()
+
+                        # Mark Application as COMPLETED
+                        accepted_app.status = Application.Status.COMPLETED
+                        accepted_app.save()
+
+                        # Keep the board's winning club column in sync
+                        campaign.set_awarded_club(accepted_app.club)
+                        completed_app = accepted_app
+
+                    else:
+                         print("No awarded/submitted application found for this campaign.")
+
+            except Exception as e:
+                print(f"Error processing review/completion: {e}")
+                # We don't fail the completion if review fails, but we log it.
+
+            # 2. MARK AS COMPLETED
+            campaign.status = Campaign.Status.COMPLETED
+            campaign.save()
+
+            club_user_id = completed_app.club.user_id if completed_app else None
+            realtime.publish(
+                [request.user.pk, club_user_id], 'campaign.status',
+                campaign_id=campaign.pk, status=Campaign.Status.COMPLETED
+            )
+            if completed_app:
+                realtime.publish(
+                    [request.user.pk, club_user_id], 'application.status',
+                    campaign_id=campaign.pk, application_id=completed_app.pk, status=Application.Status.COMPLETED
+                )
+
+        # Generate Report (background job; poll ReportStatusView for the PDF)
+        report = enqueue_report(campaign)
+        report_data = ReportSerializer(report).data
+
         return Response({
             "message": "Mission Accomplished. Campaign marked as completed.",
-            "report_url": report_url
+            "report_job_id": report.id,
+            "report_status": report_data['status'],
+            "report_url": report_data['report_url']
         }, status=status.HTTP_200_OK)
+
+class ReportStatusView(generics.RetrieveAPIView):
+    """
+    Poll a report job. `report_url` is set once status is READY.
+    """
+    serializer_class = ReportSerializer
+    permission_classes = [permissions.IsAuthenticated, IsCompany]
+
+    def get_queryset(self):
+        return Report.objects.filter(campaign__company=self.request.user.company_profile)
+
+class EventStreamView(View):
+    """
+    Server-sent events with the signed-in user's campaign and application
+    status changes (see realtime.py).
+
+    Needs the ASGI server. The stream ends after REALTIME_STREAM_TIMEOUT
+    seconds so the browser reconnects and the token is checked again.
+    """
+    async def get(self, request):
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse({"error": "The event stream is only served over ASGI."}, status=status.HTTP_501_NOT_IMPLEMENTED)
+
+        user = await sync_to_async(self.authenticate)(request)
+        if user is None:
+            return JsonResponse({"error": "Authentication credentials were not provided."}, status=status.HTTP_401_UNAUTHORIZED)
+
+        response = StreamingHttpResponse(self.stream(user.pk), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def authenticate(self, request):
+        # Same JWT header / cookie authentication as the API views
+        drf_request = Request(request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+        try:
+            user = drf_request.user
+        except exceptions.AuthenticationFailed:
+            return None
+        return user if user.is_authenticated else None
+
+    async def stream(self, user_id):
+        hub = realtime.get_hub()
+        subscription = hub.subscribe(user_id)
+        loop = asyncio.get_running_loop()
+        heartbeat = getattr(settings, 'REALTIME_HEARTBEAT_SECONDS', 15)
+        closes_at = loop.time() + getattr(settings, 'REALTIME_STREAM_TIMEOUT', 30 * 60)
+        try:
+            yield f"retry: {getattr(settings, 'REALTIME_RETRY_MS', 3000)}\n: connected\n\n"
+            while loop.time() < closes_at:
+                try:
+                    event = await subscription.get(min(heartbeat, max(closes_at - loop.time(), 0)))
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield realtime.format_event(event)
+        finally:
+            hub.unsubscribe(subscription)
@@ -30,3 +30,34 @@ class MockStripeService:
     def debug_set_status(cls, intent_id, status):
          if intent_id in cls._intents:
             cls._intents[intent_id]['status'] = status
+
+
+def treasury_summary(company):
+    """
+    Serialized treasury data for a company: tier, subscription, the last
+    few transactions and balance. Shared by the treasury page and the
+    company dashboard.
+    """
+    from .models import Subscription, Transaction
+    from .serializers import TransactionSerializer, TreasurySummarySerializer
+
+    # Get/Create Mock Subscription (for MVP)
+    subscription, _ = Subscription.objects.get_or_create(
+        company=company,
+        defaults={
+            'plan_name': company.tier,
+            'status': Subscription.Status.ACTIVE,
+            'start_date': "2024-01-01T00:00:00Z",
+            'end_date': "2025-01-01T00:00:00Z"
+        }
+    )
+
+    transactions = Transaction.objects.filter(company=company).order_by('-created_at')[:5]
+
+    data = {
+        "tier": company.tier,
+        "subscription": subscription,
+        "transactions": TransactionSerializer(transactions, many=True).data,
+        "balance": 15000.00 # Mock Balance
+    }
+    return TreasurySummarySerializer(data).data
@@ -9,7 +9,7 @@ from campaigns.models import Campaign
 from .serializers import TransactionSerializer, TreasurySummarySerializer, SubscriptionSerializer
 from .serializers import TransactionSerializer, TreasurySummarySerializer, SubscriptionSerializer
 from .models import Transaction, Subscription
-from .services import MockStripeService
+from .services import MockStripeService, treasury_summary
 
 class CreatePaymentIntentView(APIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -87,10 +87,14 @@ class ConfirmPaymentView(APIView):
         if transaction.transaction_type == Transaction.Type.SUBSCRIPTION and transaction.amount >= 499:
              transaction.company.tier = CompanyProfile.Tier.PRO
              transaction.company.save()
-             log_event(SystemLog.Category.GROWTH, SystemLog.Level.SUCCESS, f"Company Upgraded to PRO: {transaction.company.company_name}")
+             log_event(SystemLog.Category.GROWTH, SystemLog.Level.SUCCESS, f"Company Upgraded to PRO: {transaction.company.company_name}",
+                       event=SystemLog.Event.COMPANY_UPGRADED, actor=transaction.company.user_id, subject=transaction.company,
+                       amount=transaction.amount, tier=transaction.company.tier)
 
         # Log Logic
-        log_event(SystemLog.Category.FINANCIAL, SystemLog.Level.SUCCESS, f"Payment Received: RM {transaction.amount} from {transaction.company.company_name}")
+        log_event(SystemLog.Category.FINANCIAL, SystemLog.Level.SUCCESS, f"Payment Received: RM {transaction.amount} from {transaction.company.company_name}",
+                  event=SystemLog.Event.PAYMENT_RECEIVED, actor=transaction.company.user_id, subject=transaction,
+                  amount=transaction.amount, transaction_type=transaction.transaction_type)
 
         return Response({"status": "SUCCESS", "message": "Payment confirmed"})
 
@@ -112,30 +116,7 @@ class TreasurySummaryView(APIView):
         if request.user.role != User.Role.COMPANY:
              return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
 
-        company = request.user.company_profile
-        
-        # Get/Create Mock Subscription (for MVP)
-        subscription, _ = Subscription.objects.get_or_create(
-            company=company,
-            defaults={
-                'plan_name': company.tier,
-                'status': Subscription.Status.ACTIVE,
-                'start_date': "2024-01-01T00:00:00Z",
-                'end_date': "2025-01-01T00:00:00Z"
-            }
-        )
-
-        transactions = Transaction.objects.filter(company=company).order_by('-created_at')[:5]
-        
-        data = {
-            "tier": company.tier,
-            "subscription": subscription,
-            "transactions": TransactionSerializer(transactions, many=True).data,
-            "balance": 15000.00 # Mock Balance
-        }
-        
-        serializer = TreasurySummarySerializer(data)
-        return Response(serializer.data)
+        return Response(treasury_summary(request.user.company_profile))
 
 class CreateTransactionView(generics.CreateAPIView):
     """
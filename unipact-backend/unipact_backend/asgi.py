@@ -2,6 +2,8 @@
 ASGI config for unipact_backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Serve it with an ASGI server (e.g. ``uvicorn unipact_backend.asgi:application``)
+for the live event stream at /api/campaigns/events/.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
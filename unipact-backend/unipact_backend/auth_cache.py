@@ -0,0 +1,144 @@
+"""
+In-process caches for request authentication.
+
+`tokens` maps the SHA-256 digest of an access token that already passed
+signature and claim checks to the validated token, until the token expires,
+so the same token sent again is not decoded and verified again. Token
+classes that check a blacklist on every use are only trusted for
+AUTH_TOKEN_CACHE_BLACKLIST_RECHECK seconds at a time, so blacklisting one
+takes effect within that interval. Plain access tokens have no blacklist:
+logout clears the cookies, and a copied access token stays valid until it
+expires, cached or not.
+
+`principals` keeps recently authenticated users, with their company / club
+profile preloaded, under (user id, token jti). Entries live for
+AUTH_PRINCIPAL_CACHE_TTL seconds and never past the token's expiry. Saving
+or deleting a user or profile drops that user's entries in this process;
+other processes only catch up within the TTL, so a deactivated user can
+still authenticate there until then. That is why the TTL defaults to 0
+(off) and should stay short where it is turned on.
+
+Users are stored pickled, so every request gets its own instance and views
+can't change a cached one.
+"""
+import copy
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from rest_framework_simplejwt.utils import aware_utcnow
+
+
+class ExpiringLRU:
+    """
+    Thread-safe LRU mapping whose entries also expire at a given time.
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, now=None):
+        now = time.time() if now is None else now
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value, expires_at):
+        with self.lock:
+            self.entries[key] = (value, expires_at)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def discard(self, matches):
+        """
+        Drop every entry for which matches(key, value) is true.
+        """
+        with self.lock:
+            for key in [key for key, (value, _) in self.entries.items() if matches(key, value)]:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'max_entries': self.max_entries, 'hits': self.hits, 'misses': self.misses}
+
+
+class VerifiedTokenCache(ExpiringLRU):
+    @staticmethod
+    def digest(raw_token):
+        if isinstance(raw_token, str):
+            raw_token = raw_token.encode()
+        return hashlib.sha256(raw_token).digest()
+
+    def get_token(self, raw_token):
+        if not self.max_entries:
+            return None
+        token = self.get(self.digest(raw_token))
+        if token is None:
+            return None
+        # A fresh wrapper per request, as decoding would give
+        token = copy.copy(token)
+        token.payload = dict(token.payload)
+        token.current_time = aware_utcnow()
+        return token
+
+    def set_token(self, raw_token, token):
+        if not self.max_entries:
+            return
+        expires_at = token['exp']
+        if hasattr(token, 'check_blacklist'):
+            expires_at = min(expires_at, time.time() + getattr(settings, 'AUTH_TOKEN_CACHE_BLACKLIST_RECHECK', 30))
+        self.set(self.digest(raw_token), token, expires_at)
+
+
+class PrincipalCache(ExpiringLRU):
+    def ttl(self):
+        return getattr(settings, 'AUTH_PRINCIPAL_CACHE_TTL', 0)
+
+    def get_user(self, user_id, jti):
+        if not self.ttl() or jti is None:
+            return None
+        # Keys hold the user id as a string, as the token's user_id claim does
+        entry = self.get((str(user_id), jti))
+        return pickle.loads(entry[0]) if entry is not None else None
+
+    def set_user(self, user, jti, token_expires_at):
+        ttl = self.ttl()
+        if not ttl or jti is None:
+            return
+        # Remember which profiles the entry holds: a club can change owner
+        profiles = set()
+        for kind in ('company_profile', 'club_profile'):
+            profile = user._state.fields_cache.get(kind)
+            if profile is not None:
+                profiles.add((kind, profile.pk))
+        self.set((str(user.pk), jti), (pickle.dumps(user), profiles), min(time.time() + ttl, token_expires_at))
+
+    def invalidate_user(self, user_id):
+        user_id = str(user_id)
+        self.discard(lambda key, value: key[0] == user_id)
+
+    def invalidate_profile(self, kind, profile_id, user_id):
+        user_id = str(user_id)
+        self.discard(lambda key, value: key[0] == user_id or (kind, profile_id) in value[1])
+
+
+tokens = VerifiedTokenCache(getattr(settings, 'AUTH_TOKEN_CACHE_MAX_ENTRIES', 10000))
+principals = PrincipalCache(getattr(settings, 'AUTH_PRINCIPAL_CACHE_MAX_ENTRIES', 10000))
@@ -1,5 +1,10 @@
+from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
 from rest_framework.exceptions import AuthenticationFailed
+from .auth_cache import principals, tokens
 
 class CookieJWTAuthentication(JWTAuthentication):
     def authenticate(self, request):
@@ -19,3 +24,44 @@ class CookieJWTAuthentication(JWTAuthentication):
         except AuthenticationFailed:
             return None
 
+    def get_validated_token(self, raw_token):
+        """
+        Tokens already verified in this process are served from the
+        verified-token cache until they expire.
+        """
+        validated_token = tokens.get_token(raw_token)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            tokens.set_token(raw_token, validated_token)
+        return validated_token
+
+    def get_user(self, validated_token):
+        """
+        simplejwt's lookup, but loading the company / club profile in the
+        same query (permissions and most views read one), and served from
+        the principal cache when it is enabled.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        user = principals.get_user(user_id, jti)
+        if user is not None:
+            return user
+
+        try:
+            user = self.user_model.objects.select_related('company_profile', 'club_profile').get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if getattr(api_settings, 'CHECK_REVOKE_TOKEN', False):
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        principals.set_user(user, jti, validated_token['exp'])
+        return user
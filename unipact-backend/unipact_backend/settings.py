@@ -88,6 +88,22 @@ DATABASES = {
 }
 
 
+# Cache
+# Local memory per process by default; set REDIS_URL to share the cache between workers
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'unipact',
+    }
+}
+
+if os.getenv('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL'),
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -136,6 +152,9 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Custom User Model
 AUTH_USER_MODEL = 'users.User'
 
+# Login loads the role profile with the user
+AUTHENTICATION_BACKENDS = ['users.backends.ProfileModelBackend']
+
 # REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -146,6 +165,52 @@ REST_FRAMEWORK = {
     ),
 }
 
+# SystemLog writes queued and bulk-written by a background thread (see users/log_sink.py)
+SYSTEM_LOG_BUFFERED = os.environ.get('SYSTEM_LOG_BUFFERED', '') == '1'
+SYSTEM_LOG_DURABLE = True # CRITICAL entries are still written synchronously
+SYSTEM_LOG_MAX_QUEUE = 10000
+SYSTEM_LOG_BATCH_SIZE = 200
+SYSTEM_LOG_FLUSH_INTERVAL = 1.0 # seconds
+SYSTEM_LOG_PUT_TIMEOUT = 0.05 # seconds a request waits on a full queue before writing a batch itself
+
+# Quest Board (cursor pagination)
+CAMPAIGN_BOARD_PAGE_SIZE = 20
+CAMPAIGN_BOARD_MAX_PAGE_SIZE = 100
+CAMPAIGN_BOARD_CACHE_ALIAS = 'default'
+CAMPAIGN_BOARD_CACHE_TIMEOUT = 300 # seconds; writes invalidate earlier via generation bump
+# In-process array-backed index of OPEN campaigns (see campaigns/read_model.py)
+CAMPAIGN_READ_MODEL_ENABLED = os.environ.get('CAMPAIGN_READ_MODEL_ENABLED', '') == '1'
+CAMPAIGN_READ_MODEL_MAX_ROWS = 200000 # ~37 bytes each; above this the board uses the ORM
+CAMPAIGN_READ_MODEL_RECHECK_SECONDS = 1.0 # how stale another worker's writes can look
+
+# Campaign report jobs (see campaigns/jobs.py)
+REPORT_JOB_WORKERS = 2
+REPORT_JOBS_EAGER = False
+
+# A club's own applications (cursor pagination)
+CLUB_APPLICATIONS_PAGE_SIZE = 20
+CLUB_APPLICATIONS_MAX_PAGE_SIZE = 100
+
+# Chunked deliverable uploads (see campaigns/uploads.py)
+DELIVERABLE_UPLOAD_TEMP_DIR = BASE_DIR / 'upload_tmp'
+DELIVERABLE_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024 # recommended client chunk
+DELIVERABLE_UPLOAD_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+# Delta sync (see campaigns/changes.py)
+CHANGES_PAGE_SIZE = 500
+CHANGES_MAX_PAGE_SIZE = 1000
+CHANGE_TOMBSTONE_RETENTION_DAYS = 30 # prune_change_tombstones; older versions get 410 resync_required
+
+# Live status push over server-sent events (see campaigns/realtime.py; needs ASGI)
+REALTIME_HUB = 'campaigns.realtime.InProcessHub' # swap for a broker-backed hub with several workers
+REALTIME_HEARTBEAT_SECONDS = 15
+REALTIME_STREAM_TIMEOUT = 30 * 60 # seconds; the browser reconnects and re-authenticates
+REALTIME_STREAM_MAX_QUEUE = 100 # events buffered per stream before it is told to resync
+
+# Campaign applicants list (cursor pagination)
+CAMPAIGN_APPLICANTS_PAGE_SIZE = 20
+CAMPAIGN_APPLICANTS_MAX_PAGE_SIZE = 100
+
 # CORS
 # CORS_ALLOW_ALL_ORIGINS = True # Disable for credentials
 CORS_ALLOW_CREDENTIALS = True
@@ -162,3 +227,16 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
+
+# Authenticated users cached per (user, token) in each process (see unipact_backend/auth_cache.py)
+# Off by default: other processes only see user/profile changes (role, is_active...) after the TTL,
+# so enable it (e.g. 30) only where that delay is acceptable
+AUTH_PRINCIPAL_CACHE_TTL = int(os.environ.get('AUTH_PRINCIPAL_CACHE_TTL', '0')) # seconds; 0 disables
+AUTH_PRINCIPAL_CACHE_MAX_ENTRIES = 10000
+# Access tokens already verified, kept until they expire; 0 disables
+AUTH_TOKEN_CACHE_MAX_ENTRIES = 10000
+AUTH_TOKEN_CACHE_BLACKLIST_RECHECK = 30 # seconds; only for token classes checked against a blacklist
+
+# /api/users/me/ bodies cached per profile version (see users/profile_cache.py)
+USER_PROFILE_CACHE_ALIAS = 'default'
+USER_PROFILE_CACHE_TIMEOUT = 300 # seconds; profile writes invalidate earlier via version bump
@@ -0,0 +1,192 @@
+"""
+Buffered writer for SystemLog.
+
+With SYSTEM_LOG_BUFFERED on, log_event() only queues the entry (once the
+surrounding transaction commits, so rolled-back work still leaves no log)
+and a background thread writes the queue with bulk_create, every
+SYSTEM_LOG_BATCH_SIZE entries or SYSTEM_LOG_FLUSH_INTERVAL seconds. One
+write transaction per batch instead of one per event keeps logging off the
+SQLite write lock on login, payment and award requests.
+
+The queue is bounded. When it is full a request waits up to
+SYSTEM_LOG_PUT_TIMEOUT seconds for room and then writes a batch itself,
+so a stalled writer slows requests down rather than losing events. Should
+the queue still be full after that (other requests refilled it first), the
+entry is dropped and counted instead of blocking the request. What is
+still queued at interpreter exit is flushed. CRITICAL entries are written
+synchronously while SYSTEM_LOG_DURABLE is on, so they survive a crash.
+
+Buffered entries are lost if the process is killed, which is why the
+buffer is off by default.
+"""
+import atexit
+import queue
+import threading
+import time
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+
+def buffered():
+    return getattr(settings, 'SYSTEM_LOG_BUFFERED', False)
+
+
+def durable():
+    return getattr(settings, 'SYSTEM_LOG_DURABLE', True)
+
+
+class LogBuffer:
+    def __init__(self, max_queue, batch_size, flush_interval, put_timeout):
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.thread = None
+        self.written = 0
+        self.batches = 0
+        self.inline_flushes = 0
+        self.failures = 0
+        self.dropped = 0
+
+    def put(self, entry):
+        self.start()
+        try:
+            self.queue.put(entry, timeout=self.put_timeout)
+        except queue.Full:
+            # Back-pressure: make room by writing a batch on this thread
+            with self.lock:
+                self.inline_flushes += 1
+            self.write(self.drain(self.batch_size))
+            try:
+                self.queue.put(entry, timeout=self.put_timeout)
+            except queue.Full:
+                with self.lock:
+                    self.dropped += 1
+                print(f"Logging Failed: queue full, dropped entry: {entry.message}")
+
+    def start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.stopping.clear()
+                self.thread = threading.Thread(target=self.run, name='system-log-writer', daemon=True)
+                self.thread.start()
+
+    def run(self):
+        while not self.stopping.is_set():
+            batch = self.collect()
+            if batch:
+                # The writer thread has its own DB connection; don't leak it
+                close_old_connections()
+                try:
+                    self.write(batch)
+                finally:
+                    close_old_connections()
+
+    def collect(self):
+        """
+        Wait for up to batch_size entries, at most flush_interval seconds
+        after the first one arrived.
+        """
+        try:
+            batch = [self.queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def drain(self, limit=None):
+        batch = []
+        while limit is None or len(batch) < limit:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def write(self, batch):
+        from .models import SystemLog
+        if not batch:
+            return
+        try:
+            SystemLog.objects.bulk_create(batch, batch_size=self.batch_size)
+        except Exception as e:
+            with self.lock:
+                self.failures += 1
+            print(f"Logging Failed: {e} ({len(batch)} entries)")
+            return
+        with self.lock:
+            self.written += len(batch)
+            self.batches += 1
+
+    def flush(self):
+        """
+        Write everything queued so far on the calling thread.
+        """
+        while True:
+            batch = self.drain(self.batch_size)
+            if not batch:
+                return
+            self.write(batch)
+
+    def stop(self, timeout=5):
+        self.stopping.set()
+        thread = self.thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush()
+
+    def stats(self):
+        with self.lock:
+            return {
+                'buffered': buffered(),
+                'queued': self.queue.qsize(),
+                'written': self.written,
+                'batches': self.batches,
+                'inline_flushes': self.inline_flushes,
+                'failures': self.failures,
+                'dropped': self.dropped,
+            }
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            _buffer = LogBuffer(
+                max_queue=getattr(settings, 'SYSTEM_LOG_MAX_QUEUE', 10000),
+                batch_size=getattr(settings, 'SYSTEM_LOG_BATCH_SIZE', 200),
+                flush_interval=getattr(settings, 'SYSTEM_LOG_FLUSH_INTERVAL', 1.0),
+                put_timeout=getattr(settings, 'SYSTEM_LOG_PUT_TIMEOUT', 0.05),
+            )
+            atexit.register(_buffer.stop)
+        return _buffer
+
+
+def write(category, level, message, **fields):
+    """
+    Record a SystemLog entry: queued when buffering is on, otherwise (and
+    for CRITICAL entries in durable mode) written right away. `fields` are
+    the structured SystemLog columns (event, actor_id, subject_type, ...).
+    """
+    from .models import SystemLog
+    entry = SystemLog(category=category, level=level, message=message, created_at=timezone.now(), **fields)
+    if not buffered() or (durable() and level == SystemLog.Level.CRITICAL):
+        entry.save()
+        return
+    sink = get_buffer()
+    transaction.on_commit(lambda: sink.put(entry))
@@ -0,0 +1,51 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import AccessToken
+from unipact_backend.auth_cache import principals, tokens
+from unipact_backend.authentication import CookieJWTAuthentication
+from users.models import User, CompanyProfile
+
+
+class Command(BaseCommand):
+    help = 'Measures per-request authentication overhead with and without the token / principal caches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000, help='Authentications per scenario')
+        # The principal cache is off by default; measure it as a deployment enabling it would
+        parser.add_argument('--principal-ttl', type=int, default=30, help='AUTH_PRINCIPAL_CACHE_TTL for the run')
+
+    def handle(self, *args, **options):
+        count = options['requests']
+        scenarios = [
+            # name, caches emptied before every request
+            ('no caches', (tokens, principals)),
+            ('principal cache only', (tokens,)),
+            ('token + principal caches', ()),
+        ]
+        # The user only exists for the run
+        with override_settings(AUTH_PRINCIPAL_CACHE_TTL=options['principal_ttl']), transaction.atomic():
+            user = User.objects.create_user(username='benchmark-auth@example.com', email='benchmark-auth@example.com', password=None, role=User.Role.COMPANY)
+            CompanyProfile.objects.create(user=user, company_name='Benchmark')
+            request = RequestFactory().get('/api/users/me/')
+            request.COOKIES['access_token'] = str(AccessToken.for_user(user))
+            authenticator = CookieJWTAuthentication()
+
+            tokens.clear()
+            principals.clear()
+            for name, cold in scenarios:
+                authenticator.authenticate(request)
+                with CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    for _ in range(count):
+                        for cache in cold:
+                            cache.clear()
+                        authenticator.authenticate(request)
+                    elapsed = time.perf_counter() - start
+                self.stdout.write(f"{name:<26} {elapsed / count * 1e6:8.1f} us/request  {len(queries) / count:.2f} queries/request")
+            transaction.set_rollback(True)
+
+        tokens.clear()
+        principals.clear()
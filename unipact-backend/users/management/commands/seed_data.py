@@ -184,4 +184,8 @@ class Command(BaseCommand):
                         )
                         total_apps += 1
 
+        # Applications were inserted directly, so sync the board counters
+        from campaigns.utils import rebuild_campaign_counters
+        rebuild_campaign_counters()
+
         self.stdout.write(f"Created {total_campaigns} Campaigns and {total_apps} Applications.")
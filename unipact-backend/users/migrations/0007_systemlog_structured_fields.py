@@ -0,0 +1,57 @@
+# Generated by Django 6.0 on 2026-10-18 18:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_systemlog_created_at_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='systemlog',
+            name='actor',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='system_logs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='systemlog',
+            name='amount',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='systemlog',
+            name='event',
+            field=models.CharField(blank=True, choices=[('user.login', 'Login'), ('user.login_failed', 'Failed login'), ('user.active_changed', 'User blocked / unblocked'), ('company.joined', 'Company joined'), ('company.high_risk_registration', 'High risk registration'), ('company.upgraded', 'Company upgraded'), ('club.joined', 'Club joined'), ('club.ownership_transferred', 'Club ownership transferred'), ('admin.entity_reviewed', 'Entity reviewed'), ('payment.received', 'Payment received'), ('campaign.posted', 'Quest posted'), ('campaign.awarded', 'Contract awarded'), ('campaign.deadline_sweep', 'Deadline sweep'), ('deliverable.submitted', 'Deliverable submitted')], default='', max_length=40),
+        ),
+        migrations.AddField(
+            model_name='systemlog',
+            name='payload',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='systemlog',
+            name='subject_id',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='systemlog',
+            name='subject_type',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='systemlog',
+            index=models.Index(fields=['category', 'created_at'], name='systemlog_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemlog',
+            index=models.Index(fields=['actor', 'created_at'], name='systemlog_actor_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='systemlog',
+            index=models.Index(fields=['event', 'created_at'], name='systemlog_event_idx'),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 6.0 on 2026-10-18 19:20
+
+import re
+from decimal import Decimal
+from django.db import migrations
+
+# Messages written before SystemLog had structured fields, and the event and
+# payload each one maps to. Rows matching none of them keep an empty event
+LEGACY_MESSAGES = [
+    (r'User Login: (?P<email>.+)', 'user.login', lambda m: {'email': m['email']}),
+    (r'Failed Login: (?P<email>.+)', 'user.login_failed', lambda m: {'email': m['email']}),
+    (r'Admin (?P<status>Blocked|Unblocked) User: (?P<email>.+)', 'user.active_changed',
+     lambda m: {'email': m['email'], 'is_active': m['status'] == 'Unblocked'}),
+    (r'New Company Joined: (?P<company_name>.+)', 'company.joined', lambda m: {'company_name': m['company_name']}),
+    (r'High Risk Reg: (?P<email>.+) \(Public Domain\)', 'company.high_risk_registration', lambda m: {'email': m['email']}),
+    (r'Company Upgraded to PRO: .+', 'company.upgraded', lambda m: {'tier': 'PRO'}),
+    (r'New Club Joined: (?P<club_name>.+) \((?P<university>[^()]*)\)', 'club.joined',
+     lambda m: {'club_name': m['club_name'], 'university': m['university']}),
+    (r'Club Ownership Transferred: .+ from (?P<from_email>\S+) -> (?P<to_email>\S+)', 'club.ownership_transferred',
+     lambda m: {'from_email': m['from_email'], 'to_email': m['to_email']}),
+    (r'Admin (?P<action>APPROVE|REJECT|HIGH_RISK)D entity (?P<entity_id>\d+) \((?P<entity_type>COMPANY|CLUB)\)', 'admin.entity_reviewed',
+     lambda m: {'action': m['action'].lower(), 'entity_type': m['entity_type']}),
+    (r'Payment Received: RM (?P<amount>[\d.]+) from .+', 'payment.received', lambda m: {}),
+    (r"New Quest: '(?P<title>.*)' posted by .+", 'campaign.posted', lambda m: {'title': m['title']}),
+    (r'Contract Awarded: .+ -> .+', 'campaign.awarded', lambda m: {}),
+    (r'Deadline Sweep: closed (?P<closed>\d+) expired campaigns', 'campaign.deadline_sweep', lambda m: {'closed': int(m['closed'])}),
+    (r'Deliverable Submitted: .+ -> .+', 'deliverable.submitted', lambda m: {}),
+]
+LEGACY_MESSAGES = [(re.compile(pattern, re.DOTALL), event, payload) for pattern, event, payload in LEGACY_MESSAGES]
+
+ENTITY_SUBJECTS = {'COMPANY': 'users.companyprofile', 'CLUB': 'users.clubprofile'}
+
+
+def parse_legacy_entry(entry):
+    """
+    Fill the structured fields of a pre-0007 entry from its message.
+    Returns False when the message matches no known format.
+    """
+    for pattern, event, payload in LEGACY_MESSAGES:
+        match = pattern.fullmatch(entry.message)
+        if match is None:
+            continue
+        entry.event = event
+        entry.payload = payload(match)
+        groups = match.groupdict()
+        if groups.get('amount'):
+            entry.amount = Decimal(groups['amount'])
+        if groups.get('entity_id'):
+            entry.subject_type = ENTITY_SUBJECTS[groups['entity_type']]
+            entry.subject_id = int(groups['entity_id'])
+        return True
+    return False
+
+
+def backfill_events(apps, schema_editor):
+    SystemLog = apps.get_model('users', 'SystemLog')
+    fields = ['event', 'payload', 'amount', 'subject_type', 'subject_id']
+    batch = []
+    for entry in SystemLog.objects.filter(event='').iterator(chunk_size=2000):
+        if parse_legacy_entry(entry):
+            batch.append(entry)
+        if len(batch) >= 500:
+            SystemLog.objects.bulk_update(batch, fields)
+            batch = []
+    if batch:
+        SystemLog.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_systemlog_structured_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_events, migrations.RunPython.noop),
+    ]
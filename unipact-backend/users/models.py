@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 class User(AbstractUser):
@@ -132,13 +133,77 @@ class SystemLog(models.Model):
         WARNING = 'WARNING', _('Warning')
         CRITICAL = 'CRITICAL', _('Critical')
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    class Event(models.TextChoices):
+        LOGIN = 'user.login', _('Login')
+        LOGIN_FAILED = 'user.login_failed', _('Failed login')
+        USER_ACTIVE_CHANGED = 'user.active_changed', _('User blocked / unblocked')
+        COMPANY_JOINED = 'company.joined', _('Company joined')
+        HIGH_RISK_REGISTRATION = 'company.high_risk_registration', _('High risk registration')
+        COMPANY_UPGRADED = 'company.upgraded', _('Company upgraded')
+        CLUB_JOINED = 'club.joined', _('Club joined')
+        OWNERSHIP_TRANSFERRED = 'club.ownership_transferred', _('Club ownership transferred')
+        ENTITY_REVIEWED = 'admin.entity_reviewed', _('Entity reviewed')
+        PAYMENT_RECEIVED = 'payment.received', _('Payment received')
+        QUEST_POSTED = 'campaign.posted', _('Quest posted')
+        CONTRACT_AWARDED = 'campaign.awarded', _('Contract awarded')
+        DEADLINE_SWEEP = 'campaign.deadline_sweep', _('Deadline sweep')
+        DELIVERABLE_SUBMITTED = 'deliverable.submitted', _('Deliverable submitted')
+
+    # Keys and types each event's payload may hold
+    PAYLOAD_SCHEMA = {
+        Event.LOGIN: {'email': str},
+        Event.LOGIN_FAILED: {'email': str},
+        Event.USER_ACTIVE_CHANGED: {'email': str, 'is_active': bool},
+        Event.COMPANY_JOINED: {'company_name': str},
+        Event.HIGH_RISK_REGISTRATION: {'email': str},
+        Event.COMPANY_UPGRADED: {'tier': str},
+        Event.CLUB_JOINED: {'club_name': str, 'university': str},
+        Event.OWNERSHIP_TRANSFERRED: {'from_email': str, 'to_email': str},
+        Event.ENTITY_REVIEWED: {'action': str, 'entity_type': str},
+        Event.PAYMENT_RECEIVED: {'transaction_type': str},
+        Event.QUEST_POSTED: {'title': str},
+        Event.CONTRACT_AWARDED: {'campaign_id': int, 'club_id': int},
+        Event.DEADLINE_SWEEP: {'closed': int},
+        Event.DELIVERABLE_SUBMITTED: {'campaign_id': int, 'application_id': int},
+    }
+
+    # Set when the event happens, not when a batched write reaches the table
+    created_at = models.DateTimeField(default=timezone.now)
     category = models.CharField(max_length=20, choices=Category.choices, default=Category.GROWTH)
     level = models.CharField(max_length=20, choices=Level.choices, default=Level.INFO)
     message = models.TextField()
 
+    # Structured fields, so dashboards group by columns instead of parsing messages
+    event = models.CharField(max_length=40, choices=Event.choices, blank=True, default='')
+    # Covered by systemlog_actor_idx
+    actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='system_logs', db_index=False)
+    subject_type = models.CharField(max_length=50, blank=True, default='') # app_label.model
+    subject_id = models.PositiveBigIntegerField(null=True, blank=True)
+    amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    payload = models.JSONField(default=dict, blank=True)
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['category', 'created_at'], name='systemlog_category_idx'),
+            models.Index(fields=['actor', 'created_at'], name='systemlog_actor_idx'),
+            models.Index(fields=['event', 'created_at'], name='systemlog_event_idx'),
+        ]
+
+    @classmethod
+    def check_payload(cls, event, payload):
+        """
+        Raise ValueError unless every payload key belongs to the event's
+        schema with a value of the declared type (None is allowed).
+        """
+        schema = cls.PAYLOAD_SCHEMA.get(event, {})
+        for key, value in payload.items():
+            if key not in schema:
+                raise ValueError(f"Unexpected payload key {key!r} for event {event!r}")
+            expected = schema[key]
+            # bool is an int subclass; don't let it pass for one
+            if value is not None and (not isinstance(value, expected) or (expected is int and isinstance(value, bool))):
+                raise ValueError(f"Payload key {key!r} of event {event!r} must be {expected.__name__}")
 
     def __str__(self):
         return f"[{self.category}] {self.message}"
@@ -0,0 +1,80 @@
+"""
+Versioned response cache for /api/users/me/.
+
+Each user has a profile version in the cache. Saving or deleting the user or
+their company / club profile (which holds the tier) bumps it (see
+signals.py), so the body cached under the old version is never served
+again and the ETag changes. A client revalidating with the current ETag gets
+a 304 straight from the cache.
+
+Versions start from the clock rather than 1, so an ETag issued before the
+cache was flushed or restarted can't match a new version.
+"""
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+def _cache():
+    return caches[getattr(settings, 'USER_PROFILE_CACHE_ALIAS', 'default')]
+
+
+def _timeout():
+    return getattr(settings, 'USER_PROFILE_CACHE_TIMEOUT', 300)
+
+
+def _version_key(user_id):
+    return f'users:me:{user_id}:version'
+
+
+def _seed():
+    return int(time.time() * 1000)
+
+
+def get_version(user_id):
+    cache = _cache()
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _seed(), timeout=None)
+        version = cache.get(key, 0)
+    return version
+
+
+def bump_version(user_id):
+    cache = _cache()
+    key = _version_key(user_id)
+    cache.add(key, _seed(), timeout=None)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr()
+        version = _seed()
+        cache.set(key, version, timeout=None)
+        return version
+
+
+def invalidate(user_id):
+    """
+    Bump the user's version now and again once the surrounding transaction
+    commits, so readers can't re-cache pre-commit rows under the new version.
+    """
+    bump_version(user_id)
+    transaction.on_commit(lambda: bump_version(user_id))
+
+
+def etag(user_id, version):
+    return f'"me-{user_id}-{version}"'
+
+
+def body_key(user_id, version):
+    return f'users:me:{user_id}:v{version}'
+
+
+def get_body(user_id, version):
+    return _cache().get(body_key(user_id, version))
+
+
+def set_body(user_id, version, data):
+    _cache().set(body_key(user_id, version), data, timeout=_timeout())
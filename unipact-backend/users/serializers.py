@@ -126,7 +126,7 @@ class AdminClubVerificationSerializer(serializers.ModelSerializer):
 class SystemLogSerializer(serializers.ModelSerializer):
     class Meta:
         model = SystemLog
-        fields = ['id', 'category', 'level', 'message', 'created_at']
+        fields = ['id', 'category', 'level', 'message', 'created_at', 'event', 'actor', 'subject_type', 'subject_id', 'amount', 'payload']
 
 class ClaimProfileSerializer(serializers.Serializer):
     token = serializers.CharField()
@@ -0,0 +1,48 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from unipact_backend.auth_cache import principals
+from . import profile_cache
+from .models import User, CompanyProfile, ClubProfile
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def drop_cached_principal(sender, instance, **kwargs):
+    # is_active, role, password... anything on the user can matter to auth
+    principals.invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=CompanyProfile)
+@receiver(post_delete, sender=CompanyProfile)
+@receiver(post_save, sender=ClubProfile)
+@receiver(post_delete, sender=ClubProfile)
+def drop_cached_profile_owner(sender, instance, **kwargs):
+    kind = 'company_profile' if sender is CompanyProfile else 'club_profile'
+    principals.invalidate_profile(kind, instance.pk, instance.user_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def bump_user_profile_version(sender, instance, raw=False, **kwargs):
+    if not raw:
+        profile_cache.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=CompanyProfile)
+@receiver(post_delete, sender=CompanyProfile)
+@receiver(post_save, sender=ClubProfile)
+@receiver(post_delete, sender=ClubProfile)
+def bump_profile_owner_version(sender, instance, raw=False, **kwargs):
+    if not raw:
+        profile_cache.invalidate(instance.user_id)
+
+
+@receiver(pre_save, sender=CompanyProfile)
+@receiver(pre_save, sender=ClubProfile)
+def bump_previous_owner_version(sender, instance, raw=False, **kwargs):
+    # A club changing president leaves the old one without a profile
+    if raw or instance.pk is None:
+        return
+    previous = sender.objects.filter(pk=instance.pk).exclude(user_id=instance.user_id).values_list('user_id', flat=True).first()
+    if previous is not None:
+        profile_cache.invalidate(previous)
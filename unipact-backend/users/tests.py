@@ -1,11 +1,34 @@
+import functools
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
-from .models import CompanyProfile, ClubProfile
+from django.contrib.auth.hashers import make_password
+from django.test import override_settings
+from django.db import transaction
+from .log_sink import LogBuffer
+from .models import CompanyProfile, ClubProfile, SystemLog
+from .utils import log_event
 
 User = get_user_model()
 
+
+@functools.cache
+def password_hash():
+    # PBKDF2 takes ~0.4s per call; every fixture user shares the password 'pw'
+    return make_password('pw')
+
+
+def make_company(email, company_name, **fields):
+    user = User.objects.create(username=email, email=email, password=password_hash(), role=User.Role.COMPANY)
+    return CompanyProfile.objects.create(user=user, company_name=company_name, **fields)
+
+
+def make_club(email, club_name, **fields):
+    user = User.objects.create(username=email, email=email, password=password_hash(), role=User.Role.CLUB)
+    return ClubProfile.objects.create(user=user, club_name=club_name, **fields)
+
+
 class LoginTests(APITestCase):
     def setUp(self):
         self.url = reverse('login')
@@ -118,3 +141,307 @@ class RegistrationTests(APITestCase):
         response = self.client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(ClubProfile.objects.get().verification_status, ClubProfile.VerificationStatus.PENDING_VERIFICATION)
+
+@override_settings(AUTH_PRINCIPAL_CACHE_TTL=30)
+class AuthenticatedPrincipalTests(APITestCase):
+    def setUp(self):
+        from unipact_backend.auth_cache import principals
+        self.principals = principals
+        principals.clear()
+        self.addCleanup(principals.clear)
+        self.profile = make_company('comp@corp.com', 'Comp A')
+        self.user = self.profile.user
+
+    def login_with_token(self, user=None, cookie=False):
+        from rest_framework_simplejwt.tokens import AccessToken
+        token = str(AccessToken.for_user(user or self.user))
+        if cookie:
+            self.client.cookies['access_token'] = token
+        else:
+            self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def me(self, queries):
+        # `queries` counts authentication only: the body is rebuilt every time
+        from django.core.cache import cache
+        cache.clear()
+        with self.assertNumQueries(queries + 1):
+            response = self.client.get(reverse('me'))
+        return response
+
+    @override_settings(AUTH_PRINCIPAL_CACHE_TTL=0)
+    def test_user_and_profile_in_one_query(self):
+        for cookie in (False, True):
+            self.client.credentials()
+            self.login_with_token(cookie=cookie)
+            response = self.me(1)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data['name'], 'Comp A')
+
+    def test_cached_principal_skips_the_query_until_a_change(self):
+        self.login_with_token()
+        self.me(1)
+        self.assertEqual(self.me(0).data['name'], 'Comp A')
+
+        self.profile.company_name = 'Comp Renamed'
+        self.profile.save()
+        self.assertEqual(self.me(1).data['name'], 'Comp Renamed')
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get(reverse('me')).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_profile_changing_owner_drops_the_old_owner(self):
+        club = make_club('club@uni.edu', 'Club A', university='Uni A')
+        club_user = club.user
+        new_owner = User.objects.create_user(username='new@uni.edu', email='new@uni.edu', password='pw', role=User.Role.CLUB)
+        self.login_with_token(user=club_user)
+        self.me(1)
+
+        club.user = new_owner
+        club.save()
+        self.assertIsNone(self.me(1).data['club_profile'])
+
+    @override_settings(AUTH_PRINCIPAL_CACHE_TTL=0)
+    def test_login_loads_the_profile_with_the_user(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('login'), {'email': 'comp@corp.com', 'password': 'pw'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['user']['name'], 'Comp A')
+        self.assertFalse([q for q in queries if 'users_companyprofile' in q['sql'] and 'users_user' not in q['sql']])
+
+
+class VerifiedTokenCacheTests(APITestCase):
+    def setUp(self):
+        from rest_framework_simplejwt.tokens import AccessToken
+        from unipact_backend.auth_cache import principals, tokens
+        self.tokens = tokens
+        for cache in (tokens, principals):
+            cache.clear()
+            self.addCleanup(cache.clear)
+        self.user = make_company('comp@corp.com', 'Comp A').user
+        self.access = AccessToken.for_user(self.user)
+        self.raw = str(self.access)
+
+    def test_repeated_token_is_verified_once(self):
+        self.client.cookies['access_token'] = self.raw
+        for _ in range(3):
+            self.assertEqual(self.client.get(reverse('me')).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.tokens.stats()['entries'], 1)
+        self.assertEqual(self.tokens.stats()['hits'], 2)
+
+        # Another signature is another digest, checked from scratch
+        header, payload, signature = self.raw.split('.')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {header}.{payload}.{signature[::-1]}')
+        self.assertEqual(self.client.get(reverse('me')).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_entries_end_at_token_expiry(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.raw}')
+        self.client.get(reverse('me'))
+        digest = self.tokens.digest(self.raw)
+        self.assertIsNotNone(self.tokens.get(digest, now=self.access['exp'] - 1))
+        self.assertIsNone(self.tokens.get(digest, now=self.access['exp']))
+
+
+    def test_access_token_is_rejected_after_logout(self):
+        response = self.client.post(reverse('login'), {'email': 'comp@corp.com', 'password': 'pw'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for _ in range(2):
+            self.assertEqual(self.client.get(reverse('me')).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.tokens.stats()['hits'], 1)
+
+        self.assertEqual(self.client.post(reverse('logout')).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(reverse('me')).status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class UserViewCacheTests(APITestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from unipact_backend.auth_cache import principals, tokens
+        cache.clear()
+        for c in (tokens, principals):
+            c.clear()
+            self.addCleanup(c.clear)
+        self.profile = make_company('comp@corp.com', 'Comp A')
+        self.user = self.profile.user
+        self.client.force_authenticate(user=self.user)
+
+    def me(self, queries, etag=None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        with self.assertNumQueries(queries):
+            return self.client.get(reverse('me'), **headers)
+
+    def test_not_modified_and_cached_bodies_skip_the_database(self):
+        first = self.me(1)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertIn('private', first['Cache-Control'])
+
+        repeat = self.me(0)
+        self.assertEqual(repeat.data, first.data)
+        self.assertEqual(repeat['ETag'], first['ETag'])
+
+        not_modified = self.me(0, etag=first['ETag'])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified['ETag'], first['ETag'])
+
+    def test_profile_and_tier_changes_change_the_etag(self):
+        etag = self.me(1)['ETag']
+
+        self.profile.tier = CompanyProfile.Tier.PRO
+        self.profile.save()
+        response = self.me(1, etag=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['tier'], CompanyProfile.Tier.PRO)
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+        self.user.email = 'new@corp.com'
+        self.user.save()
+        self.assertEqual(self.me(1, etag=etag).data['email'], 'new@corp.com')
+
+    def test_club_transfer_changes_the_previous_owners_profile(self):
+        club = make_club('club@uni.edu', 'Club A', university='Uni A')
+        club_user = club.user
+        new_owner = User.objects.create_user(username='new@uni.edu', email='new@uni.edu', password='pw', role=User.Role.CLUB)
+        self.client.force_authenticate(user=club_user)
+        etag = self.me(1)['ETag']
+
+        club.user = new_owner
+        club.save()
+        response = self.me(1, etag=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data['club_profile'])
+
+
+class ManualLogBuffer(LogBuffer):
+    # No writer thread: it would need its own connection to the test
+    # database. Tests flush by hand.
+    def start(self):
+        pass
+
+
+@override_settings(SYSTEM_LOG_BUFFERED=True, SYSTEM_LOG_DURABLE=True)
+class BufferedSystemLogTests(APITestCase):
+    def setUp(self):
+        from . import log_sink
+        self.buffer = ManualLogBuffer(max_queue=100, batch_size=50, flush_interval=1.0, put_timeout=0)
+        previous, log_sink._buffer = log_sink._buffer, self.buffer
+        self.addCleanup(setattr, log_sink, '_buffer', previous)
+
+    def test_events_are_queued_and_written_in_one_batch(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                log_event(SystemLog.Category.SECURITY, SystemLog.Level.INFO, f"User Login: user{i}@corp.com")
+        self.assertEqual(SystemLog.objects.count(), 0)
+        self.assertEqual(self.buffer.stats()['queued'], 5)
+
+        # Shutdown writes what is left, in a single INSERT
+        with self.assertNumQueries(1):
+            self.buffer.stop()
+        messages = list(SystemLog.objects.order_by('id').values_list('message', flat=True))
+        self.assertEqual(messages, [f"User Login: user{i}@corp.com" for i in range(5)])
+
+    def test_critical_entries_are_written_synchronously(self):
+        log_event(SystemLog.Category.SECURITY, SystemLog.Level.CRITICAL, "High Risk Reg: x@gmail.com (Public Domain)")
+        self.assertEqual(SystemLog.objects.filter(level=SystemLog.Level.CRITICAL).count(), 1)
+        self.assertEqual(self.buffer.stats()['queued'], 0)
+
+    def test_rolled_back_events_are_not_queued(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    log_event(SystemLog.Category.SECURITY, SystemLog.Level.WARNING, "Club Ownership Transferred")
+                    raise ValueError
+            except ValueError:
+                pass
+        self.assertEqual(self.buffer.stats()['queued'], 0)
+
+    def test_full_queue_makes_the_caller_write_a_batch(self):
+        buffer = ManualLogBuffer(max_queue=2, batch_size=2, flush_interval=1.0, put_timeout=0)
+        for i in range(3):
+            buffer.put(SystemLog(message=f"event {i}"))
+        self.assertEqual(SystemLog.objects.count(), 2)
+        self.assertEqual(buffer.stats()['inline_flushes'], 1)
+        buffer.flush()
+        self.assertEqual(SystemLog.objects.count(), 3)
+
+    def test_entry_is_dropped_if_the_queue_refills_first(self):
+        from unittest import mock
+        buffer = ManualLogBuffer(max_queue=1, batch_size=1, flush_interval=1.0, put_timeout=0)
+        buffer.put(SystemLog(message="first"))
+        # Another request grabbed the room the inline flush made
+        with mock.patch.object(buffer, 'drain', return_value=[]):
+            buffer.put(SystemLog(message="second"))
+        self.assertEqual(buffer.stats()['dropped'], 1)
+        self.assertEqual(buffer.stats()['queued'], 1)
+
+
+class StructuredSystemLogTests(APITestCase):
+    def setUp(self):
+        self.user = make_company('comp@corp.com', 'Comp A').user
+
+    def test_logins_record_event_actor_and_payload(self):
+        self.client.post(reverse('login'), {'email': 'comp@corp.com', 'password': 'pw'}, format='json')
+        self.client.post(reverse('login'), {'email': 'comp@corp.com', 'password': 'wrong'}, format='json')
+
+        login = SystemLog.objects.get(event=SystemLog.Event.LOGIN)
+        self.assertEqual(login.actor, self.user)
+        self.assertEqual(login.payload, {'email': 'comp@corp.com'})
+        failed = SystemLog.objects.get(event=SystemLog.Event.LOGIN_FAILED)
+        self.assertIsNone(failed.actor)
+        self.assertEqual(failed.payload, {'email': 'comp@corp.com'})
+
+    def test_payload_must_match_the_event_schema(self):
+        SystemLog.check_payload(SystemLog.Event.DEADLINE_SWEEP, {'closed': 3})
+        with self.assertRaises(ValueError):
+            SystemLog.check_payload(SystemLog.Event.DEADLINE_SWEEP, {'closed': '3'})
+        with self.assertRaises(ValueError):
+            SystemLog.check_payload(SystemLog.Event.DEADLINE_SWEEP, {'closed': True})
+        with self.assertRaises(ValueError):
+            SystemLog.check_payload(SystemLog.Event.LOGIN, {'password': 'pw'})
+
+    def test_admin_stats_aggregate_recent_activity(self):
+        admin = User.objects.create_user(username='admin@unipact.com', email='admin@unipact.com', password='pw', role=User.Role.ADMIN)
+        for email in ('a@x.com', 'a@x.com', 'b@x.com'):
+            log_event(SystemLog.Category.SECURITY, SystemLog.Level.WARNING, f"Failed Login: {email}", event=SystemLog.Event.LOGIN_FAILED, email=email)
+        log_event(SystemLog.Category.GROWTH, SystemLog.Level.INFO, "New Company Joined: Comp A", event=SystemLog.Event.COMPANY_JOINED, actor=self.user, company_name='Comp A')
+
+        self.client.force_authenticate(user=admin)
+        data = self.client.get(reverse('admin_stats')).data
+        self.assertEqual(data['activity_24h'], {'SECURITY': 3, 'GROWTH': 1})
+        self.assertEqual(data['failed_logins_24h'], [{'email': 'a@x.com', 'count': 2}, {'email': 'b@x.com', 'count': 1}])
+
+    def test_failed_logins_group_only_the_latest_failures(self):
+        from unittest import mock
+        from .views import AdminDashboardStatsView
+        admin = User.objects.create_user(username='admin@unipact.com', email='admin@unipact.com', password='pw', role=User.Role.ADMIN)
+        for email in ('old@x.com', 'new@x.com', 'new@x.com'):
+            log_event(SystemLog.Category.SECURITY, SystemLog.Level.WARNING, f"Failed Login: {email}", event=SystemLog.Event.LOGIN_FAILED, email=email)
+
+        self.client.force_authenticate(user=admin)
+        with mock.patch.object(AdminDashboardStatsView, 'FAILED_LOGIN_SCAN', 2):
+            data = self.client.get(reverse('admin_stats')).data
+        self.assertEqual(data['failed_logins_24h'], [{'email': 'new@x.com', 'count': 2}])
+
+    def test_backfill_parses_legacy_messages(self):
+        import importlib
+        from decimal import Decimal
+        from django.apps import apps
+        backfill = importlib.import_module('users.migrations.0008_backfill_systemlog_events')
+        login = SystemLog.objects.create(category=SystemLog.Category.SECURITY, message="User Login: comp@corp.com")
+        payment = SystemLog.objects.create(category=SystemLog.Category.FINANCIAL, message="Payment Received: RM 150.00 from Comp A")
+        review = SystemLog.objects.create(category=SystemLog.Category.SECURITY, message="Admin APPROVED entity 7 (CLUB)")
+        unknown = SystemLog.objects.create(category=SystemLog.Category.SECURITY, message="Something else")
+
+        backfill.backfill_events(apps, None)
+
+        login.refresh_from_db()
+        self.assertEqual((login.event, login.payload), (SystemLog.Event.LOGIN, {'email': 'comp@corp.com'}))
+        payment.refresh_from_db()
+        self.assertEqual((payment.event, payment.amount), (SystemLog.Event.PAYMENT_RECEIVED, Decimal('150.00')))
+        review.refresh_from_db()
+        self.assertEqual(review.payload, {'action': 'approve', 'entity_type': 'CLUB'})
+        self.assertEqual((review.subject_type, review.subject_id), ('users.clubprofile', 7))
+        unknown.refresh_from_db()
+        self.assertEqual(unknown.event, '')
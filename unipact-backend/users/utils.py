@@ -12,13 +12,26 @@ def is_public_domain(email):
     except IndexError:
         return False
 
-def log_event(category, level, message):
+def log_event(category, level, message, event='', actor=None, subject=None, amount=None, **payload):
+    """
+    Record a SystemLog entry. Besides the human-readable message, pass the
+    SystemLog.Event, the acting user (instance or id), the model instance
+    the event is about and any amount; remaining keyword arguments form the
+    payload and must match SystemLog.PAYLOAD_SCHEMA for the event.
+    """
     from .models import SystemLog
+    from . import log_sink
     try:
-        SystemLog.objects.create(
-            category=category,
-            level=level,
-            message=message
+        SystemLog.check_payload(event, payload)
+        # Queued for a batched write when SYSTEM_LOG_BUFFERED is on
+        log_sink.write(
+            category, level, message,
+            event=event,
+            actor_id=getattr(actor, 'pk', actor),
+            subject_type=subject._meta.label_lower if subject is not None else '',
+            subject_id=subject.pk if subject is not None else None,
+            amount=amount,
+            payload=payload,
         )
     except Exception as e:
         print(f"Logging Failed: {e}")
@@ -7,8 +7,11 @@ from rest_framework import exceptions
 from rest_framework_simplejwt.tokens import RefreshToken
 from .models import User, CompanyProfile, ClubProfile, ShadowUser, SystemLog
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
 
 from .utils import is_public_domain
+from . import profile_cache
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from rest_framework.pagination import PageNumberPagination
@@ -48,7 +51,26 @@ class UserView(views.APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        user = request.user
+        # Revalidation and repeat loads are answered from the profile cache
+        # without reading the database
+        version = profile_cache.get_version(request.user.pk)
+        etag = profile_cache.etag(request.user.pk, version)
+        if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+        if etag in if_none_match or '*' in if_none_match:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            data = profile_cache.get_body(request.user.pk, version)
+            if data is None:
+                # Load afresh: request.user may come from the principal cache
+                user = User.objects.select_related('company_profile', 'club_profile').get(pk=request.user.pk)
+                data = self.build_payload(user)
+                profile_cache.set_body(request.user.pk, version, data)
+            response = Response(data)
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def build_payload(self, user):
         ver_status = None
         tier = None
         card_last_4 = None
@@ -71,7 +93,7 @@ class UserView(views.APIView):
         else:
             name = user.username
 
-        return Response({
+        return {
             "id": user.id,
             "email": user.email,
             "role": user.role,
@@ -82,7 +104,7 @@ class UserView(views.APIView):
             "card_brand": card_brand,
             "company_profile": company_profile_data,
             "club_profile": club_profile_data
-        })
+        }
 
 class LoginView(views.APIView):
     permission_classes = [AllowAny]
@@ -128,7 +150,8 @@ class LoginView(views.APIView):
             # Log Success
             from .models import SystemLog
             from .utils import log_event
-            log_event(SystemLog.Category.SECURITY, SystemLog.Level.SUCCESS, f"User Login: {email}")
+            log_event(SystemLog.Category.SECURITY, SystemLog.Level.SUCCESS, f"User Login: {email}",
+                      event=SystemLog.Event.LOGIN, actor=user, email=email)
 
             return response
         
@@ -136,7 +159,8 @@ class LoginView(views.APIView):
         from .models import SystemLog
         from .utils import log_event
         # Differentiate simple failure vs suspicious later, for now just WARNING
-        log_event(SystemLog.Category.SECURITY, SystemLog.Level.WARNING, f"Failed Login: {email}")
+        log_event(SystemLog.Category.SECURITY, SystemLog.Level.WARNING, f"Failed Login: {email}",
+                  event=SystemLog.Event.LOGIN_FAILED, email=email)
         
         return Response({"error": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED)
 
@@ -272,7 +296,9 @@ class TransferOwnershipView(views.APIView):
             # Log
             from .models import SystemLog
             from .utils import log_event
-            log_event(SystemLog.Category.SECURITY, SystemLog.Level.WARNING, f"Club Ownership Transferred: {club_profile.club_name} from {request.user.email} -> {new_owner_email}")
+            log_event(SystemLog.Category.SECURITY, SystemLog.Level.WARNING, f"Club Ownership Transferred: {club_profile.club_name} from {request.user.email} -> {new_owner_email}",
+                      event=SystemLog.Event.OWNERSHIP_TRANSFERRED, actor=request.user, subject=club_profile,
+                      from_email=request.user.email, to_email=new_owner_email)
 
         return Response({
             "message": f"Ownership transferred to {new_owner_email}. You are no longer the President."
@@ -379,9 +405,11 @@ class RegisterCompanyView(generics.CreateAPIView):
         from .utils import log_event
 
         if profile.verification_status == CompanyProfile.VerificationStatus.HIGH_RISK:
-            log_event(SystemLog.Category.SECURITY, SystemLog.Level.CRITICAL, f"High Risk Reg: {email} (Public Domain)")
+            log_event(SystemLog.Category.SECURITY, SystemLog.Level.CRITICAL, f"High Risk Reg: {email} (Public Domain)",
+                      event=SystemLog.Event.HIGH_RISK_REGISTRATION, actor=user, subject=profile, email=email)
         else:
-            log_event(SystemLog.Category.GROWTH, SystemLog.Level.INFO, f"New Company Joined: {company_name}")
+            log_event(SystemLog.Category.GROWTH, SystemLog.Level.INFO, f"New Company Joined: {company_name}",
+                      event=SystemLog.Event.COMPANY_JOINED, actor=user, subject=profile, company_name=company_name)
 
         response = Response({
             "message": "Company registered successfully.",
@@ -439,7 +467,8 @@ class RegisterClubView(generics.CreateAPIView):
 
         from .models import SystemLog
         from .utils import log_event
-        log_event(SystemLog.Category.GROWTH, SystemLog.Level.INFO, f"New Club Joined: {club_name} ({university})")
+        log_event(SystemLog.Category.GROWTH, SystemLog.Level.INFO, f"New Club Joined: {club_name} ({university})",
+                  event=SystemLog.Event.CLUB_JOINED, actor=user, subject=profile, club_name=club_name, university=university)
 
         response = Response({
             "message": "Club registered successfully. Please wait for admin verification.",
@@ -457,6 +486,7 @@ class RegisterClubView(generics.CreateAPIView):
 
 class AdminDashboardStatsView(views.APIView):
     permission_classes = [IsAuthenticated]
+    FAILED_LOGIN_SCAN = 5000 # failed logins grouped for the top-5 list
 
     def get(self, request):
         if request.user.role != User.Role.ADMIN:
@@ -474,11 +504,36 @@ class AdminDashboardStatsView(views.APIView):
         total_rev = Transaction.objects.filter(status=Transaction.Status.SUCCESS).aggregate(Sum('amount'))['amount__sum'] or 0
         revenue = f"RM {total_rev:,.2f}" 
 
+        # Last 24h of activity, grouped on the indexed SystemLog columns
+        from django.db.models import Count
+        from django.utils import timezone
+        from datetime import timedelta
+        from .models import SystemLog
+        since = timezone.now() - timedelta(hours=24)
+        recent_logs = SystemLog.objects.filter(created_at__gte=since).order_by()
+        activity = dict(recent_logs.values_list('category').annotate(count=Count('id')))
+        # payload__email is unindexed JSON: group only the latest failures,
+        # picked through systemlog_event_idx, so a brute-force burst stays cheap
+        latest_failed = recent_logs.filter(event=SystemLog.Event.LOGIN_FAILED).order_by('-created_at').values('pk')[:self.FAILED_LOGIN_SCAN]
+        failed_logins = [
+            {'email': row['payload__email'], 'count': row['count']}
+            for row in SystemLog.objects.filter(pk__in=latest_failed).values('payload__email').annotate(count=Count('id')).order_by('-count')[:5]
+        ]
+
+        from campaigns import board_cache, read_model, realtime
+        from . import log_sink
+
         return Response({
             "pending_reviews": pending_reviews,
             "system_flags": system_flags,
             "total_users": total_users,
-            "revenue": revenue
+            "revenue": revenue,
+            "activity_24h": activity,
+            "failed_logins_24h": failed_logins,
+            "board_cache": board_cache.stats(),
+            "board_read_model": read_model.stats(),
+            "realtime": realtime.get_hub().stats(),
+            "system_log": log_sink.get_buffer().stats()
         })
 
 class AdminVerificationQueueView(views.APIView):
@@ -554,7 +609,12 @@ class AdminVerifyEntityView(views.APIView):
         log_event(
             SystemLog.Category.SECURITY,
             SystemLog.Level.INFO,
-            f"Admin {action.upper()}D entity {entity_id} ({entity_type})"
+            f"Admin {action.upper()}D entity {entity_id} ({entity_type})",
+            event=SystemLog.Event.ENTITY_REVIEWED,
+            actor=request.user,
+            subject=profile,
+            action=action,
+            entity_type=entity_type,
         )
 
         return Response({"message": f"Entity {action}d successfully"})
@@ -603,7 +663,9 @@ class AdminBlockUserView(views.APIView):
             from .models import SystemLog
             from .utils import log_event
             status_str = "Unblocked" if user.is_active else "Blocked"
-            log_event(SystemLog.Category.SECURITY, SystemLog.Level.WARNING, f"Admin {status_str} User: {user.email}")
+            log_event(SystemLog.Category.SECURITY, SystemLog.Level.WARNING, f"Admin {status_str} User: {user.email}",
+                      event=SystemLog.Event.USER_ACTIVE_CHANGED, actor=request.user, subject=user,
+                      email=user.email, is_active=user.is_active)
             
             return Response({"message": f"User {status_str} successfully", "is_active": user.is_active})
         except User.DoesNotExist:
@@ -28,19 +28,19 @@ const CompanyDashboard = () => {
 
   // STATE: Campaigns
   const [campaigns, setCampaigns] = useState([]);
+  const [summary, setSummary] = useState(null);
   const [treasury, setTreasury] = useState(null);
   const [loading, setLoading] = useState(true);
 
   // FETCH DATA
+  // One request: every campaign with its applicant funnel, plus the treasury summary
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [campaignsRes, treasuryRes] = await Promise.all([
-          api.get('/campaigns/?mode=my_campaigns'),
-          api.get('/payments/treasury/')
-        ]);
-        setCampaigns(campaignsRes.data);
-        setTreasury(treasuryRes.data);
+        const res = await api.get('/campaigns/dashboard/company/');
+        setCampaigns(res.data.campaigns);
+        setSummary(res.data.summary);
+        setTreasury(res.data.treasury);
       } catch (error) {
         console.error("Failed to fetch dashboard data", error);
       } finally {
@@ -56,15 +56,17 @@ const CompanyDashboard = () => {
   }
 
   // Filter the list based on the selected tab
-  // Backend returns status: DRAFT, OPEN, IN_PROGRESS, COMPLETED, ARCHIVED
-  // Our tabs: recruiting (OPEN), active (IN_PROGRESS), completed (COMPLETED)
+  // Backend returns status: DRAFT, OPEN, CLOSED, IN_PROGRESS, COMPLETED, ARCHIVED
+  // Our tabs: recruiting (OPEN, or CLOSED past the deadline but not yet awarded),
+  // active (IN_PROGRESS), completed (COMPLETED)
   const statusMapping = {
-    'recruiting': 'OPEN',
-    'active': 'IN_PROGRESS',
-    'completed': 'COMPLETED'
+    'recruiting': ['OPEN', 'CLOSED'],
+    'active': ['IN_PROGRESS'],
+    'completed': ['COMPLETED']
   }
 
-  const filteredCampaigns = campaigns.filter(c => c.status === statusMapping[activeTab]);
+  const filteredCampaigns = campaigns.filter(c => statusMapping[activeTab].includes(c.status));
+  const countFor = (tab) => statusMapping[tab].reduce((total, s) => total + (summary?.by_status?.[s] || 0), 0);
 
   return (
     <div className="min-h-screen bg-[var(--bg-void)] p-6">
@@ -112,9 +114,9 @@ const CompanyDashboard = () => {
       {/* 3. STATS GRID */}
       <div className="grid grid-cols-1 md:grid-cols-4 gap-4 mb-8">
         {[
-          { label: 'Recruiting', value: campaigns.filter(c => c.status === 'OPEN').length.toString().padStart(2, '0'), icon: Users },
-          { label: 'Active Raids', value: campaigns.filter(c => c.status === 'IN_PROGRESS').length.toString().padStart(2, '0'), icon: Activity },
-          { label: 'Completed', value: campaigns.filter(c => c.status === 'COMPLETED').length.toString().padStart(2, '0'), icon: Trophy },
+          { label: 'Recruiting', value: countFor('recruiting').toString().padStart(2, '0'), icon: Users },
+          { label: 'Active Raids', value: countFor('active').toString().padStart(2, '0'), icon: Activity },
+          { label: 'Completed', value: countFor('completed').toString().padStart(2, '0'), icon: Trophy },
           { label: 'Guild Rank', value: treasury?.tier === 'PRO' ? 'S' : 'B', icon: Star, color: 'text-[var(--text-gold)]' },
         ].map((stat, index) => (
           <div key={index} className="bg-[var(--bg-panel)] border border-[var(--border-tech)] p-6 relative group hover:border-[var(--text-gold)] transition-all">
@@ -193,19 +195,24 @@ const CompanyDashboard = () => {
                     {activeTab === 'recruiting' && (
                       <div className="flex items-center gap-2 text-xs text-[var(--text-blue)]">
                         <Users size={14} />
-                        <span className="text-white font-bold">{camp.applicants}</span> Candidates Applied
+                        <span className="text-white font-bold">{camp.funnel.applicants}</span> Candidates Applied
+                        {camp.funnel.by_status.PENDING > 0 && (
+                          <span className="text-[var(--text-gold)]">({camp.funnel.by_status.PENDING} awaiting review)</span>
+                        )}
                       </div>
                     )}
                     {activeTab === 'active' && (
                       <div className="flex items-center gap-2 text-xs text-[var(--text-blue)]">
                         <Activity size={14} />
                         Assigned to: <span className="text-white font-bold">{camp.guild}</span>
+                        <span className="text-gray-500">· {camp.funnel.deliverables_submitted} deliverables</span>
                       </div>
                     )}
                     {activeTab === 'completed' && (
                       <div className="flex items-center gap-2 text-xs text-[var(--text-blue)]">
                         <Trophy size={14} />
                         Performed by: <span className="text-white font-bold">{camp.guild}</span>
+                        <span className="text-gray-500">· Spent {camp.funnel.spend}</span>
                       </div>
                     )}
 
@@ -1,7 +1,8 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useToast } from '../context/ToastContext';
 import api from '../api/client';
+import liveEvents from '../services/liveEvents';
 import { ArrowLeft, Users, Trophy, Clock, CheckCircle } from 'lucide-react';
 import PaymentModal from '../components/PaymentModal';
 
@@ -12,6 +13,9 @@ const ManageCampaign = () => {
     const navigate = useNavigate();
     const { showToast } = useToast();
     const [campaign, setCampaign] = useState(null);
+    const [applications, setApplications] = useState([]);
+    const [nextApplications, setNextApplications] = useState(null);
+    const [sort, setSort] = useState('submitted_at');
     const [loading, setLoading] = useState(true);
 
     const [isPaymentModalOpen, setPaymentModalOpen] = useState(false);
@@ -26,11 +30,27 @@ const ManageCampaign = () => {
         isDanger: false
     });
 
+    // Applicants are paged separately from the campaign detail (which only carries a summary)
+    const fetchApplications = async (url = null) => {
+        const response = url
+            ? await api.get(url)
+            : await api.get(`/campaigns/${id}/applications/`, { params: { sort, include: 'deliverables' } });
+        setApplications(prev => (url ? [...prev, ...response.data.results] : response.data.results));
+        setNextApplications(response.data.next);
+    };
+
+    const refresh = async () => {
+        const [response] = await Promise.all([
+            api.get(`/campaigns/${id}/`),
+            fetchApplications()
+        ]);
+        setCampaign(response.data);
+    };
+
     useEffect(() => {
         const fetchCampaign = async () => {
             try {
-                const response = await api.get(`/campaigns/${id}/`);
-                setCampaign(response.data);
+                await refresh();
             } catch (error) {
                 console.error("Failed to fetch campaign", error);
                 showToast("Failed to load campaign data.", "error");
@@ -39,15 +59,48 @@ const ManageCampaign = () => {
             }
         };
         fetchCampaign();
+    }, [id, sort]);
+
+    // Live status deltas (awards, deliverables, completion) patch the page in place
+    const live = useRef(null);
+    const refreshRef = useRef(refresh);
+    refreshRef.current = refresh;
+
+    useEffect(() => {
+        live.current = liveEvents.subscribe((event) => {
+            if (event.type === 'resync') {
+                refreshRef.current();
+                return;
+            }
+            if (String(event.campaign_id) !== String(id)) return;
+
+            if (event.type === 'campaign.status') {
+                setCampaign(prev => prev && { ...prev, status: event.status, guild: event.guild ?? prev.guild });
+                if (event.awarded_application_id) {
+                    setApplications(prev => prev.map(app => (
+                        app.id === event.awarded_application_id ? { ...app, status: 'AWARDED' }
+                            : app.status === 'PENDING' ? { ...app, status: 'NOT_SELECTED' } : app
+                    )));
+                }
+            } else if (event.type === 'application.status') {
+                setApplications(prev => prev.map(app => (
+                    app.id === event.application_id ? {
+                        ...app,
+                        status: event.status,
+                        deliverables: event.deliverable ? [...(app.deliverables || []), event.deliverable] : app.deliverables
+                    } : app
+                )));
+            }
+        });
+        return () => live.current.close();
     }, [id]);
 
     const executeAward = async (applicationId, clubName) => {
         try {
             await api.post(`/campaigns/application/${applicationId}/award/`);
             showToast("Contract Awarded Successfully!", "success");
-            // Refresh data
-            const response = await api.get(`/campaigns/${id}/`);
-            setCampaign(response.data);
+            // The live stream delivers the new statuses; re-fetch only without it
+            if (!live.current?.isLive()) await refresh();
         } catch (error) {
             if (error.response?.status === 402) {
                 // Payment Required - Trigger Custom Confirmation
@@ -63,6 +116,10 @@ const ManageCampaign = () => {
                         setPaymentModalOpen(true);
                     }
                 });
+            } else if (error.response?.status === 409) {
+                // Someone else awarded it first - show the current state
+                showToast("This contract has already been awarded.", "error");
+                await refresh();
             } else {
                 console.error("Failed to award", error);
                 showToast("Awarding Failed: " + (error.response?.data?.error || "Unknown Error"), "error");
@@ -112,9 +169,7 @@ const ManageCampaign = () => {
             });
             showToast("Mission Accomplished! Review Submitted & Contract Closed.", "success");
             setReviewState(prev => ({ ...prev, isOpen: false }));
-            // Refresh data
-            const response = await api.get(`/campaigns/${id}/`);
-            setCampaign(response.data);
+            if (!live.current?.isLive()) await refresh();
         } catch (error) {
             console.error("Completion failed", error);
             showToast("Failed to complete: " + (error.response?.data?.error || "Unknown Error"), "error");
@@ -147,16 +202,28 @@ const ManageCampaign = () => {
 
                 {/* Applications List */}
                 <div className="bg-[var(--bg-panel)] border border-[var(--border-tech)] p-6">
-                    <h2 className="text-xl font-bold text-white mb-6 flex items-center gap-2">
-                        <Users size={20} className="text-[#a020f0]" />
-                        Applications ({campaign.applications?.length || 0})
-                    </h2>
+                    <div className="flex justify-between items-center mb-6">
+                        <h2 className="text-xl font-bold text-white flex items-center gap-2">
+                            <Users size={20} className="text-[#a020f0]" />
+                            Applications ({campaign.applicant_summary?.total || 0})
+                        </h2>
+                        <select
+                            value={sort}
+                            onChange={(e) => setSort(e.target.value)}
+                            className="bg-black/50 border border-gray-700 text-white text-xs uppercase p-2 outline-none"
+                        >
+                            <option value="submitted_at">Newest</option>
+                            <option value="status">Status</option>
+                            <option value="club_rank">Club Rank</option>
+                            <option value="club_rating">Club Rating</option>
+                        </select>
+                    </div>
 
                     <div className="space-y-4">
-                        {campaign.applications?.length === 0 ? (
+                        {applications.length === 0 ? (
                             <p className="text-gray-500 italic">No mercenaries have applied yet.</p>
                         ) : (
-                            campaign.applications?.map((app) => (
+                            applications.map((app) => (
                                 <div key={app.id} className="bg-black/30 border border-white/10 p-4 flex flex-col md:flex-row justify-between items-center gap-4">
                                     <div className="flex-1">
                                         <div className="flex items-center gap-2">
@@ -188,7 +255,7 @@ const ManageCampaign = () => {
                                     < div >
                                         {/* AWARDING PHASE */}
                                         {
-                                            campaign.status === 'OPEN' && app.status === 'PENDING' && (
+                                            ['OPEN', 'CLOSED'].includes(campaign.status) && app.status === 'PENDING' && (
                                                 <button
                                                     onClick={() => handleAwardClick(app.id, app.club_name)}
                                                     className="bg-[#a020f0] hover:bg-[#8e1cc1] text-white px-4 py-2 text-sm font-bold uppercase tracking-wider flex items-center gap-2 transition-all"
@@ -241,6 +308,15 @@ const ManageCampaign = () => {
                             ))
                         )}
                     </div>
+
+                    {nextApplications && (
+                        <button
+                            onClick={() => fetchApplications(nextApplications)}
+                            className="mt-6 w-full py-3 border border-gray-700 text-gray-400 text-xs uppercase tracking-widest hover:text-white hover:border-[#a020f0] transition-all"
+                        >
+                            Load More Applicants
+                        </button>
+                    )}
                 </div>
 
             </div >
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import api from '../api/client';
 import { useNavigate } from 'react-router-dom';
 import {
@@ -10,32 +10,124 @@ import {
   Shield
 } from 'lucide-react';
 
+// How often the board asks for changes since its last version
+const SYNC_INTERVAL_MS = 30000;
+
 const QuestBoard = () => {
   const navigate = useNavigate();
-  const [filter, setFilter] = useState('all');
+  const [filter, setFilter] = useState('all'); // budget rank: all, S, A, B
+  const [typeFilter, setTypeFilter] = useState('');
 
   /* MOCK DATA REPLACED BY API */
   const [quests, setQuests] = useState([]);
+  const [facets, setFacets] = useState(null);
+  const [nextPage, setNextPage] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [searchTerm, setSearchTerm] = useState('');
+  const [newQuests, setNewQuests] = useState(0);
 
+  // Delta sync: the change-log version the loaded board is current as of
+  const syncVersion = useRef(null);
+  const loadedIds = useRef(new Set());
   useEffect(() => {
-    const fetchQuests = async () => {
-      try {
-        const response = await api.get('/campaigns/');
-        // Handle both paginated and non-paginated responses
-        const rawData = response.data;
-        const dataArray = Array.isArray(rawData) ? rawData : (rawData.results || []);
+    loadedIds.current = new Set(quests.map(q => q.id));
+  }, [quests]);
+
+  // Filtering happens server-side; facet counts come back with the first page
+  const boardUrl = (term = searchTerm.trim()) => {
+    const params = new URLSearchParams();
+    if (filter !== 'all') params.set('rank', filter);
+    if (typeFilter) params.set('type', typeFilter);
+    if (term) params.set('q', term);
+    const query = params.toString();
+    return query ? `/campaigns/?${query}` : '/campaigns/';
+  };
+
+  // Board is cursor-paginated: append each page and keep the `next` link
+  const fetchQuests = async (url = boardUrl(), append = false) => {
+    if (!append) {
+      // Take the version first so nothing changed during the load is missed
+      const versionRes = await api.get('/campaigns/changes/', { params: { since: 0, limit: 0 } });
+      syncVersion.current = versionRes.data.version;
+      setNewQuests(0);
+    }
+    const response = await api.get(url);
+    // Handle both paginated and non-paginated responses
+    const rawData = response.data;
+    const dataArray = Array.isArray(rawData) ? rawData : (rawData.results || []);
+
+    setQuests(prev => (append ? [...prev, ...dataArray] : dataArray));
+    setNextPage(Array.isArray(rawData) ? null : (rawData.next || null));
+    if (!append && rawData.facets) setFacets(rawData.facets);
+  };
+
+  const handleSearch = async (e) => {
+    e.preventDefault();
+    try {
+      await fetchQuests(boardUrl());
+    } catch (error) {
+      console.error("Search failed", error);
+    }
+  };
 
-        const openQuests = dataArray.filter(q => q.status === 'OPEN');
-        setQuests(openQuests);
+  useEffect(() => {
+    fetchQuests()
+      .catch(error => console.error("Failed to fetch quests", error))
+      .finally(() => setLoading(false));
+  }, [filter, typeFilter]);
+
+  // Patch loaded quests from the change log instead of re-downloading the board
+  const applyChanges = (data) => {
+    const changed = new Map(data.campaigns.map(c => [c.id, c]));
+    const removed = new Set(data.removed.campaigns);
+    setQuests(prev => prev
+      .filter(q => !removed.has(q.id) && (changed.get(q.id)?.status ?? 'OPEN') === 'OPEN')
+      .map(q => changed.get(q.id) || q));
+    const added = data.campaigns.filter(c => c.status === 'OPEN' && !loadedIds.current.has(c.id)).length;
+    if (added) setNewQuests(n => n + added);
+  };
+
+  useEffect(() => {
+    const timer = setInterval(async () => {
+      if (syncVersion.current === null || document.hidden) return;
+      try {
+        let hasMore = true;
+        while (hasMore) {
+          const { data } = await api.get('/campaigns/changes/', { params: { since: syncVersion.current } });
+          applyChanges(data);
+          syncVersion.current = data.version;
+          hasMore = data.has_more;
+        }
       } catch (error) {
-        console.error("Failed to fetch quests", error);
-      } finally {
-        setLoading(false);
+        if (error.response?.status === 410) {
+          // Too far behind the change log; reload the board
+          fetchQuests().catch(err => console.error("Failed to reload quests", err));
+        } else {
+          console.error("Board sync failed", error);
+        }
       }
-    };
-    fetchQuests();
-  }, []);
+    }, SYNC_INTERVAL_MS);
+    return () => clearInterval(timer);
+  }, [filter, typeFilter]);
+
+  const rankCount = (rank) => {
+    if (!facets) return null;
+    if (rank === 'all') return facets.rank.reduce((sum, r) => sum + r.count, 0);
+    return facets.rank.find(r => r.rank === rank)?.count ?? 0;
+  };
+
+  const loadMore = async () => {
+    if (!nextPage) return;
+    setLoadingMore(true);
+    try {
+      await fetchQuests(nextPage, true);
+    } catch (error) {
+      console.error("Failed to fetch more quests", error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   if (loading) {
     return (
@@ -69,20 +161,22 @@ const QuestBoard = () => {
             </div>
 
             {/* Search Bar */}
-            <div className="flex items-center gap-2 bg-black/30 border border-[var(--border-tech)] p-2 w-full md:w-96 focus-within:border-[#a020f0] transition-colors">
+            <form onSubmit={handleSearch} className="flex items-center gap-2 bg-black/30 border border-[var(--border-tech)] p-2 w-full md:w-96 focus-within:border-[#a020f0] transition-colors">
               <Search className="text-gray-500" size={18} />
               <input
                 type="text"
+                value={searchTerm}
+                onChange={(e) => setSearchTerm(e.target.value)}
                 placeholder="Search by keyword or Client ID..."
                 className="bg-transparent border-none outline-none text-sm text-white w-full placeholder-gray-600"
               />
-            </div>
+            </form>
           </div>
         </div>
 
         {/* 2. FILTERS */}
         <div className="flex gap-2 mb-6 overflow-x-auto pb-2">
-          {['all', 'S-Rank', 'A-Rank', 'B-Rank'].map((f) => (
+          {['all', 'S', 'A', 'B'].map((f) => (
             <button
               key={f}
               onClick={() => setFilter(f)}
@@ -91,15 +185,34 @@ const QuestBoard = () => {
                 : 'border-[var(--border-tech)] text-gray-500 hover:text-white hover:border-white'
                 }`}
             >
-              {f === 'all' ? 'All Ranks' : f}
+              {f === 'all' ? 'All Ranks' : `${f}-Rank`}
+              {rankCount(f) !== null && <span className="ml-2 text-gray-500">{rankCount(f)}</span>}
             </button>
           ))}
-          <button className="px-4 py-2 border border-[var(--border-tech)] text-gray-500 text-xs uppercase tracking-wider hover:text-white hover:border-white flex items-center gap-2 ml-auto">
-            <Filter size={12} /> Advanced Filter
-          </button>
+          <div className="px-4 py-2 border border-[var(--border-tech)] text-gray-500 text-xs uppercase tracking-wider flex items-center gap-2 ml-auto">
+            <Filter size={12} />
+            <select
+              value={typeFilter}
+              onChange={(e) => setTypeFilter(e.target.value)}
+              className="bg-transparent outline-none uppercase tracking-wider"
+            >
+              <option value="">All Types</option>
+              {Object.entries(facets?.type || {}).map(([type, count]) => (
+                <option key={type} value={type}>{type.replace('_', ' ')} ({count})</option>
+              ))}
+            </select>
+          </div>
         </div>
 
         {/* 3. QUEST LIST GRID */}
+        {newQuests > 0 && (
+          <button
+            onClick={() => fetchQuests().catch(error => console.error("Failed to fetch quests", error))}
+            className="w-full mb-4 py-2 border border-[#a020f0] text-[#a020f0] text-xs uppercase tracking-widest hover:bg-[#a020f0] hover:text-white transition-colors"
+          >
+            {newQuests} new {newQuests === 1 ? 'quest' : 'quests'} posted. Refresh board
+          </button>
+        )}
         <div className="grid grid-cols-1 gap-4">
           {quests.map((quest) => (
             <div
@@ -147,6 +260,16 @@ const QuestBoard = () => {
           ))}
         </div>
 
+        {nextPage && (
+          <button
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="mt-6 w-full px-4 py-3 border border-[var(--border-tech)] text-gray-400 text-xs uppercase tracking-widest hover:text-white hover:border-[#a020f0] transition-all disabled:opacity-50"
+          >
+            {loadingMore ? 'Scanning...' : 'Load More Bounties'}
+          </button>
+        )}
+
       </div>
     </div>
   );
@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import api from '../api/client';
+import liveEvents from '../services/liveEvents';
 import { useNavigate } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
 import {
@@ -19,7 +20,9 @@ const StudentDashboard = () => {
   const navigate = useNavigate();
   const { logout, user } = useAuth();
   /* API INTEGRATION */
-  const [applications, setApplications] = useState([]);
+  const [summary, setSummary] = useState(null);
+  const [activeMissions, setActiveMissions] = useState([]);
+  const [otherBids, setOtherBids] = useState([]);
   const [bounties, setBounties] = useState([]); // [NEW] State for Bounties
   const [loading, setLoading] = useState(true);
 
@@ -32,19 +35,12 @@ const StudentDashboard = () => {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        setLoading(true);
-        // 1. Fetch My Applications
-        const appsRes = await api.get('/campaigns/applications/me/');
-        setApplications(appsRes.data);
-
-        // 2. Fetch Open Bounties (Campaigns)
-        const campaignsRes = await api.get('/campaigns/');
-        // Filter for OPEN campaigns that I haven't applied to yet
-        const myAppIds = new Set(appsRes.data.map(app => app.campaign));
-        const openBounties = campaignsRes.data.filter(
-          c => c.status === 'OPEN' && !myAppIds.has(c.id)
-        );
-        setBounties(openBounties.slice(0, 3)); // Top 3
+        // Applications, stats and unapplied bounties in one request
+        const res = await api.get('/campaigns/dashboard/club/', { params: { campaigns: 3, exclude_applied: true } });
+        setSummary(res.data.summary);
+        setActiveMissions(res.data.active_applications);
+        setOtherBids(res.data.recent_applications);
+        setBounties(res.data.open_campaigns);
 
       } catch (error) {
         console.error("Failed to fetch dashboard data", error);
@@ -52,7 +48,16 @@ const StudentDashboard = () => {
         setLoading(false);
       }
     };
+    setLoading(true);
     fetchData();
+
+    // Awards and completions are pushed live; reload the dashboard when one lands
+    const live = liveEvents.subscribe((event) => {
+      if (event.type === 'application.status' || event.type === 'resync') {
+        fetchData();
+      }
+    });
+    return () => live.close();
   }, []);
 
   const handleInvite = async (e) => {
@@ -72,10 +77,6 @@ const StudentDashboard = () => {
     }
   }
 
-  // Filter Applications
-  const activeMissions = applications.filter(app => ['AWARDED', 'SUBMITTED', 'COMPLETED'].includes(app.status));
-  const otherBids = applications.filter(app => !['AWARDED', 'SUBMITTED', 'COMPLETED'].includes(app.status));
-
   if (loading) {
     return (
       <div className="min-h-screen bg-[var(--bg-void)] flex items-center justify-center text-white font-display uppercase tracking-widest animate-pulse">
@@ -201,10 +202,10 @@ const StudentDashboard = () => {
       <div className="grid grid-cols-2 md:grid-cols-5 gap-4 mb-8">
         {[
           { label: 'Hunter Rank', value: user?.club_profile?.rank || '-', icon: Star, color: 'text-[var(--text-gold)]' },
-          { label: 'Active Raids', value: activeMissions.filter(a => a.status !== 'COMPLETED' && a.campaign_status !== 'COMPLETED').length, icon: Target, color: 'text-[#a020f0]' },
-          { label: 'Pending Bids', value: otherBids.filter(a => a.status === 'PENDING').length, icon: Clock, color: 'text-blue-400' },
-          { label: 'Quest Wins', value: applications.filter(a => ['AWARDED', 'SUBMITTED', 'COMPLETED'].includes(a.status)).length, icon: Shield, color: 'text-green-400' },
-          { label: 'Total Loot', value: 'RM ' + applications.filter(a => ['AWARDED', 'SUBMITTED', 'COMPLETED'].includes(a.status)).reduce((acc, curr) => acc + (parseFloat(curr.campaign_budget) || 0), 0).toFixed(2), icon: Zap, color: 'text-yellow-400' },
+          { label: 'Active Raids', value: summary?.active ?? 0, icon: Target, color: 'text-[#a020f0]' },
+          { label: 'Pending Bids', value: summary?.by_status?.PENDING ?? 0, icon: Clock, color: 'text-blue-400' },
+          { label: 'Quest Wins', value: summary?.wins ?? 0, icon: Shield, color: 'text-green-400' },
+          { label: 'Total Loot', value: 'RM ' + (summary?.earnings ?? '0.00'), icon: Zap, color: 'text-yellow-400' },
         ].map((stat, index) => (
           <div key={index} className="bg-[var(--bg-panel)] p-4 border border-[var(--border-tech)] relative group">
             <div className="flex justify-between items-start mb-2">
@@ -12,25 +12,51 @@ const SubmitDeliverable = () => {
     const handleFileChange = (e) => {
         if (e.target.files[0]) {
             setFile(e.target.files[0]);
+            setProgress(0);
         }
     };
 
     const [submitStatus, setSubmitStatus] = useState(null); // success, error
+    const [progress, setProgress] = useState(0);
+    // Kept across attempts so a failed transfer resumes instead of restarting
+    const [upload, setUpload] = useState(null);
+
+    const startUpload = async () => {
+        if (upload && upload.file === file) {
+            const res = await api.get(`/campaigns/deliverable/uploads/${upload.id}/`);
+            return { ...upload, received: res.data.received_bytes };
+        }
+        const res = await api.post(`/campaigns/application/${applicationId}/deliverable/uploads/`, {
+            filename: file.name,
+            size: file.size,
+        });
+        const started = { id: res.data.id, file, chunkSize: res.data.chunk_size, received: 0 };
+        setUpload(started);
+        return started;
+    };
 
     const handleSubmit = async (e) => {
         e.preventDefault();
         if (!file) return;
 
         setUploading(true);
-        const formData = new FormData();
-        formData.append('file', file);
+        setSubmitStatus(null);
 
         try {
-            await api.post(`/campaigns/application/${applicationId}/deliverable/`, formData, {
-                headers: {
-                    'Content-Type': 'multipart/form-data',
-                },
-            });
+            const current = await startUpload();
+            let offset = current.received;
+            while (offset < file.size) {
+                const chunk = file.slice(offset, offset + current.chunkSize);
+                const res = await api.put(`/campaigns/deliverable/uploads/${current.id}/`, chunk, {
+                    headers: {
+                        'Content-Type': 'application/octet-stream',
+                        'Upload-Offset': offset,
+                    },
+                });
+                offset = res.data.received_bytes;
+                setProgress(Math.round((offset / file.size) * 100));
+            }
+            await api.post(`/campaigns/deliverable/uploads/${current.id}/finalize/`);
             setSubmitStatus('success');
             setTimeout(() => {
                 navigate('/student/dashboard');
@@ -99,7 +125,7 @@ const SubmitDeliverable = () => {
                                 : 'bg-gray-800 text-gray-500 cursor-not-allowed'
                                 }`}
                         >
-                            {uploading ? 'Transmitting...' : 'Confirm Upload'}
+                            {uploading ? `Transmitting... ${progress}%` : (upload && progress > 0 ? 'Resume Upload' : 'Confirm Upload')}
                         </button>
                     </form>
                 )}
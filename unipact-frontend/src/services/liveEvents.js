@@ -0,0 +1,32 @@
+import api from '../api/client';
+
+// Live status changes for the signed-in user (server-sent events).
+// Events are small deltas such as
+//   { type: 'application.status', campaign_id, application_id, status }
+// 'resync' means some events were dropped and the page should re-fetch.
+const EVENT_TYPES = ['campaign.status', 'application.status', 'resync'];
+
+const liveEvents = {
+  subscribe: (onEvent) => {
+    // The access token cookie authenticates the stream
+    const source = new EventSource(`${api.defaults.baseURL}/campaigns/events/`, { withCredentials: true });
+
+    EVENT_TYPES.forEach((type) => {
+      source.addEventListener(type, (message) => {
+        try {
+          onEvent(JSON.parse(message.data));
+        } catch (error) {
+          console.error("Bad live event", error);
+        }
+      });
+    });
+
+    return {
+      // Without a live stream (e.g. a WSGI dev server) callers fall back to re-fetching
+      isLive: () => source.readyState === EventSource.OPEN,
+      close: () => source.close(),
+    };
+  },
+};
+
+export default liveEvents;